@@ -1,10 +1,78 @@
+"""Readers for recorded collector / scorer outputs.
+
+Recorded artifacts are `{..., "items": [...]}` payloads, bare JSON lists or
+JSON Lines. `iter_items` streams the items one at a time: it decodes each
+element of the items array as its bytes are read, so memory stays at one
+item plus one read chunk regardless of file size.
+"""
+
 from pathlib import Path
 import json
+import re
+from typing import Any, Iterator
+
+_DECODER = json.JSONDecoder()
+_ITEMS_KEY = re.compile(r'"items"\s*:\s*\[')
+_CHUNK = 1 << 16
+
+
+def iter_items(path: str | Path, *, chunk_size: int = _CHUNK) -> Iterator[Any]:
+    path = Path(path)
+    with path.open(encoding="utf-8") as fh:
+        if path.suffix == ".jsonl":
+            for line in fh:
+                if line.strip().startswith("{"):
+                    yield json.loads(line)
+            return
+
+        buf = ""
+        eof = False
+
+        def more() -> bool:
+            nonlocal buf, eof
+            chunk = fh.read(chunk_size)
+            eof = not chunk
+            buf += chunk
+            return not eof
+
+        # Find the start of the array: the top level itself, or the "items" value.
+        pos = -1
+        while pos < 0:
+            stripped = buf.lstrip()
+            if stripped.startswith("["):
+                pos = len(buf) - len(stripped) + 1
+                break
+            m = _ITEMS_KEY.search(buf)
+            if m:
+                pos = m.end()
+                break
+            if not more():
+                raise ValueError(f"{path}: payload missing items list")
+
+        while True:
+            # Skip separators, pulling in more text whenever the buffer runs dry.
+            while True:
+                while pos < len(buf) and buf[pos] in " \t\r\n,":
+                    pos += 1
+                if pos < len(buf) or not more():
+                    break
+            if pos >= len(buf):
+                raise ValueError(f"{path}: truncated items list")
+            if buf[pos] == "]":
+                return
+            try:
+                item, end = _DECODER.raw_decode(buf, pos)
+            except json.JSONDecodeError:
+                if not more():
+                    raise
+                continue
+            yield item
+            buf, pos = buf[end:], 0
 
 
 def load_collector_output(path: str) -> list[dict]:
-    return json.loads(Path(path).read_text(encoding="utf-8"))
+    return list(iter_items(path))
 
 
 def load_scorer_output(path: str) -> list[dict]:
-    return json.loads(Path(path).read_text(encoding="utf-8"))
+    return list(iter_items(path))
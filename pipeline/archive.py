@@ -0,0 +1,268 @@
+"""Consolidated archive of published days under `output/archive/`.
+
+    items.jsonl     one compact line per day: {"date", "items"}; re-published days are appended
+    index.sqlite3   days(run_date -> offset, length, count, signature),
+                    topics(run_date, topic -> count), ids(arxiv_id (no version) -> run_date)
+
+Reads go through the SQLite index and an mmap of items.jsonl. A point or range
+query looks up only the requested keys and reads only the requested lines, so
+its cost follows the data asked for, not the size of the archive. A write
+appends one line and replaces one day's index rows. The per-month rollup is
+an aggregate query over `days` and `topics`. The per-day
+`output/YYYY-MM-DD.json` files remain the exported views. The archive is
+derived from them and can be rebuilt with `sync` at any time. Superseded lines
+(re-runs of a day) are reclaimed by `compact`.
+
+    python -m pipeline.archive sync
+    python -m pipeline.archive range 2026-02-01 2026-02-28
+    python -m pipeline.archive get 2602.01234
+    python -m pipeline.archive months
+    python -m pipeline.archive compact
+
+Writers take an exclusive lock on `.lock`, so backfill workers can publish
+days concurrently.
+"""
+
+from __future__ import annotations
+
+import fcntl
+import json
+import mmap
+import os
+import sqlite3
+import sys
+from collections import Counter
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Optional
+
+from .published_index import file_signature
+from .score import extract_arxiv_id, normalize_arxiv_id
+
+ROOT = Path(__file__).resolve().parents[1]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS days (
+    run_date TEXT PRIMARY KEY,
+    offset INTEGER NOT NULL,
+    length INTEGER NOT NULL,
+    count INTEGER NOT NULL,
+    signature TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS topics (
+    run_date TEXT NOT NULL,
+    topic TEXT NOT NULL,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (run_date, topic)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS ids (
+    arxiv_id TEXT PRIMARY KEY,
+    run_date TEXT NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS ids_by_date ON ids (run_date);
+"""
+
+
+def _load(path: Path, default: Any) -> Any:
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return default
+
+
+class ArchiveStore:
+    def __init__(self, root: Path):
+        self.root = root
+        self.data_path = root / "items.jsonl"
+        self.index_path = root / "index.sqlite3"
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def __enter__(self) -> "ArchiveStore":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.root.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.index_path), timeout=30, check_same_thread=False)
+            self._conn.executescript(_SCHEMA)
+        return self._conn
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        self.root.mkdir(parents=True, exist_ok=True)
+        with (self.root / ".lock").open("w") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+    # ---- writes ----
+
+    def put_day(self, run_date: str, items: list[dict[str, Any]], *, signature: str = "") -> None:
+        """Append (or replace) one day's curated items."""
+        with self._locked(), self.data_path.open("ab") as fh:
+            entry = self._append(fh, run_date, items)
+            fh.flush()
+            with self.conn:
+                self._index_day(run_date, *entry, signature)
+
+    def _append(self, fh: Any, run_date: str, items: list[dict[str, Any]]) -> tuple[Any, ...]:
+        line = json.dumps({"date": run_date, "items": items}, ensure_ascii=False, separators=(",", ":"))
+        data = line.encode("utf-8")
+        offset = fh.seek(0, os.SEEK_END)
+        fh.write(data + b"\n")
+        topics = Counter(str(item.get("topic") or "") for item in items)
+        ids = sorted({normalize_arxiv_id(extract_arxiv_id(item)) for item in items} - {""})
+        return offset, len(data), len(items), topics, ids
+
+    def _index_day(
+        self, run_date: str, offset: int, length: int, count: int, topics: dict[str, int], ids: list[str], signature: str
+    ) -> None:
+        """Replace one day's index rows (the caller holds the transaction)."""
+        conn = self.conn
+        conn.execute("INSERT OR REPLACE INTO days VALUES (?, ?, ?, ?, ?)", (run_date, offset, length, count, signature))
+        conn.execute("DELETE FROM topics WHERE run_date = ?", (run_date,))
+        conn.executemany("INSERT INTO topics VALUES (?, ?, ?)", [(run_date, t, n) for t, n in topics.items()])
+        conn.execute("DELETE FROM ids WHERE run_date = ?", (run_date,))
+        conn.executemany("INSERT OR REPLACE INTO ids VALUES (?, ?)", [(x, run_date) for x in ids])
+
+    def sync(self, output_dir: Path) -> int:
+        """Import days whose `output/YYYY-MM-DD.json` is new or changed; return how many."""
+        updated = 0
+        with self._locked(), self.data_path.open("ab") as fh:
+            known = dict(self.conn.execute("SELECT run_date, signature FROM days"))
+            for path in sorted(output_dir.glob("????-??-??.json")):
+                signature = file_signature(path)
+                if known.get(path.stem) == signature:
+                    continue
+                payload = _load(path, None)
+                if payload is None:
+                    continue
+                items = payload.get("items") if isinstance(payload, dict) else payload
+                entry = self._append(fh, path.stem, [x for x in items or [] if isinstance(x, dict)])
+                fh.flush()
+                with self.conn:
+                    self._index_day(path.stem, *entry, signature)
+                updated += 1
+        return updated
+
+    def compact(self) -> int:
+        """Rewrite items.jsonl with only live lines, in date order; return bytes reclaimed."""
+        with self._locked():
+            if not self.data_path.exists():
+                return 0
+            before = self.data_path.stat().st_size
+            tmp = self.data_path.with_name(self.data_path.name + ".tmp")
+            moved = []
+            with self.data_path.open("rb") as src, tmp.open("wb") as dst:
+                for run_date, offset, length in self.conn.execute(
+                    "SELECT run_date, offset, length FROM days ORDER BY run_date"
+                ).fetchall():
+                    src.seek(offset)
+                    moved.append((dst.tell(), run_date))
+                    dst.write(src.read(length + 1))
+            with self.conn:
+                self.conn.executemany("UPDATE days SET offset = ? WHERE run_date = ?", moved)
+                os.replace(tmp, self.data_path)
+            return before - self.data_path.stat().st_size
+
+    # ---- reads ----
+
+    def dates(self) -> list[str]:
+        return [row[0] for row in self.conn.execute("SELECT run_date FROM days ORDER BY run_date")]
+
+    def months(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        for month, days, items in self.conn.execute(
+            "SELECT substr(run_date, 1, 7) AS month, COUNT(*), SUM(count) FROM days GROUP BY month ORDER BY month"
+        ):
+            out[month] = {"days": days, "items": items, "topics": {}}
+        for month, topic, count in self.conn.execute(
+            "SELECT substr(run_date, 1, 7) AS month, topic, SUM(count) FROM topics GROUP BY month, topic"
+        ):
+            if month in out:
+                out[month]["topics"][topic] = count
+        return out
+
+    @contextmanager
+    def _mapped(self) -> Iterator[Optional[mmap.mmap]]:
+        if not self.data_path.exists() or self.data_path.stat().st_size == 0:
+            yield None
+            return
+        with self.data_path.open("rb") as fh, mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+            yield buf
+
+    def _lines(self, rows: list[tuple[str, int, int]]) -> Iterator[tuple[str, list[dict[str, Any]]]]:
+        if not rows:
+            return
+        with self._mapped() as buf:
+            if buf is None:
+                return
+            for run_date, offset, length in rows:
+                yield run_date, json.loads(buf[offset : offset + length])["items"]
+
+    def day(self, run_date: str) -> Optional[list[dict[str, Any]]]:
+        rows = self.conn.execute("SELECT run_date, offset, length FROM days WHERE run_date = ?", (run_date,)).fetchall()
+        for _, items in self._lines(rows):
+            return items
+        return None
+
+    def range(self, start: str, end: str) -> Iterator[tuple[str, list[dict[str, Any]]]]:
+        """(date, items) for every archived day in [start, end], in date order."""
+        rows = self.conn.execute(
+            "SELECT run_date, offset, length FROM days WHERE run_date BETWEEN ? AND ? ORDER BY run_date", (start, end)
+        ).fetchall()
+        yield from self._lines(rows)
+
+    def get(self, arxiv_id: str) -> Optional[dict[str, Any]]:
+        """Latest published entry for a paper (any version), with its `date`."""
+        key = normalize_arxiv_id(arxiv_id)
+        row = self.conn.execute("SELECT run_date FROM ids WHERE arxiv_id = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        for item in self.day(row[0]) or []:
+            if normalize_arxiv_id(extract_arxiv_id(item)) == key:
+                return {"date": row[0], **item}
+        return None
+
+
+def _print(rows: Iterable[Any]) -> None:
+    for row in rows:
+        print(json.dumps(row, ensure_ascii=False))
+
+
+def main(argv: list[str]) -> int:
+    with ArchiveStore(ROOT / "output" / "archive") as store:
+        return _run(store, argv)
+
+
+def _run(store: ArchiveStore, argv: list[str]) -> int:
+    cmd, args = (argv[0], argv[1:]) if argv else ("sync", [])
+    if cmd == "sync":
+        print(f"[daily-paper] archive: synced {store.sync(ROOT / 'output')} day(s)")
+    elif cmd == "range" and len(args) == 2:
+        _print({"date": d, "items": items} for d, items in store.range(args[0], args[1]))
+    elif cmd == "get" and len(args) == 1:
+        _print([store.get(args[0])])
+    elif cmd == "months":
+        _print([store.months()])
+    elif cmd == "compact":
+        print(f"[daily-paper] archive: reclaimed {store.compact()} bytes")
+    else:
+        print(__doc__, file=sys.stderr)
+        return 2
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
@@ -0,0 +1,49 @@
+"""Crash-safe file writes: temp file in the same directory, fsync, rename.
+
+Readers (the site generator, publish scripts, a resumed run) see either the
+old file or the complete new one, never a truncated write.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import IO, Any, Iterator
+
+
+@contextmanager
+def atomic_open(path: Path, mode: str = "w") -> Iterator[IO[Any]]:
+    """Stream into a temp file that replaces `path` only if the block completes.
+
+    `mode` is "w" (UTF-8 text, "\n" newlines) or "wb".
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=str(path.parent), prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        kwargs = {} if "b" in mode else {"encoding": "utf-8", "newline": "\n"}
+        with os.fdopen(fd, mode, **kwargs) as fh:
+            yield fh
+            fh.flush()
+            os.fsync(fh.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+def atomic_write_bytes(path: Path, data: bytes) -> None:
+    with atomic_open(path, "wb") as fh:
+        fh.write(data)
+
+
+def atomic_write_text(path: Path, text: str) -> None:
+    atomic_write_bytes(path, text.encode("utf-8"))
+
+
+def atomic_write_json(path: Path, payload: Any, *, indent: int | None = 2) -> None:
+    separators = None if indent is not None else (",", ":")
+    text = json.dumps(payload, ensure_ascii=False, indent=indent, separators=separators, sort_keys=indent is None)
+    atomic_write_text(path, text + ("\n" if indent is not None else ""))
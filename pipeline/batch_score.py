@@ -0,0 +1,91 @@
+"""Batched first-round scoring: pack N papers into one LLM request.
+
+Round 1 only needs an integer 0-100 per paper, so a single prompt can carry a
+whole batch. The model is asked to answer one `<index>: <score>` line per paper;
+anything it drops or garbles comes back as `None` and is re-scored one by one
+by the caller.
+
+Batching needs a raw text-completion entry point: a callable taking one prompt
+string and returning the reply text. It is configured explicitly (the
+processor method named by DAILY_PAPER_ROUND1_BATCH_METHOD, or `complete=` on
+`score_items`); without one, round 1 keeps single-item scoring.
+
+The batch prompt differs from `score_article_first_round`'s, so batch-mode
+scores are cached under their own round (`ROUND1_BATCH`) and never answer a
+single-prompt lookup, or vice versa. Single-call fallbacks made in batch mode
+are cached there too, so an unchanged re-run makes no calls.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from typing import Any, Callable, Optional
+
+# Score-cache round for scores produced by the batch prompt.
+ROUND1_BATCH = "round1_batch"
+
+_LINE_RE = re.compile(r"^\s*\[?(\d+)\]?\s*[:.)=-]\s*(\d{1,3})\b")
+
+_INSTRUCTIONS = """You are screening arXiv papers for a daily digest.
+Rate each paper's relevance and quality from 0 to 100.
+Answer with exactly one line per paper, in the form `<index>: <score>`, and nothing else.
+"""
+
+
+def resolve_completion(processor: Any, method: str) -> Optional[Callable[[str], Any]]:
+    """The processor's `method` (prompt -> text), or None when no method is configured."""
+    if not method:
+        return None
+    fn = getattr(processor, method, None)
+    if not callable(fn):
+        raise ValueError(f"processor has no completion method {method!r} (DAILY_PAPER_ROUND1_BATCH_METHOD)")
+    return fn
+
+
+def build_batch_prompt(papers: list[tuple[str, str]]) -> str:
+    lines = [_INSTRUCTIONS]
+    for i, (title, abstract) in enumerate(papers, start=1):
+        lines.append(f"[{i}] Title: {title}")
+        lines.append(f"Abstract: {abstract}")
+        lines.append("")
+    return "\n".join(lines)
+
+
+def parse_batch_scores(text: Any, n: int) -> list[Optional[int]]:
+    """Parse `n` scores from a batched reply; unparseable slots are `None`."""
+    scores: list[Optional[int]] = [None] * n
+    raw = str(text or "").strip()
+
+    try:
+        data = json.loads(raw)
+    except ValueError:
+        data = None
+    if isinstance(data, dict):
+        data = data.get("scores", data)
+    if isinstance(data, list) and len(data) == n:
+        for i, val in enumerate(data):
+            scores[i] = _as_score(val)
+        return scores
+    if isinstance(data, dict):
+        for key, val in data.items():
+            if str(key).isdigit() and 1 <= int(key) <= n:
+                scores[int(key) - 1] = _as_score(val)
+        return scores
+
+    for line in raw.splitlines():
+        m = _LINE_RE.match(line)
+        if not m:
+            continue
+        idx = int(m.group(1))
+        if 1 <= idx <= n and scores[idx - 1] is None:
+            scores[idx - 1] = _as_score(m.group(2))
+    return scores
+
+
+def _as_score(val: Any) -> Optional[int]:
+    try:
+        score = int(val)
+    except (TypeError, ValueError):
+        return None
+    return score if 0 <= score <= 100 else None
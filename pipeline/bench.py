@@ -0,0 +1,250 @@
+"""Offline pipeline benchmark with a stub ContentProcessor and synthetic arXiv data.
+
+Runs score -> topic mapping -> curate -> JSON write over synthetic collector
+payloads shaped like `references/paper_v0.json` (normalized items with
+`includeRaw`) and reports wall time, throughput and peak traced memory per
+stage. No network, LLM, daily-report checkout or collector skill is needed.
+
+    python -m pipeline.bench                          # 30, 300, 3000 items
+    python -m pipeline.bench --sizes 300 --latency 0.05 --jitter 0.02
+    python -m pipeline.bench --write-baseline         # refresh references/bench-baseline.json
+    python -m pipeline.bench --baseline references/bench-baseline.json
+
+Stub latency is deterministic per paper (seeded from the title), so two runs
+with the same flags issue the same sleeps and scores.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import random
+import re
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Callable
+
+from .curate import Curator
+from .metrics import RunMetrics
+from .run_daily import write_json
+from .models import PaperItem
+from .score import ScoreSettings, score_items
+from .score_cache import ScoreCache
+from .topic_mapper import default_classifier
+
+ROOT = Path(__file__).resolve().parents[1]
+DEFAULT_SIZES = (30, 300, 3000)
+BASELINE_PATH = ROOT / "references" / "bench-baseline.json"
+
+_WORDS = (
+    "llm inference agent reasoning retrieval graph sparse attention transformer kernel compiler chiplet "
+    "accelerator benchmark alignment privacy federated diffusion multimodal speech code security scheduling "
+    "distributed training quantization memory cache serving robustness evaluation planning tool"
+).split()
+
+
+def _seed(text: str) -> int:
+    return int(hashlib.sha256(text.encode("utf-8")).hexdigest()[:8], 16)
+
+
+class StubProcessor:
+    """Deterministic stand-in for daily-report's ContentProcessor."""
+
+    def __init__(self, latency: float = 0.0, jitter: float = 0.0):
+        self.latency = latency
+        self.jitter = jitter
+
+    def _sleep(self, key: str) -> None:
+        if self.latency <= 0 and self.jitter <= 0:
+            return
+        rng = random.Random(_seed(key))
+        time.sleep(max(0.0, self.latency + rng.uniform(-self.jitter, self.jitter)))
+
+    def score_article_first_round(self, title: str, abstract: str, source: str) -> int:
+        self._sleep("r1:" + title)
+        return _seed(title) % 101
+
+    def score_article(self, title: str, abstract: str, source: str) -> dict[str, Any]:
+        self._sleep("r2:" + title)
+        score = 60 + _seed("r2" + title) % 41
+        return {"score": score, "summary_zh": f"**要点**: {title[:80]}\n合成摘要，用于离线基准测试。"}
+
+    def complete(self, prompt: str) -> str:
+        titles = re.findall(r"^\[(\d+)\] Title: (.*)$", prompt, flags=re.M)
+        self._sleep("batch:" + "|".join(t for _, t in titles))
+        return "\n".join(f"{i}: {_seed(t) % 101}" for i, t in titles)
+
+
+def stub_smooth_score(first: int, second: int) -> int:
+    return round(0.3 * first + 0.7 * second)
+
+
+def synthetic_items(n: int, *, run_date: str = "2026-03-01", seed: int = 0) -> list[dict[str, Any]]:
+    """Collector-shaped items (paper_v0 normalize + includeRaw)."""
+    spec = json.loads((ROOT / "references" / "paper_v0.json").read_text(encoding="utf-8"))
+    categories = spec["arxiv"]["search"]["categories"] + ["cs.AR", "cs.CV", "cs.MA"]
+    rng = random.Random(seed)
+    published = datetime.fromisoformat(run_date).replace(tzinfo=timezone.utc)
+    yymm = date.fromisoformat(run_date).strftime("%y%m")
+    items = []
+    for i in range(n):
+        arxiv_id = f"{yymm}.{10000 + i:05d}v1"
+        title = " ".join(rng.choice(_WORDS) for _ in range(rng.randint(6, 12))).capitalize()
+        abstract = " ".join(rng.choice(_WORDS) for _ in range(rng.randint(120, 260))) + "."
+        cats = rng.sample(categories, k=rng.randint(1, 3))
+        ts = (published - timedelta(minutes=i)).isoformat()
+        items.append(
+            {
+                "id": spec["normalize"]["idTemplate"].format(arxivId=arxiv_id),
+                "url": spec["normalize"]["urlTemplate"].format(arxivId=arxiv_id),
+                "title": title,
+                "abstract": abstract,
+                "categories": cats,
+                "authors": [f"Author {rng.randint(1, 999)}" for _ in range(rng.randint(1, 6))],
+                "source": spec["source"],
+                "publishedAt": ts,
+                "publishedDate": run_date,
+                "raw": {"id": f"http://arxiv.org/abs/{arxiv_id}", "summary": abstract, "category": cats},
+            }
+        )
+    return items
+
+
+def _measure(fn: Callable[[], Any], n: int) -> tuple[Any, dict[str, Any]]:
+    tracemalloc.reset_peak()
+    base = tracemalloc.get_traced_memory()[0]
+    t0 = time.perf_counter()
+    result = fn()
+    seconds = time.perf_counter() - t0
+    peak = tracemalloc.get_traced_memory()[1] - base
+    return result, {
+        "seconds": round(seconds, 4),
+        "items_per_second": round(n / seconds, 1) if seconds > 0 else None,
+        "peak_mib": round(max(0, peak) / (1 << 20), 3),
+    }
+
+
+def run_benchmark(
+    size: int,
+    *,
+    latency: float = 0.0,
+    jitter: float = 0.0,
+    concurrency: int = 4,
+    batch_size: int = 1,
+    topk: int = 10,
+) -> dict[str, Any]:
+    items = synthetic_items(size)
+    settings = ScoreSettings(
+        max_items=size,
+        topk=topk,
+        concurrency=concurrency,
+        round1_batch_size=batch_size,
+        round1_batch_method="complete",
+    )
+    backend = (StubProcessor(latency, jitter), stub_smooth_score)
+    metrics = RunMetrics()
+
+    started = not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start()
+    try:
+        stages: dict[str, Any] = {}
+        scored, stages["score"] = _measure(
+            lambda: score_items(items, cache=ScoreCache(None), backend=backend, settings=settings, metrics=metrics),
+            size,
+        )
+
+        def topics() -> list[PaperItem]:
+            for item, topic in zip(scored, default_classifier().classify_many(scored)):
+                item["topic"] = item.get("topic") or topic
+            return scored
+
+        _, stages["topic"] = _measure(topics, size)
+        curator = Curator.from_config({})
+        (kept, _), stages["curate"] = _measure(lambda: curator.curate(scored), size)
+        with tempfile.TemporaryDirectory() as tmp:
+            out = Path(tmp) / "bench.json"
+            _, stages["write"] = _measure(lambda: write_json(out, {"date": "bench", "items": kept}), size)
+    finally:
+        if started:
+            tracemalloc.stop()
+
+    llm = metrics.to_dict()["llm"]
+    return {"size": size, "kept": len(kept), "stages": stages, "llm": llm}
+
+
+def compare(report: dict[str, Any], baseline: dict[str, Any]) -> list[str]:
+    """Human-readable per-stage time ratios (current / baseline)."""
+    lines = []
+    base_runs = {str(r["size"]): r for r in baseline.get("runs", [])}
+    for run in report["runs"]:
+        base = base_runs.get(str(run["size"]))
+        if not base:
+            continue
+        for stage, entry in run["stages"].items():
+            before = (base["stages"].get(stage) or {}).get("seconds")
+            if before:
+                ratio = entry["seconds"] / before
+                lines.append(f"size={run['size']:>5} {stage:<7} {entry['seconds']:.4f}s vs {before:.4f}s (x{ratio:.2f})")
+    return lines
+
+
+def main(argv: list[str]) -> int:
+    sizes = list(DEFAULT_SIZES)
+    latency, jitter, concurrency, batch_size = 0.01, 0.005, 4, 1
+    out_path: Path | None = None
+    baseline_path: Path | None = None
+    write_baseline = False
+
+    i = 0
+    while i < len(argv):
+        token = argv[i]
+        if token == "--sizes":
+            sizes = [int(x) for x in argv[i + 1].split(",") if x]
+        elif token == "--latency":
+            latency = float(argv[i + 1])
+        elif token == "--jitter":
+            jitter = float(argv[i + 1])
+        elif token == "--concurrency":
+            concurrency = int(argv[i + 1])
+        elif token == "--batch-size":
+            batch_size = int(argv[i + 1])
+        elif token == "--out":
+            out_path = Path(argv[i + 1])
+        elif token == "--baseline":
+            baseline_path = Path(argv[i + 1])
+        elif token == "--write-baseline":
+            write_baseline = True
+            i += 1
+            continue
+        else:
+            i += 1
+            continue
+        i += 2
+
+    params = {"latency": latency, "jitter": jitter, "concurrency": concurrency, "batch_size": batch_size}
+    runs = []
+    for size in sizes:
+        run = run_benchmark(size, **params)
+        runs.append(run)
+        stage_summary = "  ".join(f"{k}={v['seconds']:.3f}s/{v['peak_mib']:.1f}MiB" for k, v in run["stages"].items())
+        print(f"[bench] size={size:>5} {stage_summary}")
+    report = {"params": params, "python": sys.version.split()[0], "runs": runs}
+
+    if baseline_path and baseline_path.exists():
+        for line in compare(report, json.loads(baseline_path.read_text(encoding="utf-8"))):
+            print(f"[bench] {line}")
+    for path in [out_path, BASELINE_PATH if write_baseline else None]:
+        if path:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(json.dumps(report, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+            print(f"[bench] wrote {path}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
@@ -0,0 +1,397 @@
+"""Native arXiv collector (in-process replacement for the news-collector skill).
+
+Reads the query spec in `references/paper_v0.json` and collects one shard per
+category. Shards page concurrently on a thread pool: every shard starts with
+`prefetch` pages in flight and keeps paging while its pages come back full,
+still reach back to the run date and its item quota is not yet met. A shard
+that errors, or has a request with no response within its timeout, is dropped
+from the run (keeping the items it already returned). A request's timeout
+starts only once the rate limiter releases it, so waiting behind the shared
+RPM limit never counts against a shard. Per-shard results are reported in
+`ArxivCollector.shards`. The run raises only if every shard fails. Each worker
+thread keeps one keep-alive connection per host. Responses are parsed
+incrementally with `iterparse` while they stream in and are teed to an on-disk
+cache (`.tmp/http-cache/`). The next request for the same URL revalidates with
+If-None-Match / If-Modified-Since, and a 304 is parsed from the cache.
+
+Items have the collector's normalized shape (id, url, title, abstract,
+categories, authors, source, publishedAt, publishedDate[, raw]). Shards are
+merged round-robin, deduplicated on the normalized arXiv ID (cross-listed
+papers appear in several shards), so a busy category cannot crowd the others
+out of `max_items`. The result is sorted newest first.
+
+Env knobs:
+- DAILY_PAPER_COLLECTOR (default node; native = use this module in run_daily)
+- DAILY_PAPER_ARXIV_ENDPOINT (default: the spec's endpoint)
+- DAILY_PAPER_COLLECT_CONCURRENCY (default 4; page fetches in flight)
+- DAILY_PAPER_COLLECT_PREFETCH (default 2; pages requested ahead per category)
+- DAILY_PAPER_COLLECT_MAX_PAGES (default 10; per category)
+- DAILY_PAPER_COLLECT_SHARD_TIMEOUT (default 120; seconds a shard's request may wait for its response)
+- DAILY_PAPER_COLLECT_SHARD_QUOTA (default 0 = unlimited; run-date items per shard)
+- DAILY_PAPER_ARXIV_RPM (default 20; arXiv asks for one request every 3 seconds)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import http.client
+import json
+import os
+import re
+import threading
+import time
+import xml.etree.ElementTree as ET
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, BinaryIO, Callable, Optional
+from urllib.parse import urlencode, urljoin, urlsplit
+from zoneinfo import ZoneInfo
+
+from .atomic import atomic_write_text
+from .concurrency import RateLimiter
+from .score import normalize_arxiv_id
+
+ROOT = Path(__file__).resolve().parents[1]
+SPEC_PATH = ROOT / "references" / "paper_v0.json"
+USER_AGENT = "daily-paper/1.0 (+https://arxiv.org/help/api)"
+
+_ATOM = "{http://www.w3.org/2005/Atom}"
+_ARXIV = "{http://arxiv.org/schemas/atom}"
+_ID_RE = re.compile(r"arxiv\.org/abs/(.+)$")
+_WS_RE = re.compile(r"\s+")
+
+
+class HttpCache:
+    """Body + validators per URL, keyed by sha256(url)."""
+
+    def __init__(self, root: Optional[Path]):
+        self.root = root
+
+    def _paths(self, url: str) -> tuple[Path, Path]:
+        assert self.root is not None
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()[:32]
+        return self.root / f"{key}.json", self.root / f"{key}.body"
+
+    def validators(self, url: str) -> dict[str, str]:
+        if self.root is None:
+            return {}
+        meta_path, body_path = self._paths(url)
+        try:
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        if not body_path.exists():
+            return {}
+        headers = {}
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+        return headers
+
+    def body(self, url: str) -> BinaryIO:
+        return self._paths(url)[1].open("rb")
+
+
+class _Tee:
+    """File-like wrapper that copies everything read into `sink`."""
+
+    def __init__(self, src: Any, sink: Optional[BinaryIO]):
+        self.src = src
+        self.sink = sink
+
+    def read(self, n: int = -1) -> bytes:
+        chunk = self.src.read(n)
+        if self.sink is not None and chunk:
+            self.sink.write(chunk)
+        return chunk
+
+
+def _text(elem: Optional[ET.Element]) -> str:
+    return _WS_RE.sub(" ", elem.text or "").strip() if elem is not None else ""
+
+
+def parse_feed(stream: Any) -> list[dict[str, Any]]:
+    """Raw Atom entries, parsed element by element as bytes arrive."""
+    entries = []
+    for _, elem in ET.iterparse(stream, events=("end",)):
+        if elem.tag != _ATOM + "entry":
+            continue
+        primary = elem.find(_ARXIV + "primary_category")
+        categories = [c.get("term", "") for c in elem.findall(_ATOM + "category")]
+        if primary is not None and primary.get("term"):
+            first = primary.get("term", "")
+            categories = [first] + [c for c in categories if c != first]
+        entries.append(
+            {
+                "id": _text(elem.find(_ATOM + "id")),
+                "title": _text(elem.find(_ATOM + "title")),
+                "summary": _text(elem.find(_ATOM + "summary")),
+                "published": _text(elem.find(_ATOM + "published")),
+                "updated": _text(elem.find(_ATOM + "updated")),
+                "authors": [_text(a.find(_ATOM + "name")) for a in elem.findall(_ATOM + "author")],
+                "category": [c for c in categories if c],
+                "links": {(l.get("title") or l.get("rel") or ""): l.get("href", "") for l in elem.findall(_ATOM + "link")},
+            }
+        )
+        elem.clear()
+    return entries
+
+
+@dataclass
+class CollectorSettings:
+    endpoint: str = ""
+    concurrency: int = 4
+    prefetch: int = 2
+    max_pages: int = 10
+    rpm: float = 20.0
+    shard_timeout: float = 120.0
+    shard_quota: int = 0
+
+    @staticmethod
+    def from_env() -> "CollectorSettings":
+        return CollectorSettings(
+            endpoint=os.getenv("DAILY_PAPER_ARXIV_ENDPOINT", ""),
+            concurrency=int(os.getenv("DAILY_PAPER_COLLECT_CONCURRENCY", "4")),
+            prefetch=int(os.getenv("DAILY_PAPER_COLLECT_PREFETCH", "2")),
+            max_pages=int(os.getenv("DAILY_PAPER_COLLECT_MAX_PAGES", "10")),
+            rpm=float(os.getenv("DAILY_PAPER_ARXIV_RPM", "20")),
+            shard_timeout=float(os.getenv("DAILY_PAPER_COLLECT_SHARD_TIMEOUT", "120")),
+            shard_quota=int(os.getenv("DAILY_PAPER_COLLECT_SHARD_QUOTA", "0")),
+        )
+
+
+class ArxivCollector:
+    def __init__(
+        self,
+        spec: dict[str, Any],
+        *,
+        settings: Optional[CollectorSettings] = None,
+        cache_dir: Optional[Path] = None,
+    ):
+        self.spec = spec
+        self.settings = settings or CollectorSettings()
+        self.endpoint = self.settings.endpoint or spec["arxiv"]["endpoint"]
+        self.page_size = int(spec["arxiv"].get("page", {}).get("maxResults") or 50)
+        self.cache = HttpCache(cache_dir)
+        if cache_dir is not None:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+        self.limiter = RateLimiter(self.settings.rpm)
+        self._local = threading.local()
+        # Per-shard report of the last collect(): status (ok / failed / timeout), pages, items, seconds[, error].
+        self.shards: dict[str, dict[str, Any]] = {}
+
+    @staticmethod
+    def from_env(tmp_dir: Path, spec_path: Path = SPEC_PATH) -> "ArxivCollector":
+        spec = json.loads(spec_path.read_text(encoding="utf-8"))
+        return ArxivCollector(spec, settings=CollectorSettings.from_env(), cache_dir=tmp_dir / "http-cache")
+
+    # ---- HTTP ----
+
+    def _connection(self, scheme: str, netloc: str) -> http.client.HTTPConnection:
+        pool = getattr(self._local, "conns", None)
+        if pool is None:
+            pool = self._local.conns = {}
+        conn = pool.get((scheme, netloc))
+        if conn is None:
+            cls = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+            conn = pool[(scheme, netloc)] = cls(netloc, timeout=self.settings.shard_timeout or 60)
+        return conn
+
+    def _request(self, url: str, headers: dict[str, str]) -> http.client.HTTPResponse:
+        parts = urlsplit(url)
+        target = parts.path + ("?" + parts.query if parts.query else "")
+        for attempt in (0, 1):
+            conn = self._connection(parts.scheme, parts.netloc)
+            try:
+                conn.request("GET", target, headers=headers)
+                return conn.getresponse()
+            except (http.client.RemoteDisconnected, BrokenPipeError, ConnectionResetError):
+                # Server closed an idle keep-alive connection; reconnect once.
+                conn.close()
+                if attempt:
+                    raise
+        raise AssertionError("unreachable")
+
+    def fetch_page(self, url: str, *, on_send: Optional[Callable[[], None]] = None) -> list[dict[str, Any]]:
+        """One results page; `on_send` is called each time a request leaves the rate limiter."""
+        for _ in range(3):  # follow a few redirects (e.g. http -> https)
+            self.limiter.acquire()
+            if on_send is not None:
+                on_send()
+            headers = {"User-Agent": USER_AGENT, "Accept-Encoding": "identity", **self.cache.validators(url)}
+            resp = self._request(url, headers)
+            if resp.status in (301, 302, 303, 307, 308) and resp.getheader("Location"):
+                resp.read()
+                url = urljoin(url, resp.getheader("Location", ""))
+                continue
+            if resp.status == 304:
+                resp.read()
+                with self.cache.body(url) as fh:
+                    return parse_feed(fh)
+            if resp.status != 200:
+                body = resp.read()[:300].decode("utf-8", "replace")
+                raise RuntimeError(f"arXiv API {resp.status} for {url}: {body}")
+            return self._parse_and_store(url, resp)
+        raise RuntimeError(f"too many redirects for {url}")
+
+    def _parse_and_store(self, url: str, resp: http.client.HTTPResponse) -> list[dict[str, Any]]:
+        if self.cache.root is None:
+            entries = parse_feed(resp)
+            resp.read()
+            return entries
+        meta_path, body_path = self.cache._paths(url)
+        tmp = body_path.with_name(body_path.name + f".{threading.get_ident()}.tmp")
+        with tmp.open("wb") as sink:
+            tee = _Tee(resp, sink)
+            entries = parse_feed(tee)
+            while tee.read(1 << 16):  # drain the trailer so the connection can be reused
+                pass
+        os.replace(tmp, body_path)
+        meta = {"url": url, "etag": resp.getheader("ETag"), "last_modified": resp.getheader("Last-Modified")}
+        atomic_write_text(meta_path, json.dumps(meta))
+        return entries
+
+    # ---- query planning ----
+
+    def page_url(self, category: str, start: int) -> str:
+        arxiv = self.spec["arxiv"]
+        query = {
+            "search_query": f"cat:{category}",
+            "start": start,
+            "max_results": self.page_size,
+            "sortBy": arxiv.get("sortBy", "submittedDate"),
+            "sortOrder": arxiv.get("sortOrder", "descending"),
+        }
+        return f"{self.endpoint}?{urlencode(query)}"
+
+    def normalize(self, entry: dict[str, Any], tz: ZoneInfo) -> Optional[dict[str, Any]]:
+        m = _ID_RE.search(entry["id"])
+        if not m or not entry["title"]:
+            return None
+        arxiv_id = m.group(1)
+        norm = self.spec.get("normalize", {})
+        published = datetime.fromisoformat(entry["published"].replace("Z", "+00:00"))
+        item = {
+            "id": norm.get("idTemplate", "arxiv:{arxivId}").format(arxivId=arxiv_id),
+            "url": norm.get("urlTemplate", "https://arxiv.org/abs/{arxivId}").format(arxivId=arxiv_id),
+            "title": entry["title"],
+            "abstract": entry["summary"],
+            "categories": entry["category"],
+            "authors": entry["authors"],
+            "source": self.spec.get("source", "arxiv"),
+            "publishedAt": published.isoformat(),
+            "publishedDate": published.astimezone(tz).date().isoformat(),
+        }
+        if norm.get("includeRaw"):
+            item["raw"] = entry
+        return item
+
+    def collect(self, run_date: str, *, time_zone: str = "Asia/Shanghai", max_items: int = 0) -> list[dict[str, Any]]:
+        """Papers published on `run_date` (local date in `time_zone`) across the spec's categories."""
+        tz = ZoneInfo(time_zone)
+        categories = list(self.spec["arxiv"]["search"].get("categories") or [])
+        quota = self.settings.shard_quota
+        timeout = self.settings.shard_timeout
+        found: dict[str, dict[str, dict[str, Any]]] = {cat: {} for cat in categories}
+        pages: dict[Future[list[dict[str, Any]]], tuple[str, int]] = {}
+        next_start = {cat: 0 for cat in categories}
+        started: dict[str, float] = {}
+        sent: dict[tuple[str, int], float] = {}  # (category, start) -> when its request left the limiter
+        self.shards = {cat: {"status": "ok", "pages": 0, "items": 0, "seconds": 0.0} for cat in categories}
+        done: set[str] = set()
+
+        def fetch(cat: str, start: int, url: str) -> list[dict[str, Any]]:
+            def on_send() -> None:
+                sent[(cat, start)] = time.monotonic()
+                started.setdefault(cat, sent[(cat, start)])
+
+            return self.fetch_page(url, on_send=on_send)
+
+        def drop(cat: str, status: str, error: str = "") -> None:
+            done.add(cat)
+            self.shards[cat]["status"] = status
+            if error:
+                self.shards[cat]["error"] = error
+            for fut in [f for f, (c, _) in pages.items() if c == cat]:
+                fut.cancel()
+                del pages[fut]
+
+        pool = ThreadPoolExecutor(max_workers=max(1, self.settings.concurrency), thread_name_prefix="arxiv")
+        try:
+
+            def request_next(cat: str) -> None:
+                start = next_start[cat]
+                if cat in done or start >= self.settings.max_pages * self.page_size:
+                    return
+                next_start[cat] = start + self.page_size
+                pages[pool.submit(fetch, cat, start, self.page_url(cat, start))] = (cat, start)
+
+            for cat in categories:
+                for _ in range(max(1, self.settings.prefetch)):
+                    request_next(cat)
+
+            while pages:
+                if timeout > 0:
+                    now = time.monotonic()
+                    for cat in {c for c, st in pages.values() if (c, st) in sent and now - sent[(c, st)] >= timeout}:
+                        drop(cat, "timeout", f"no response within {timeout:g}s")
+                    if not pages:
+                        break
+                    # Requests still queued on the pool or the limiter have no clock yet: re-check at least every second.
+                    pending = [sent[k] + timeout - now for k in pages.values() if k in sent]
+                    wait_for = max(0.01, min([*pending, min(timeout, 1.0)]))
+                    finished, _ = wait(pages, timeout=wait_for, return_when=FIRST_COMPLETED)
+                else:
+                    finished, _ = wait(pages, return_when=FIRST_COMPLETED)
+                for fut in finished:
+                    if fut not in pages:  # its shard was dropped earlier in this batch
+                        continue
+                    cat, _start = pages.pop(fut)
+                    try:
+                        entries = fut.result()
+                    except Exception as e:
+                        drop(cat, "failed", str(e))
+                        continue
+                    self.shards[cat]["pages"] += 1
+                    items = [x for x in (self.normalize(e, tz) for e in entries) if x]
+                    for item in items:
+                        if item["publishedDate"] == run_date and not (quota and len(found[cat]) >= quota):
+                            found[cat].setdefault(normalize_arxiv_id(item["url"].rsplit("/", 1)[-1]), item)
+                    # Descending by submission date: stop once a page is short or older than the run date.
+                    if len(items) < self.page_size or items[-1]["publishedDate"] < run_date:
+                        done.add(cat)
+                    if quota and len(found[cat]) >= quota:
+                        drop(cat, "ok")
+                    request_next(cat)
+        finally:
+            # Don't wait on requests of timed-out shards; their sockets time out on their own.
+            pool.shutdown(wait=False, cancel_futures=True)
+
+        end = time.monotonic()
+        for cat, report in self.shards.items():
+            report["items"] = len(found[cat])
+            report["seconds"] = round(end - started.get(cat, end), 3)
+        if categories and all(r["status"] != "ok" for r in self.shards.values()):
+            errors = "; ".join(f"{cat}: {r.get('error', r['status'])}" for cat, r in self.shards.items())
+            raise RuntimeError(f"every collect shard failed ({errors})")
+
+        merged = merge_shards(
+            [sorted(found[cat].items(), key=lambda kv: kv[1]["publishedAt"], reverse=True) for cat in categories],
+            max_items,
+        )
+        return sorted(merged, key=lambda x: x["publishedAt"], reverse=True)
+
+
+def merge_shards(shards: list[list[tuple[str, dict[str, Any]]]], max_items: int = 0) -> list[dict[str, Any]]:
+    """Round-robin over per-shard (arxiv_id, item) lists, keeping each ID once, up to `max_items` (0 = all)."""
+    merged: dict[str, dict[str, Any]] = {}
+    for rank in range(max((len(s) for s in shards), default=0)):
+        for shard in shards:
+            if rank < len(shard):
+                merged.setdefault(*shard[rank])
+                if 0 < max_items <= len(merged):
+                    return list(merged.values())
+    return list(merged.values())
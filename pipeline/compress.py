@@ -0,0 +1,149 @@
+"""Extractive abstract compression for LLM prompts.
+
+Instead of a blunt character cut, `Compressor.compress` keeps the most
+informative sentences of an abstract that fit a token budget (estimated like
+`round2_scheduler.estimate_tokens`) and emits them in their original order.
+A sentence scores
+
+- TITLE_WEIGHT per distinct title term it contains,
+- KEYWORD_WEIGHT per distinct `keyword_hints` entry of config/topics.yaml,
+- LEAD_BONUS for the first sentence (it usually states the problem) and
+  RESULT_BONUS for a sentence with a number (it usually states the result),
+
+divided by the square root of its word count, so long sentences do not win on
+length alone. Ties go to the earlier sentence. Abstracts already within budget
+are returned unchanged.
+
+Compression is deterministic, so the score cache still hits on re-runs.
+Results are memoized per (arxiv_id, budget) for the life of the compressor and
+recomputed if the abstract text changes.
+"""
+
+from __future__ import annotations
+
+import math
+import re
+import threading
+from pathlib import Path
+from typing import Any, Iterable, Optional
+
+import yaml
+
+from .round2_scheduler import estimate_tokens
+from .topic_mapper import TOPICS_PATH, _trie_pattern
+
+TITLE_WEIGHT = 1.0
+KEYWORD_WEIGHT = 1.0
+LEAD_BONUS = 0.5
+RESULT_BONUS = 0.5
+
+# Split after ., ! or ? when the next sentence starts upper-case, a digit or a bracket ("e.g. the" stays whole).
+_SENTENCE_RE = re.compile(r"(?<=[.!?])\s+(?=[A-Z0-9(\[])")
+_WORD_RE = re.compile(r"[a-z0-9][a-z0-9\-]+")
+_NUMBER_RE = re.compile(r"\d")
+_STOPWORDS = frozenset(
+    "the and for with from that this these those into onto over under via using use based towards toward "
+    "are was were been being has have had its our their can will not but all any each more most such than "
+    "then also which while where when what how new".split()
+)
+
+
+def split_sentences(text: str) -> list[str]:
+    return [s.strip() for s in _SENTENCE_RE.split(text.strip()) if s.strip()]
+
+
+def _terms(text: str) -> set[str]:
+    return {w for w in _WORD_RE.findall(text.lower()) if len(w) >= 3 and w not in _STOPWORDS}
+
+
+class Compressor:
+    def __init__(self, keywords: Iterable[str] = ()):
+        words = sorted({str(k).lower() for k in keywords if str(k).strip()})
+        self._matcher = re.compile(r"\b" + _trie_pattern(words)) if words else None
+        self._memo: dict[tuple[str, int], tuple[str, str, str]] = {}
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.memo_hits = 0
+        self.compressed = 0
+        self.tokens_in = 0
+        self.tokens_out = 0
+
+    @classmethod
+    def from_config(cls, topics_cfg: dict[str, Any]) -> "Compressor":
+        return cls(hint for topic in topics_cfg.get("topics") or [] for hint in topic.get("keyword_hints") or [])
+
+    @classmethod
+    def from_file(cls, path: Path = TOPICS_PATH) -> "Compressor":
+        return cls.from_config(yaml.safe_load(path.read_text(encoding="utf-8")) or {})
+
+    def score(self, sentence: str, position: int, title_terms: set[str]) -> float:
+        words = _WORD_RE.findall(sentence.lower())
+        if not words:
+            return 0.0
+        raw = TITLE_WEIGHT * len(title_terms & set(words))
+        if self._matcher is not None:
+            raw += KEYWORD_WEIGHT * len(set(self._matcher.findall(sentence.lower())))
+        if position == 0:
+            raw += LEAD_BONUS
+        if _NUMBER_RE.search(sentence):
+            raw += RESULT_BONUS
+        return raw / math.sqrt(len(words))
+
+    def select(self, title: str, abstract: str, budget: int) -> str:
+        """Highest-scoring sentences that fit `budget` tokens, in original order."""
+        if estimate_tokens(abstract) <= budget:
+            return abstract
+        sentences = split_sentences(abstract)
+        title_terms = _terms(title)
+        ranked = sorted(range(len(sentences)), key=lambda i: (-self.score(sentences[i], i, title_terms), i))
+        chosen: list[int] = []
+        used = 0
+        for i in ranked:
+            cost = estimate_tokens(sentences[i] + " ")
+            if used + cost <= budget:
+                chosen.append(i)
+                used += cost
+        if not chosen:
+            # A single run-on sentence longer than the budget: cut the best one (~4 bytes per token).
+            return sentences[ranked[0]][: budget * 4].rstrip() if sentences else ""
+        return " ".join(sentences[i] for i in sorted(chosen))
+
+    def compress(self, arxiv_id: str, title: str, abstract: str, budget: int) -> str:
+        if budget <= 0 or not abstract:
+            return abstract
+        key = (arxiv_id, budget)
+        with self._lock:
+            self.calls += 1
+            memo = self._memo.get(key) if arxiv_id else None
+            if memo is not None and memo[0] == title and memo[1] == abstract:
+                self.memo_hits += 1
+                return memo[2]
+        text = self.select(title, abstract, budget)
+        with self._lock:
+            if arxiv_id:
+                self._memo[key] = (title, abstract, text)
+            if text != abstract:
+                self.compressed += 1
+            self.tokens_in += estimate_tokens(abstract)
+            self.tokens_out += estimate_tokens(text)
+        return text
+
+    def summary(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "calls": self.calls,
+                "memo_hits": self.memo_hits,
+                "compressed": self.compressed,
+                "tokens_in": self.tokens_in,
+                "tokens_out": self.tokens_out,
+            }
+
+
+_default: Optional[Compressor] = None
+
+
+def default_compressor() -> Compressor:
+    global _default
+    if _default is None:
+        _default = Compressor.from_file()
+    return _default
@@ -1,49 +1,145 @@
 """Curation utilities for daily-paper.
 
 Normalize scored items into the compact schema used by the site generator.
+
+`Curator` is compiled once from `quality_gates` in config/pipeline.yaml and
+curates a whole scored batch in one pass:
+
+- missing_arxiv_id: no arXiv ID (URLs and cross-day dedupe depend on it)
+- missing_translation: no zh summary / reasoning
+- translation_too_long: summary longer than `max_translated_chars`
+- missing_pdf_url: `require_pdf_url` is set, the item has no `pdf_url` and its ID
+  is not an arXiv identifier to derive one from
+- missing_score: no score, second_score or first_score
+- invalid_score: a score that is not a number
+- below_threshold: score below DAILY_PAPER_SCORE_THRESHOLD
 """
 
 from __future__ import annotations
 
 import os
-from typing import Any, Optional
-
-
-def normalize_entry(item: dict[str, Any]) -> Optional[dict[str, Any]]:
-    title = str(item.get("title") or "").strip()
-    if not title:
-        return None
-
-    arxiv_id = str(item.get("arxiv_id") or "").strip()
-    if not arxiv_id:
-        return None
-
-    translated = (item.get("translated_zh") or item.get("reasoning") or "").strip()
-    if not translated:
-        return None
-
-    # Keep Markdown formatting for web rendering; cap length to avoid overly long cards.
-    if len(translated) > 900:
-        translated = translated[:897] + "..."
-
-    score = int(item.get("score") or item.get("second_score") or item.get("first_score") or 0)
-
-    # Final filter threshold: user-facing selection (default 85).
-    score_threshold = int(os.getenv("DAILY_PAPER_SCORE_THRESHOLD", "85"))
-    if score < score_threshold:
-        return None
-
-    out = {
-        "title": title,
-        "topic": str(item.get("topic") or "").strip() or "未分类",
-        "score": score,
-        "translated_zh": translated,
-        "arxiv_id": arxiv_id,
-        "abs_url": item.get("abs_url") or f"https://arxiv.org/abs/{arxiv_id}",
-        "pdf_url": item.get("pdf_url") or f"https://arxiv.org/pdf/{arxiv_id}.pdf",
-        # For debugging / UX: show published date (normalized by collector timezone).
-        "published_at": item.get("publishedAt") or item.get("published_at"),
-        "published_date": item.get("publishedDate") or item.get("published_date"),
-    }
-
-    return out
+import re
+from collections import Counter
+from pathlib import Path
+from typing import Any, Iterable, NamedTuple, Optional
+
+import yaml
+
+PIPELINE_CONFIG = Path(__file__).resolve().parents[1] / "config" / "pipeline.yaml"
+
+# New-style (2502.01234v2) and old-style (hep-th/9901001) arXiv identifiers.
+ARXIV_ID_RE = re.compile(r"(?:\d{4}\.\d{4,5}|[a-z-]+(?:\.[A-Z]{2})?/\d{7})(?:v\d+)?")
+
+
+class CurateResult(NamedTuple):
+    kept: list[dict[str, Any]]
+    rejections: Counter[str]
+
+
+class Curator:
+    def __init__(self, *, threshold: int = 85, max_translated_chars: int = 300, require_pdf_url: bool = True):
+        self.threshold = threshold
+        self.max_translated_chars = max_translated_chars
+        self.require_pdf_url = require_pdf_url
+
+    @classmethod
+    def from_config(cls, pipeline_cfg: dict[str, Any], *, threshold: Optional[int] = None) -> "Curator":
+        gates = pipeline_cfg.get("quality_gates") or {}
+        if threshold is None:
+            threshold = int(os.getenv("DAILY_PAPER_SCORE_THRESHOLD", "85"))
+        return cls(
+            threshold=threshold,
+            max_translated_chars=int(gates.get("max_translated_chars") or 300),
+            require_pdf_url=bool(gates.get("require_pdf_url", True)),
+        )
+
+    def check(self, item: Any, *, topic: str = "") -> tuple[Optional[dict[str, Any]], str]:
+        """Normalized entry, or None plus the gate that rejected it.
+
+        `item` is a dict or a `models.PaperItem`; `topic` is used when it has none.
+        """
+        arxiv_id = str(item.get("arxiv_id") or "").strip()
+        if not arxiv_id:
+            return None, "missing_arxiv_id"
+
+        # Keep Markdown formatting for web rendering.
+        translated = str(item.get("translated_zh") or item.get("reasoning") or "").strip()
+        if not translated:
+            return None, "missing_translation"
+        if len(translated) > self.max_translated_chars:
+            return None, "translation_too_long"
+
+        pdf_url = item.get("pdf_url") or ""
+        if not pdf_url and ARXIV_ID_RE.fullmatch(arxiv_id):
+            pdf_url = f"https://arxiv.org/pdf/{arxiv_id}.pdf"
+        if self.require_pdf_url and not pdf_url:
+            return None, "missing_pdf_url"
+
+        raw_score = next((item.get(k) for k in ("score", "second_score", "first_score") if item.get(k) is not None), None)
+        if raw_score is None:
+            return None, "missing_score"
+        try:
+            score = int(raw_score)
+        except (TypeError, ValueError):
+            return None, "invalid_score"
+        # Final filter threshold: user-facing selection (default 85).
+        if score < self.threshold:
+            return None, "below_threshold"
+
+        out = {
+            "title": str(item.get("title") or "").strip(),
+            "topic": str(item.get("topic") or topic or "").strip() or "未分类",
+            "score": score,
+            "translated_zh": translated,
+            "arxiv_id": arxiv_id,
+            "abs_url": item.get("abs_url") or f"https://arxiv.org/abs/{arxiv_id}",
+            "pdf_url": pdf_url,
+            # For debugging / UX: show published date (normalized by collector timezone).
+            "published_at": item.get("publishedAt") or item.get("published_at"),
+            "published_date": item.get("publishedDate") or item.get("published_date"),
+        }
+        return out, ""
+
+    def curate(self, items: Iterable[Any], topics: Optional[Iterable[str]] = None) -> CurateResult:
+        """Check a batch; `topics` (parallel to `items`) fills in items without a topic."""
+        kept: list[dict[str, Any]] = []
+        rejections: Counter[str] = Counter()
+        topic_iter = iter(topics) if topics is not None else None
+        for item in items:
+            topic = next(topic_iter, "") if topic_iter is not None else ""
+            out, reason = self.check(item, topic=topic)
+            if out is None:
+                rejections[reason] += 1
+            else:
+                kept.append(out)
+        return CurateResult(kept, rejections)
+
+
+_default: Optional[Curator] = None
+
+
+def default_curator() -> Curator:
+    global _default
+    if _default is None:
+        cfg = yaml.safe_load(PIPELINE_CONFIG.read_text(encoding="utf-8")) if PIPELINE_CONFIG.exists() else None
+        _default = Curator.from_config(cfg or {})
+    return _default
+
+
+def normalize_entry(item: dict[str, Any], *, threshold: Optional[int] = None) -> Optional[dict[str, Any]]:
+    return check_entry(item, threshold=threshold)[0]
+
+
+def check_entry(item: dict[str, Any], *, threshold: Optional[int] = None) -> tuple[Optional[dict[str, Any]], str]:
+    """Like `normalize_entry`, but also return why an item was rejected ("" when kept).
+
+    `threshold` overrides DAILY_PAPER_SCORE_THRESHOLD.
+    """
+    curator = default_curator()
+    if threshold is not None and threshold != curator.threshold:
+        curator = Curator(
+            threshold=threshold,
+            max_translated_chars=curator.max_translated_chars,
+            require_pdf_url=curator.require_pdf_url,
+        )
+    return curator.check(item)
@@ -0,0 +1,193 @@
+"""Long-running daily-paper service: warm processor, in-process scheduling, triggers.
+
+Cron pays interpreter start-up, the daily-report import and `ContentProcessor`
+construction on every run, right on the SLA-critical path. The daemon pays
+them once at start-up and then:
+
+- runs today's pipeline `DAILY_PAPER_DAEMON_LEAD_MINUTES` (default 60) before
+  `publish_time` in `timezone` (config/pipeline.yaml);
+- accepts on-demand re-runs on a local Unix socket (`.tmp/daily-paper.sock`),
+  one JSON request per connection, e.g. {"date": "2026-03-14", "from_stage": "build"}.
+
+    python -m pipeline.daemon                       # serve
+    python -m pipeline.daemon trigger --date 2026-03-14 [--from-stage build] [--resume]
+
+Runs execute one at a time on the main thread, in arrival order. The next
+scheduled slot is kept across requests, so a slot that passes while a manual
+run is busy still runs (with `resume`) as soon as that run finishes.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import queue
+import socket
+import socketserver
+import sys
+import threading
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable, Optional
+from zoneinfo import ZoneInfo
+
+from .run_daily import Paths, load_yaml, run_daily
+from .score import get_processor
+
+ROOT = Path(__file__).resolve().parents[1]
+SOCKET_PATH = Paths.from_root(ROOT).tmp_dir / "daily-paper.sock"
+
+
+def next_scheduled_run(now: datetime, pipeline_cfg: dict[str, Any], lead_minutes: int) -> datetime:
+    """Next start time: `publish_time - lead` in the configured timezone, strictly after `now`."""
+    tz = ZoneInfo(str(pipeline_cfg.get("timezone") or "Asia/Shanghai"))
+    hour, minute = (int(x) for x in str(pipeline_cfg.get("publish_time") or "08:30").split(":"))
+    local = now.astimezone(tz)
+    start = local.replace(hour=hour, minute=minute, second=0, microsecond=0) - timedelta(minutes=lead_minutes)
+    while start <= local:
+        start += timedelta(days=1)
+    return start
+
+
+class _TriggerHandler(socketserver.StreamRequestHandler):
+    def handle(self) -> None:
+        line = self.rfile.readline(64 * 1024)
+        try:
+            req = json.loads(line or b"{}")
+            if not isinstance(req, dict):
+                raise ValueError("request must be a JSON object")
+        except ValueError as e:
+            self.wfile.write(json.dumps({"ok": False, "error": str(e)}).encode("utf-8") + b"\n")
+            return
+        self.server.submit(req)  # type: ignore[attr-defined]
+        self.wfile.write(json.dumps({"ok": True, "queued": req}).encode("utf-8") + b"\n")
+
+
+class _TriggerServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, path: Path, submit: Callable[[dict[str, Any]], None]):
+        self.submit = submit
+        super().__init__(str(path), _TriggerHandler)
+
+
+class Daemon:
+    def __init__(
+        self,
+        *,
+        mode: str = "paper",
+        socket_path: Path = SOCKET_PATH,
+        pipeline_cfg: Optional[dict[str, Any]] = None,
+        lead_minutes: Optional[int] = None,
+        runner: Callable[..., Any] = run_daily,
+        clock: Optional[Callable[[], datetime]] = None,
+    ):
+        self.mode = mode
+        self.socket_path = socket_path
+        self.pipeline_cfg = pipeline_cfg if pipeline_cfg is not None else load_yaml(ROOT / "config" / "pipeline.yaml")
+        if lead_minutes is None:
+            lead_minutes = int(os.getenv("DAILY_PAPER_DAEMON_LEAD_MINUTES", "60"))
+        self.lead_minutes = lead_minutes
+        self.runner = runner
+        self.clock = clock or (lambda: datetime.now(self.tz()))
+        self.last_scheduled: Optional[str] = None
+        self.requests: "queue.Queue[dict[str, Any]]" = queue.Queue()
+        self._server: Optional[_TriggerServer] = None
+        self._stop = threading.Event()
+
+    def tz(self) -> ZoneInfo:
+        return ZoneInfo(str(self.pipeline_cfg.get("timezone") or "Asia/Shanghai"))
+
+    def warm_up(self) -> None:
+        try:
+            get_processor()
+            print("[daily-paper] daemon: processor warm")
+        except Exception as e:  # retried lazily by the first run
+            print(f"[daily-paper] daemon: processor warm-up failed: {e}", file=sys.stderr)
+
+    def start_trigger_server(self) -> None:
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+        self.socket_path.unlink(missing_ok=True)
+        self._server = _TriggerServer(self.socket_path, self.requests.put)
+        threading.Thread(target=self._server.serve_forever, name="trigger", daemon=True).start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self.requests.put({"stop": True})
+
+    def execute(self, req: dict[str, Any]) -> None:
+        run_date = str(req.get("date") or self.clock().astimezone(self.tz()).date().isoformat())
+        try:
+            out = self.runner(
+                run_date,
+                mode=str(req.get("mode") or self.mode),
+                resume=bool(req.get("resume")),
+                from_stage=req.get("from_stage"),
+            )
+            print(f"[daily-paper] daemon: OK {run_date}: {out}")
+        except Exception as e:
+            print(f"[daily-paper] daemon: run {run_date} failed: {e}", file=sys.stderr)
+
+    def serve_forever(self) -> None:
+        self.warm_up()
+        self.start_trigger_server()
+        print(f"[daily-paper] daemon: listening on {self.socket_path}")
+        due = next_scheduled_run(self.clock(), self.pipeline_cfg, self.lead_minutes)
+        try:
+            while not self._stop.is_set():
+                now = self.clock()
+                if now >= due:
+                    # Scheduled run: resume so a same-day manual run is not redone.
+                    self.last_scheduled = due.date().isoformat()
+                    self.execute({"date": self.last_scheduled, "resume": True})
+                    due = next_scheduled_run(due, self.pipeline_cfg, self.lead_minutes)
+                    continue
+                print(f"[daily-paper] daemon: next scheduled run at {due.isoformat()}")
+                try:
+                    req = self.requests.get(timeout=max(1.0, (due - now).total_seconds()))
+                except queue.Empty:
+                    continue
+                if req.get("stop"):
+                    break
+                self.execute(req)
+        finally:
+            if self._server is not None:
+                self._server.shutdown()
+                self._server.server_close()
+            self.socket_path.unlink(missing_ok=True)
+
+
+def send_trigger(req: dict[str, Any], socket_path: Path = SOCKET_PATH) -> dict[str, Any]:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(str(socket_path))
+        sock.sendall(json.dumps(req).encode("utf-8") + b"\n")
+        reply = sock.makefile("rb").readline()
+    return json.loads(reply or b"{}")
+
+
+def main(argv: list[str]) -> int:
+    mode = "paper"
+    req: dict[str, Any] = {}
+    trigger = bool(argv) and argv[0] == "trigger"
+
+    i = 1 if trigger else 0
+    while i < len(argv):
+        token = argv[i]
+        if token in ("--date", "--mode", "--from-stage"):
+            req[token[2:].replace("-", "_")] = argv[i + 1]
+            i += 2
+            continue
+        if token == "--resume":
+            req["resume"] = True
+        i += 1
+
+    if trigger:
+        print(json.dumps(send_trigger(req), ensure_ascii=False))
+        return 0
+
+    Daemon(mode=str(req.get("mode") or mode)).serve_forever()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
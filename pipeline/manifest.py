@@ -0,0 +1,99 @@
+"""Publish manifest: content hashes of every published artifact.
+
+`output/manifest.json` maps each artifact path (relative to the project root:
+`output/*.json`, `output/site/**`, `output/profiles/**`) to its sha256. It is
+rewritten after every run and committed with each publish, so the copy in git
+`HEAD` describes what was last published. Files whose size and mtime are
+unchanged since the previous manifest are not re-hashed.
+
+Whether the site itself needs rebuilding is decided per page by
+`site_planner` (day JSON, templates, generator and mode), not here.
+
+    python -m pipeline.manifest update                  # rescan, write the manifest
+    python -m pipeline.manifest changed --base FILE     # paths that differ from FILE's manifest
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Any, Iterator
+
+from .atomic import atomic_write_json
+
+ROOT = Path(__file__).resolve().parents[1]
+MANIFEST = Path("output") / "manifest.json"
+_PATTERNS = ("output/????-??-??*.json", "output/site/**/*", "output/profiles/**/*")
+
+
+def _sha256(path: Path) -> str:
+    h = hashlib.sha256()
+    with path.open("rb") as fh:
+        for chunk in iter(lambda: fh.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _artifacts(root: Path) -> Iterator[Path]:
+    for pattern in _PATTERNS:
+        for path in root.glob(pattern):
+            if path.is_file() and not path.name.startswith("."):
+                yield path
+
+
+def load(path: Path) -> dict[str, Any]:
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def scan(root: Path, previous: dict[str, Any]) -> dict[str, dict[str, Any]]:
+    known = previous.get("artifacts") or {}
+    artifacts = {}
+    for path in sorted(_artifacts(root)):
+        rel = path.relative_to(root).as_posix()
+        st = path.stat()
+        signature = f"{st.st_mtime_ns}:{st.st_size}"
+        old = known.get(rel) or {}
+        sha = old.get("sha256") if old.get("signature") == signature else _sha256(path)
+        artifacts[rel] = {"sha256": sha, "signature": signature}
+    return artifacts
+
+
+def update(root: Path = ROOT) -> dict[str, Any]:
+    path = root / MANIFEST
+    artifacts = scan(root, load(path))
+    manifest = {"generated_at": time.time(), "artifacts": artifacts}
+    atomic_write_json(path, manifest)
+    return manifest
+
+
+def changed(base: dict[str, Any], current: dict[str, Any]) -> list[str]:
+    """Added, modified and removed artifact paths."""
+    before = {k: v.get("sha256") for k, v in (base.get("artifacts") or {}).items()}
+    after = {k: v.get("sha256") for k, v in (current.get("artifacts") or {}).items()}
+    return sorted(k for k in set(before) | set(after) if before.get(k) != after.get(k))
+
+
+def main(argv: list[str]) -> int:
+    cmd = argv[0] if argv else "update"
+    if cmd == "update":
+        manifest = update()
+        print(f"[daily-paper] manifest: {len(manifest['artifacts'])} artifact(s)", file=sys.stderr)
+        return 0
+    if cmd == "changed" and "--base" in argv:
+        base = load(Path(argv[argv.index("--base") + 1]))
+        for rel in changed(base, load(ROOT / MANIFEST)):
+            print(rel)
+        return 0
+    print(__doc__, file=sys.stderr)
+    return 2
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
@@ -0,0 +1,223 @@
+"""Per-run instrumentation: stage wall time, LLM call latency, item counts, SLA.
+
+A run writes `output/YYYY-MM-DD.metrics.json` (and, when
+DAILY_PAPER_PROM_TEXTFILE is set, a Prometheus textfile-collector file):
+
+    {
+      "run_date": ..., "status": "ok" | "failed", "error": ...,
+      "stages": {"collect": {"seconds": ..., "items_in": ..., "items_out": ...}, ...},
+      "llm": {"round1": {"calls": ..., "errors": ..., "p50": ..., "p90": ..., "p99": ..., "max": ...}, ...},
+      "curate_rejections": {"below_threshold": ..., ...},
+      "sla": {"deadline": ..., "projected_finish": ..., "at_risk": bool, "missed": bool}
+    }
+
+SLA projection: after each stage, now + the previous run's duration of the
+remaining stages is compared with today's `publish_time` in the configured
+`timezone`. Runs for other dates (backfills) carry no deadline.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Iterator, Optional
+from zoneinfo import ZoneInfo
+
+
+def percentile(values: list[float], q: float) -> float:
+    """Nearest-rank percentile (q in [0, 100]); 0.0 for no samples."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(q / 100.0 * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def publish_deadline(run_date: str, pipeline_cfg: dict[str, Any], *, now: Optional[datetime] = None) -> Optional[datetime]:
+    """Today's publish deadline, or None when `run_date` is not today in the SLA timezone."""
+    tz = ZoneInfo(str(pipeline_cfg.get("timezone") or "Asia/Shanghai"))
+    now = now or datetime.now(tz)
+    if now.astimezone(tz).date().isoformat() != run_date:
+        return None
+    hour, minute = (int(x) for x in str(pipeline_cfg.get("publish_time") or "08:30").split(":"))
+    return now.astimezone(tz).replace(hour=hour, minute=minute, second=0, microsecond=0)
+
+
+def load_previous(output_dir: Path, run_date: str) -> dict[str, Any]:
+    """Metrics of the latest run before `run_date`, used to project remaining time."""
+    earlier = sorted(p for p in output_dir.glob("????-??-??.metrics.json") if p.name[:10] < run_date)
+    if not earlier:
+        return {}
+    try:
+        return json.loads(earlier[-1].read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+class RunMetrics:
+    def __init__(
+        self,
+        run_date: str = "",
+        *,
+        plan: Optional[list[str]] = None,
+        deadline: Optional[datetime] = None,
+        previous: Optional[dict[str, Any]] = None,
+    ):
+        self.run_date = run_date
+        self.plan = list(plan or [])
+        self.deadline = deadline
+        self.previous = previous or {}
+        self.started_at = time.time()
+        self.stages: dict[str, dict[str, Any]] = {}
+        self.llm_latency: dict[str, list[float]] = {}
+        self.llm_errors: Counter[str] = Counter()
+        self.rejections: Counter[str] = Counter()
+        self.extra: dict[str, Any] = {}
+        self.projected_finish: Optional[float] = None
+        self.at_risk = False
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.stages.setdefault(name, {})["seconds"] = round(time.perf_counter() - t0, 3)
+            self._check_sla(name)
+
+    def count(self, stage: str, *, items_in: Optional[int] = None, items_out: Optional[int] = None) -> None:
+        entry = self.stages.setdefault(stage, {})
+        if items_in is not None:
+            entry["items_in"] = items_in
+        if items_out is not None:
+            entry["items_out"] = items_out
+
+    @contextmanager
+    def llm_call(self, round_name: str) -> Iterator[None]:
+        t0 = time.perf_counter()
+        try:
+            yield
+        except BaseException:
+            with self._lock:
+                self.llm_errors[round_name] += 1
+            raise
+        finally:
+            with self._lock:
+                self.llm_latency.setdefault(round_name, []).append(time.perf_counter() - t0)
+
+    def reject(self, reason: str, n: int = 1) -> None:
+        self.rejections[reason] += n
+
+    def _check_sla(self, finished_stage: str) -> None:
+        if self.deadline is None:
+            return
+        remaining = []
+        if finished_stage in self.plan:
+            remaining = self.plan[self.plan.index(finished_stage) + 1 :]
+        prev_stages = self.previous.get("stages") or {}
+        estimate = sum(float((prev_stages.get(s) or {}).get("seconds") or 0.0) for s in remaining)
+        self.projected_finish = time.time() + estimate
+        if self.projected_finish > self.deadline.timestamp() and not self.at_risk:
+            self.at_risk = True
+            print(
+                f"[daily-paper] SLA at risk after {finished_stage}: projected finish "
+                f"{datetime.fromtimestamp(self.projected_finish, self.deadline.tzinfo):%H:%M:%S} "
+                f"> deadline {self.deadline:%H:%M}",
+                file=sys.stderr,
+            )
+
+    def to_dict(self, *, status: str = "ok", error: str = "") -> dict[str, Any]:
+        llm = {}
+        for round_name, samples in sorted(self.llm_latency.items()):
+            llm[round_name] = {
+                "calls": len(samples),
+                "errors": self.llm_errors.get(round_name, 0),
+                "total_seconds": round(sum(samples), 3),
+                "p50": round(percentile(samples, 50), 3),
+                "p90": round(percentile(samples, 90), 3),
+                "p99": round(percentile(samples, 99), 3),
+                "max": round(max(samples), 3),
+            }
+        finished_at = time.time()
+        deadline = self.deadline.timestamp() if self.deadline else None
+        return {
+            "run_date": self.run_date,
+            "status": status,
+            "error": error or None,
+            "started_at": self.started_at,
+            "finished_at": finished_at,
+            "total_seconds": round(finished_at - self.started_at, 3),
+            "stages": {name: self.stages[name] for name in self.stages},
+            "llm": llm,
+            "curate_rejections": dict(self.rejections),
+            **self.extra,
+            "sla": {
+                "deadline": self.deadline.isoformat() if self.deadline else None,
+                "projected_finish": self.projected_finish,
+                "at_risk": self.at_risk,
+                "missed": bool(deadline and finished_at > deadline),
+            },
+        }
+
+    def write(self, path: Path, *, status: str = "ok", error: str = "") -> dict[str, Any]:
+        data = self.to_dict(status=status, error=error)
+        _write_atomic(path, json.dumps(data, ensure_ascii=False, indent=2) + "\n")
+        prom_path = os.getenv("DAILY_PAPER_PROM_TEXTFILE", "")
+        if prom_path:
+            write_prometheus(Path(prom_path), data)
+        return data
+
+
+def write_prometheus(path: Path, data: dict[str, Any]) -> None:
+    """Write a node_exporter textfile-collector file (temp file + rename, as the collector expects)."""
+    lines = [
+        "# TYPE daily_paper_run_seconds gauge",
+        f"daily_paper_run_seconds {data['total_seconds']}",
+        "# TYPE daily_paper_run_success gauge",
+        f"daily_paper_run_success {1 if data['status'] == 'ok' else 0}",
+        "# TYPE daily_paper_sla_at_risk gauge",
+        f"daily_paper_sla_at_risk {1 if data['sla']['at_risk'] else 0}",
+        "# TYPE daily_paper_stage_seconds gauge",
+    ]
+    for stage, entry in data["stages"].items():
+        if "seconds" in entry:
+            lines.append(f'daily_paper_stage_seconds{{stage="{stage}"}} {entry["seconds"]}')
+    lines.append("# TYPE daily_paper_stage_items gauge")
+    for stage, entry in data["stages"].items():
+        for direction in ("in", "out"):
+            if f"items_{direction}" in entry:
+                lines.append(
+                    f'daily_paper_stage_items{{stage="{stage}",direction="{direction}"}} {entry[f"items_{direction}"]}'
+                )
+    lines.append("# TYPE daily_paper_llm_calls gauge")
+    for round_name, entry in data["llm"].items():
+        lines.append(f'daily_paper_llm_calls{{round="{round_name}"}} {entry["calls"]}')
+    lines.append("# TYPE daily_paper_llm_latency_seconds gauge")
+    for round_name, entry in data["llm"].items():
+        for q in ("p50", "p90", "p99"):
+            lines.append(
+                f'daily_paper_llm_latency_seconds{{round="{round_name}",quantile="0.{q[1:]}"}} {entry[q]}'
+            )
+    lines.append("# TYPE daily_paper_curate_rejections gauge")
+    for reason, n in data["curate_rejections"].items():
+        lines.append(f'daily_paper_curate_rejections{{reason="{reason}"}} {n}')
+
+    _write_atomic(path, "\n".join(lines) + "\n")
+
+
+def _write_atomic(path: Path, text: str) -> None:
+    # Same temp-file-then-rename as `atomic.py`, inlined so this module stays
+    # importable on its own (tests load it by path).
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    tmp.write_text(text, encoding="utf-8")
+    os.replace(tmp, path)
@@ -1,13 +1,121 @@
-from dataclasses import dataclass
+"""`PaperItem`: the pipeline's in-memory record for one paper.
 
+Collector output is converted once on the way into scoring
+(`PaperItem.from_dict`). Only the fields later stages read are kept, so the
+collector's `raw` payload, authors and other extra keys are dropped at ingest.
+Stages then update the same slotted object in place, and `to_dict()` produces
+a dict only where items are written as JSON (checkpoints, .tmp artifacts).
 
-@dataclass
+For code written against the old dict items, `item["score"]`,
+`item.get("title")`, `"second_score" in item` and `item["topic"] = ...` map
+onto the fields. A field that is None counts as absent.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field, fields
+from typing import Any, Optional
+
+_ARXIV_ID_RE = re.compile(r"(\d{4}\.\d{4,5}(?:v\d+)?)")
+_ARXIV_VERSION_RE = re.compile(r"v\d+$")
+
+# JSON key (collector spelling) -> field name.
+_ALIASES = {"publishedAt": "published_at", "publishedDate": "published_date"}
+_JSON_KEYS = {v: k for k, v in _ALIASES.items()}
+
+
+def normalize_arxiv_id(arxiv_id: str) -> str:
+    """Strip the version suffix: `2502.01234v2` -> `2502.01234`."""
+    return _ARXIV_VERSION_RE.sub("", arxiv_id.strip())
+
+
+def extract_arxiv_id(item: Any) -> str:
+    for key in ("arxiv_id", "id", "url", "abs_url", "pdf_url"):
+        val = item.get(key)
+        if not val:
+            continue
+        s = str(val)
+        m = _ARXIV_ID_RE.search(s)
+        if m:
+            return m.group(1)
+    return ""
+
+
+@dataclass(slots=True)
 class PaperItem:
     arxiv_id: str
     title: str
-    categories: list[str]
-    translated_zh: str
-    score: float
-    topic: str = ""
-    abs_url: str = ""
-    pdf_url: str = ""
+    abstract: str = ""
+    categories: list[str] = field(default_factory=list)
+    source: str = "arxiv"
+    url: str = ""
+    published_at: Optional[str] = None
+    published_date: Optional[str] = None
+    # Set by scoring / curation.
+    first_score: Optional[int] = None
+    second_score: Optional[int] = None
+    score: Optional[int] = None
+    translated_zh: Optional[str] = None
+    topic: Optional[str] = None
+    abs_url: Optional[str] = None
+    pdf_url: Optional[str] = None
+
+    @staticmethod
+    def from_dict(data: dict[str, Any]) -> "PaperItem":
+        """Collector output or a saved `to_dict()` payload."""
+        item = PaperItem(
+            arxiv_id=extract_arxiv_id(data),
+            title=str(data.get("title") or "").strip(),
+            abstract=str(data.get("abstract") or "").strip(),
+            categories=[str(c) for c in data.get("categories") or []],
+            source=str(data.get("source") or "arxiv"),
+            url=str(data.get("url") or ""),
+        )
+        for name in _FIELDS[6:]:
+            value = data.get(_JSON_KEYS.get(name, name))
+            if value is None and name in _JSON_KEYS:
+                value = data.get(name)
+            if value is not None:
+                setattr(item, name, value)
+        return item
+
+    @staticmethod
+    def coerce(item: "PaperItem | dict[str, Any]") -> "PaperItem":
+        return item if isinstance(item, PaperItem) else PaperItem.from_dict(item)
+
+    def to_dict(self) -> dict[str, Any]:
+        out = {}
+        for name in _FIELDS:
+            value = getattr(self, name)
+            if value is not None:
+                out[_JSON_KEYS.get(name, name)] = value
+        return out
+
+    # ---- dict-style access ----
+
+    def get(self, key: str, default: Any = None) -> Any:
+        name = _ALIASES.get(key, key)
+        if name not in _FIELD_SET:
+            return default
+        value = getattr(self, name)
+        return default if value is None else value
+
+    def __getitem__(self, key: str) -> Any:
+        value = self.get(key)
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        name = _ALIASES.get(key, key)
+        if name not in _FIELD_SET:
+            raise KeyError(f"PaperItem has no field {key!r}")
+        setattr(self, name, value)
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, str) and self.get(key) is not None
+
+
+_FIELDS = tuple(f.name for f in fields(PaperItem))
+_FIELD_SET = frozenset(_FIELDS)
@@ -0,0 +1,104 @@
+"""Local relevance pre-filter: rank collected papers before any LLM call.
+
+Candidates (title + abstract) are scored with BM25 against an interest profile
+built from the titles we already published in `output/*.json`. Only the top-N
+go on to LLM scoring, so collecting wider costs no extra LLM calls.
+
+Pure Python (dict-of-counts postings); a few thousand candidates rank in a
+fraction of a second, which is noise next to a single LLM round-trip.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import re
+from collections import Counter
+from pathlib import Path
+from typing import Any, Iterable
+
+_TOKEN_RE = re.compile(r"[a-z][a-z0-9]{2,}")
+
+STOPWORDS = frozenset(
+    """
+    and are for from has have into its not our that the their them these this those via
+    was were what when which while with within without can could may more most such than
+    then there where who will would also based using use used new show shows paper propose
+    proposed approach method methods results model models data task tasks work study
+    """.split()
+)
+
+
+def tokenize(text: str) -> list[str]:
+    return [t for t in _TOKEN_RE.findall(text.lower()) if t not in STOPWORDS]
+
+
+class InterestProfile:
+    """Term weights describing what we have published so far."""
+
+    def __init__(self, weights: dict[str, float]):
+        self.weights = weights
+
+    def __bool__(self) -> bool:
+        return bool(self.weights)
+
+    @staticmethod
+    def from_texts(texts: Iterable[str]) -> "InterestProfile":
+        counts: Counter[str] = Counter()
+        for text in texts:
+            # Count each term once per published paper so long titles don't dominate.
+            counts.update(set(tokenize(text)))
+        return InterestProfile({t: 1.0 + math.log(c) for t, c in counts.items()})
+
+    @staticmethod
+    def from_archive(output_dir: Path) -> "InterestProfile":
+        texts: list[str] = []
+        for path in sorted(output_dir.glob("????-??-??.json")):
+            try:
+                payload = json.loads(path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                continue
+            items = payload.get("items") if isinstance(payload, dict) else payload
+            for item in items or []:
+                if isinstance(item, dict) and item.get("title"):
+                    texts.append(str(item["title"]))
+        return InterestProfile.from_texts(texts)
+
+
+def bm25_scores(
+    items: list[dict[str, Any]], profile: InterestProfile, *, k1: float = 1.5, b: float = 0.75
+) -> list[float]:
+    docs = [Counter(tokenize(f"{item.get('title') or ''} {item.get('abstract') or ''}")) for item in items]
+    if not docs or not profile:
+        return [0.0] * len(docs)
+
+    n = len(docs)
+    lengths = [sum(d.values()) for d in docs]
+    avg_len = (sum(lengths) / n) or 1.0
+    df: Counter[str] = Counter()
+    for d in docs:
+        df.update(t for t in d if t in profile.weights)
+    idf = {t: math.log(1.0 + (n - c + 0.5) / (c + 0.5)) for t, c in df.items()}
+
+    scores = []
+    for d, length in zip(docs, lengths):
+        norm = k1 * (1.0 - b + b * length / avg_len)
+        s = 0.0
+        for t, tf in d.items():
+            w = profile.weights.get(t)
+            if w is not None:
+                s += w * idf[t] * tf * (k1 + 1.0) / (tf + norm)
+        scores.append(s)
+    return scores
+
+
+def prefilter(items: list[dict[str, Any]], profile: InterestProfile, top_n: int) -> list[dict[str, Any]]:
+    """Keep the `top_n` most relevant items, in their original (collection) order.
+
+    An empty profile keeps the first `top_n` items, matching plain truncation.
+    """
+    if top_n <= 0 or len(items) <= top_n or not profile:
+        return items[: max(0, top_n)]
+    scores = bm25_scores(items, profile)
+    ranked = sorted(range(len(items)), key=lambda i: (-scores[i], i))[:top_n]
+    return [items[i] for i in sorted(ranked)]
@@ -0,0 +1,64 @@
+"""Audience profiles that share one collect + score pass per date.
+
+`config/profiles.yaml` lists extra outputs on top of the main pipeline. Each
+profile re-curates the day's scored items with its own threshold and topic
+rules and writes its own `<output_dir>/YYYY-MM-DD.json` and site
+(`<output_dir>/site`). No LLM calls are made per profile, so a profile costs
+one curate pass plus one site build.
+
+    profiles:
+      - name: news
+        mode: news                        # brand passed to web/generate.js
+        score_threshold: 75               # default: DAILY_PAPER_SCORE_THRESHOLD
+        topics: config/topics-news.yaml   # default: config/topics.yaml
+        output_dir: output/profiles/news  # default: output/profiles/<name>
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Optional
+
+import yaml
+
+
+@dataclass
+class Profile:
+    name: str
+    mode: str = "paper"
+    score_threshold: Optional[int] = None
+    topics: str = "config/topics.yaml"
+    output_dir: str = ""
+
+    @staticmethod
+    def from_dict(raw: dict[str, Any]) -> "Profile":
+        name = str(raw.get("name") or "").strip()
+        if not name:
+            raise ValueError("profile without a name in config/profiles.yaml")
+        threshold = raw.get("score_threshold")
+        return Profile(
+            name=name,
+            mode=str(raw.get("mode") or "paper"),
+            score_threshold=int(threshold) if threshold is not None else None,
+            topics=str(raw.get("topics") or "config/topics.yaml"),
+            output_dir=str(raw.get("output_dir") or f"output/profiles/{name}"),
+        )
+
+    def output_path(self, root: Path) -> Path:
+        return root / self.output_dir
+
+    def site_path(self, root: Path) -> Path:
+        return self.output_path(root) / "site"
+
+
+def load_profiles(root: Path) -> list[Profile]:
+    path = root / "config" / "profiles.yaml"
+    if not path.exists():
+        return []
+    cfg = yaml.safe_load(path.read_text(encoding="utf-8")) or {}
+    profiles = [Profile.from_dict(x) for x in cfg.get("profiles") or []]
+    names = [p.name for p in profiles]
+    if len(set(names)) != len(names):
+        raise ValueError(f"duplicate profile names in config/profiles.yaml: {names}")
+    return profiles
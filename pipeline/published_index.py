@@ -0,0 +1,108 @@
+"""Cross-day index of published arXiv IDs (SQLite under `.tmp/`).
+
+IDs are stored without their version suffix, so a v2 revision or a cross-listed
+re-collection of a paper we already shipped is recognized as a duplicate. The
+index is synced incrementally from `output/*.json` (only days whose file size
+or mtime changed are re-read) and updated by `record_day` when a run writes
+its day. Lookups hit the primary key, so they stay O(log n) as the archive
+grows.
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+from pathlib import Path
+from typing import Any, Iterable
+
+from .score import extract_arxiv_id, normalize_arxiv_id
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS published (
+    arxiv_id TEXT NOT NULL,
+    run_date TEXT NOT NULL,
+    PRIMARY KEY (arxiv_id, run_date)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS days (
+    run_date TEXT PRIMARY KEY,
+    signature TEXT NOT NULL
+);
+"""
+
+
+def file_signature(path: Path) -> str:
+    st = path.stat()
+    return f"{st.st_mtime_ns}:{st.st_size}"
+
+
+class PublishedBefore:
+    """Membership view: IDs published on a day strictly before `run_date`."""
+
+    def __init__(self, index: "PublishedIndex", run_date: str):
+        self.index = index
+        self.run_date = run_date
+
+    def __contains__(self, arxiv_id: object) -> bool:
+        key = normalize_arxiv_id(str(arxiv_id or ""))
+        if not key:
+            return False
+        row = self.index.conn.execute(
+            "SELECT 1 FROM published WHERE arxiv_id = ? AND run_date < ? LIMIT 1", (key, self.run_date)
+        ).fetchone()
+        return row is not None
+
+
+class PublishedIndex:
+    def __init__(self, path: Path):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self.conn = sqlite3.connect(str(path), timeout=30, check_same_thread=False)
+        self.conn.executescript(_SCHEMA)
+
+    def __enter__(self) -> "PublishedIndex":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def before(self, run_date: str) -> PublishedBefore:
+        return PublishedBefore(self, run_date)
+
+    def record_day(self, run_date: str, items: Iterable[dict[str, Any]], *, signature: str = "") -> None:
+        """Replace the IDs recorded for `run_date` with the ones in `items`."""
+        ids = {normalize_arxiv_id(extract_arxiv_id(item)) for item in items}
+        ids.discard("")
+        with self.conn:
+            self.conn.execute("DELETE FROM published WHERE run_date = ?", (run_date,))
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO published VALUES (?, ?)", [(x, run_date) for x in sorted(ids)]
+            )
+            if signature:
+                self.conn.execute("INSERT OR REPLACE INTO days VALUES (?, ?)", (run_date, signature))
+
+    def sync(self, output_dir: Path) -> int:
+        """Re-index days whose `output/YYYY-MM-DD.json` changed; return how many were read."""
+        known = dict(self.conn.execute("SELECT run_date, signature FROM days"))
+        updated = 0
+        seen: set[str] = set()
+        for path in sorted(output_dir.glob("????-??-??.json")):
+            run_date = path.stem
+            seen.add(run_date)
+            signature = file_signature(path)
+            if known.get(run_date) == signature:
+                continue
+            try:
+                payload = json.loads(path.read_text(encoding="utf-8"))
+            except ValueError:
+                continue
+            items = payload.get("items") if isinstance(payload, dict) else payload
+            self.record_day(run_date, [x for x in items or [] if isinstance(x, dict)], signature=signature)
+            updated += 1
+        with self.conn:
+            for run_date in set(known) - seen:
+                self.conn.execute("DELETE FROM published WHERE run_date = ?", (run_date,))
+                self.conn.execute("DELETE FROM days WHERE run_date = ?", (run_date,))
+        return updated
@@ -1,11 +1,364 @@
-def render_daily_markdown(run_date: str, items: list[dict]) -> str:
-    lines = [f"# Daily Paper {run_date}", ""]
+"""Markdown and feed renderers for daily-paper outputs.
+
+Every writer streams to an open text handle one item at a time; nothing
+builds a whole document in memory. Items pass through `normalize_item` first,
+so older day files with only an `id` or `url` render too. `render_archive` keeps `<site_dir>/feeds/`
+in sync with the day JSON files in `<output_dir>`:
+
+- feeds/YYYY-MM-DD.md   one Markdown page per day
+- feeds/archive.md      every day, newest first
+- feeds/rss.xml, feeds/atom.xml, feeds/feed.json (JSON Feed 1.1)
+
+The channel-level feeds need an absolute site root (`site_url` in
+config/pipeline.yaml); without one they are skipped with a warning, since
+relative channel links are invalid in all three formats.
+
+Only days whose JSON changed since the last render (by mtime + size, tracked in
+`<cache_dir>/state.json`) are re-rendered, in a process pool when there are
+several. Each day renders to its Markdown page plus one feed-entry fragment
+per format in `<cache_dir>/parts/`. The archive-level files are then assembled
+by copying fragments, so unchanged days cost a file copy, not a re-render.
+
+    python -m pipeline.render [--mode paper|news]
+
+Env knobs:
+- DAILY_PAPER_SITE_URL (default `site_url` in config/pipeline.yaml; public site root for the feeds)
+- DAILY_PAPER_FEED_DAYS (default 30; newest days included in the feeds, 0 = whole archive)
+- DAILY_PAPER_RENDER_WORKERS (default 4; processes for re-rendering changed days)
+- DAILY_PAPER_TIMEZONE (default Asia/Shanghai; for items without a publish time)
+"""
+
+# NOTE: no `from __future__ import annotations` here: tests load this file
+# standalone (outside the package), and dataclasses cannot resolve string
+# annotations for a module that is not registered in sys.modules.
+import hashlib
+import io
+import json
+import os
+import shutil
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from email.utils import format_datetime
+from pathlib import Path
+from typing import Any, Iterable, TextIO
+from xml.sax.saxutils import escape, quoteattr
+from zoneinfo import ZoneInfo
+
+import yaml
+
+from pipeline.adapters import iter_items
+from pipeline.atomic import atomic_open, atomic_write_json
+from pipeline.models import extract_arxiv_id
+
+ROOT = Path(__file__).resolve().parents[1]
+RENDER_VERSION = 2
+FORMATS = ("rss", "atom", "json")
+CHANNEL_FEEDS = ("rss.xml", "atom.xml", "feed.json")
+BRANDS = {"paper": ("Daily Paper", "每日论文"), "news": ("Daily News", "每日资讯")}
+
+
+@dataclass
+class FeedSettings:
+    mode: str = "paper"
+    site_url: str = ""
+    feed_days: int = 30
+    workers: int = 4
+    time_zone: str = "Asia/Shanghai"
+
+    @staticmethod
+    def from_env(mode: str = "paper", pipeline_cfg: dict | None = None) -> "FeedSettings":
+        site_url = os.getenv("DAILY_PAPER_SITE_URL") or str((pipeline_cfg or {}).get("site_url") or "")
+        return FeedSettings(
+            mode=mode,
+            site_url=site_url.strip().rstrip("/"),
+            feed_days=int(os.getenv("DAILY_PAPER_FEED_DAYS", "30")),
+            workers=int(os.getenv("DAILY_PAPER_RENDER_WORKERS", "4")),
+            time_zone=os.getenv("DAILY_PAPER_TIMEZONE", "Asia/Shanghai"),
+        )
+
+    @property
+    def brand(self) -> str:
+        return BRANDS.get(self.mode, BRANDS["paper"])[0]
+
+    def link(self, rel: str) -> str:
+        if not self.site_url:
+            raise ValueError("feed links need an absolute site URL (site_url in config/pipeline.yaml)")
+        return f"{self.site_url}/{rel}"
+
+
+# ---- per-item writers ----
+
+
+def normalize_item(item: dict) -> dict | None:
+    """Fill the fields the writers read, like `normalizeItem` in web/generate.js.
+
+    Links fall back to the arXiv ID found in `arxiv_id`/`id`/`url`; an item
+    with no usable link returns None and is left out.
+    """
+    arxiv_id = extract_arxiv_id(item)
+    abs_url = item.get("abs_url") or item.get("absUrl") or (f"https://arxiv.org/abs/{arxiv_id}" if arxiv_id else "")
+    if not abs_url:
+        return None
+    pdf_url = item.get("pdf_url") or item.get("pdfUrl") or (f"https://arxiv.org/pdf/{arxiv_id}.pdf" if arxiv_id else "")
+    scores = (item.get(k) for k in ("final_score", "second_score", "first_score", "score"))
+    score = next((x for x in scores if x is not None), "-")
+    return {
+        **item,
+        "title": item.get("title") or "Untitled",
+        "topic": item.get("topic") or "未分类",
+        "score": score,
+        "translated_zh": item.get("translated_zh") or item.get("summary_zh") or "",
+        "arxiv_id": item.get("arxiv_id") or arxiv_id or None,
+        "abs_url": abs_url,
+        "pdf_url": pdf_url,
+    }
+
+
+def write_daily_markdown(fh: TextIO, run_date: str, items: Iterable[dict], *, brand: str = "Daily Paper") -> None:
+    fh.write(f"# {brand} {run_date}\n")
     for i, item in enumerate(items, start=1):
-        lines.append(f"## {i}. {item['title']}")
-        lines.append(f"- 主题: {item['topic']}")
-        lines.append(f"- 评分: {item['score']}")
-        lines.append(f"- 摘要: {item['translated_zh']}")
-        lines.append(f"- abs: {item['abs_url']}")
-        lines.append(f"- pdf: {item['pdf_url']}")
-        lines.append("")
-    return "\n".join(lines)
+        fh.write(f"\n## {i}. {item['title']}\n")
+        fh.write(f"- 主题: {item['topic']}\n")
+        fh.write(f"- 评分: {item['score']}\n")
+        fh.write(f"- 摘要: {item['translated_zh']}\n")
+        fh.write(f"- abs: {item['abs_url']}\n")
+        if item["pdf_url"]:
+            fh.write(f"- pdf: {item['pdf_url']}\n")
+
+
+def render_daily_markdown(run_date: str, items: list[dict]) -> str:
+    buf = io.StringIO()
+    write_daily_markdown(buf, run_date, filter(None, map(normalize_item, items)))
+    return buf.getvalue()
+
+
+def item_time(item: dict, run_date: str, tz: ZoneInfo) -> datetime:
+    """Publish time of an item, else midnight of its day in `tz`."""
+    raw = str(item.get("published_at") or "")
+    try:
+        when = datetime.fromisoformat(raw.replace("Z", "+00:00"))
+        return when if when.tzinfo else when.replace(tzinfo=tz)
+    except ValueError:
+        return datetime.fromisoformat(run_date).replace(tzinfo=tz)
+
+
+def write_rss_item(fh: TextIO, item: dict, when: datetime) -> None:
+    link = escape(item["abs_url"])
+    fh.write("<item>")
+    fh.write(f"<title>{escape(item['title'])}</title>")
+    fh.write(f'<link>{link}</link><guid isPermaLink="true">{link}</guid>')
+    fh.write(f"<pubDate>{format_datetime(when)}</pubDate>")
+    fh.write(f"<category>{escape(item['topic'])}</category>")
+    fh.write(f"<description>{escape(item['translated_zh'])}</description>")
+    if item["pdf_url"]:
+        fh.write(f'<enclosure url={quoteattr(item["pdf_url"])} type="application/pdf" length="0"/>')
+    fh.write("</item>\n")
+
+
+def write_atom_entry(fh: TextIO, item: dict, when: datetime) -> None:
+    fh.write("<entry>")
+    fh.write(f"<title>{escape(item['title'])}</title>")
+    fh.write(f"<id>{escape(item['abs_url'])}</id>")
+    fh.write(f"<link href={quoteattr(item['abs_url'])}/>")
+    if item["pdf_url"]:
+        fh.write(f'<link rel="related" type="application/pdf" href={quoteattr(item["pdf_url"])}/>')
+    fh.write(f"<updated>{when.isoformat()}</updated>")
+    fh.write(f"<category term={quoteattr(item['topic'])}/>")
+    fh.write(f'<summary type="text">{escape(item["translated_zh"])}</summary>')
+    fh.write("</entry>\n")
+
+
+def json_feed_item(item: dict, when: datetime, run_date: str) -> dict[str, Any]:
+    return {
+        "id": item["abs_url"],
+        "url": item["abs_url"],
+        "title": item["title"],
+        "content_text": item["translated_zh"],
+        "date_published": when.isoformat(),
+        "tags": [item["topic"]],
+        "attachments": [{"url": item["pdf_url"], "mime_type": "application/pdf"}] if item["pdf_url"] else [],
+        "_daily_paper": {"date": run_date, "score": item["score"], "arxiv_id": item.get("arxiv_id")},
+    }
+
+
+# ---- per-day rendering (runs in worker processes) ----
+
+
+def _part_paths(cache_dir: Path, run_date: str) -> dict[str, Path]:
+    return {fmt: cache_dir / "parts" / f"{run_date}.{fmt}" for fmt in FORMATS}
+
+
+def render_day(day_json: Path, feeds_dir: Path, cache_dir: Path, settings: FeedSettings) -> dict[str, Any]:
+    """Render one day's Markdown page and feed fragments in a single streaming pass."""
+    run_date = day_json.stem
+    tz = ZoneInfo(settings.time_zone)
+    parts = _part_paths(cache_dir, run_date)
+    signature = _signature(day_json)
+    count, updated = 0, datetime.fromisoformat(run_date).replace(tzinfo=tz)
+    with ExitStack() as stack:
+        md = stack.enter_context(atomic_open(feeds_dir / f"{run_date}.md"))
+        rss, atom, jf = (stack.enter_context(atomic_open(parts[fmt])) for fmt in FORMATS)
+
+        def each() -> Iterable[dict]:
+            nonlocal count, updated
+            for raw in iter_items(day_json):
+                item = normalize_item(raw) if isinstance(raw, dict) else None
+                if item is None:
+                    continue
+                when = item_time(item, run_date, tz)
+                updated = max(updated, when)
+                write_rss_item(rss, item, when)
+                write_atom_entry(atom, item, when)
+                jf.write(("," if count else "") + json.dumps(json_feed_item(item, when, run_date), ensure_ascii=False))
+                count += 1
+                yield item
+
+        write_daily_markdown(md, run_date, each(), brand=settings.brand)
+    # UTC so days compare as strings when assembling the feeds.
+    return {"signature": signature, "items": count, "updated": updated.astimezone(timezone.utc).isoformat()}
+
+
+def _render_day_job(args: tuple[Path, Path, Path, FeedSettings]) -> tuple[str, dict[str, Any]]:
+    return args[0].stem, render_day(*args)
+
+
+# ---- archive-level assembly ----
+
+
+def _signature(path: Path) -> str:
+    st = path.stat()
+    return f"{st.st_mtime_ns}:{st.st_size}"
+
+
+def _copy(dst: TextIO, src: Path) -> None:
+    with src.open(encoding="utf-8") as fh:
+        shutil.copyfileobj(fh, dst)
+
+
+def _assemble(feeds_dir: Path, cache_dir: Path, dates: list[str], days: dict[str, Any], settings: FeedSettings) -> None:
+    newest_first = sorted(dates, reverse=True)
+    with atomic_open(feeds_dir / "archive.md") as fh:
+        for i, d in enumerate(newest_first):
+            fh.write("\n" if i else "")
+            _copy(fh, feeds_dir / f"{d}.md")
+
+    if not settings.site_url:
+        for name in CHANNEL_FEEDS:
+            (feeds_dir / name).unlink(missing_ok=True)
+        print(
+            "[daily-paper] WARNING: no site URL; skipping rss.xml, atom.xml and feed.json "
+            "(set site_url in config/pipeline.yaml or DAILY_PAPER_SITE_URL)",
+            file=sys.stderr,
+        )
+        return
+
+    window = newest_first[: settings.feed_days] if settings.feed_days > 0 else newest_first
+    updated = max((days[d]["updated"] for d in window), default=datetime.now(timezone.utc).isoformat())
+    brand = settings.brand
+    home = settings.link("index.html")
+
+    with atomic_open(feeds_dir / "rss.xml") as fh:
+        fh.write('<?xml version="1.0" encoding="UTF-8"?>\n<rss version="2.0"><channel>\n')
+        fh.write(f"<title>{escape(brand)}</title><link>{escape(home)}</link><description>{escape(brand)}</description>")
+        fh.write(f"<lastBuildDate>{format_datetime(datetime.fromisoformat(updated))}</lastBuildDate>\n")
+        for d in window:
+            _copy(fh, _part_paths(cache_dir, d)["rss"])
+        fh.write("</channel></rss>\n")
+
+    with atomic_open(feeds_dir / "atom.xml") as fh:
+        fh.write('<?xml version="1.0" encoding="UTF-8"?>\n<feed xmlns="http://www.w3.org/2005/Atom">\n')
+        fh.write(f"<title>{escape(brand)}</title><id>{escape(home)}</id><updated>{updated}</updated>")
+        fh.write(f"<link href={quoteattr(home)}/>")
+        fh.write(f'<link rel="self" href={quoteattr(settings.link("feeds/atom.xml"))}/>')
+        fh.write(f"<author><name>{escape(brand)}</name></author>\n")
+        for d in window:
+            _copy(fh, _part_paths(cache_dir, d)["atom"])
+        fh.write("</feed>\n")
+
+    with atomic_open(feeds_dir / "feed.json") as fh:
+        head = {
+            "version": "https://jsonfeed.org/version/1.1",
+            "title": brand,
+            "home_page_url": home,
+            "feed_url": settings.link("feeds/feed.json"),
+        }
+        fh.write(json.dumps(head, ensure_ascii=False)[:-1] + ', "items": [')
+        first = True
+        for d in window:
+            if not days[d]["items"]:
+                continue
+            fh.write("" if first else ",\n")
+            _copy(fh, _part_paths(cache_dir, d)["json"])
+            first = False
+        fh.write("]}\n")
+
+
+def render_archive(output_dir: Path, site_dir: Path, cache_dir: Path, settings: FeedSettings) -> dict[str, int]:
+    """Re-render changed days, drop removed ones, then reassemble the archive-level files."""
+    feeds_dir = site_dir / "feeds"
+    state_path = cache_dir / "state.json"
+    try:
+        state = json.loads(state_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        state = {}
+    fingerprint = {"version": RENDER_VERSION, "settings": {**asdict(settings), "workers": None}}
+    days: dict[str, Any] = state.get("days", {}) if state.get("fingerprint") == fingerprint else {}
+
+    files = {p.stem: p for p in sorted(output_dir.glob("????-??-??.json"))}
+    removed = [d for d in days if d not in files]
+    for d in removed:
+        del days[d]
+        (feeds_dir / f"{d}.md").unlink(missing_ok=True)
+        for part in _part_paths(cache_dir, d).values():
+            part.unlink(missing_ok=True)
+    changed = [
+        d
+        for d, path in files.items()
+        if d not in days
+        or days[d].get("signature") != _signature(path)
+        or not (feeds_dir / f"{d}.md").exists()
+        or not all(p.exists() for p in _part_paths(cache_dir, d).values())
+    ]
+
+    jobs = [(files[d], feeds_dir, cache_dir, settings) for d in changed]
+    workers = max(1, min(settings.workers, len(jobs)))
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            days.update(pool.map(_render_day_job, jobs))
+    else:
+        days.update(map(_render_day_job, jobs))
+
+    if changed or removed or not (feeds_dir / "archive.md").exists():
+        _assemble(feeds_dir, cache_dir, list(files), days, settings)
+    atomic_write_json(state_path, {"fingerprint": fingerprint, "days": days})
+    return {"days": len(files), "rendered": len(changed), "removed": len(removed)}
+
+
+def render_feeds(
+    root: Path, mode: str, *, output_dir: Path | None = None, site_dir: Path | None = None
+) -> dict[str, int]:
+    """`render_archive` for a site built by web/generate.js (same default directories)."""
+    output_dir = output_dir or root / "output"
+    site_dir = site_dir or output_dir / "site"
+    try:
+        slug = output_dir.resolve().relative_to(root.resolve()).as_posix().replace("/", "_")
+    except ValueError:
+        slug = hashlib.sha256(str(output_dir.resolve()).encode("utf-8")).hexdigest()[:16]
+    pipeline_cfg_path = root / "config" / "pipeline.yaml"
+    pipeline_cfg = yaml.safe_load(pipeline_cfg_path.read_text(encoding="utf-8")) if pipeline_cfg_path.exists() else {}
+    settings = FeedSettings.from_env(mode, pipeline_cfg)
+    summary = render_archive(output_dir, site_dir, root / ".tmp" / "render" / slug, settings)
+    print(f"[daily-paper] render: {summary['rendered']}/{summary['days']} day(s) re-rendered -> {site_dir / 'feeds'}")
+    return summary
+
+
+def main(argv: list[str]) -> int:
+    render_feeds(ROOT, argv[argv.index("--mode") + 1] if "--mode" in argv else "paper")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
@@ -0,0 +1,239 @@
+"""Deadlines, hedging, retries and a circuit breaker around blocking LLM calls.
+
+`ResilientCaller.call(kind, fn, *args)` runs `fn` on a daemon thread and
+
+- takes a slot from the RPM `limiter` (see `concurrency.RateLimiter`) before
+  every attempt and every hedge, so retries and duplicates stay within the
+  provider's rate limit;
+- caps the calls still running, abandoned ones included, at `max_in_flight`.
+  An attempt that cannot get a slot within `timeout` counts as timed out, and
+  a hedge is only started when a slot is free;
+- gives up on an attempt after `timeout` seconds (the hung thread is
+  abandoned: a blocking client call cannot be cancelled, but it no longer
+  holds up the run or a pool worker);
+- once `kind` has `hedge_min_samples` successful latencies, starts one
+  duplicate call when an attempt outlives their `hedge_percentile`. The first
+  result wins;
+- retries failed or timed-out attempts up to `retries` times, sleeping a
+  full-jitter backoff (uniform in [0, backoff * 2**attempt]);
+- counts consecutive failed calls. After `breaker_failures` of them the
+  breaker opens, and every call fails fast with `CircuitOpenError` for
+  `breaker_cooldown` seconds. Then one trial call is let through: success
+  closes the breaker, failure re-opens it.
+
+Env knobs:
+- DAILY_PAPER_LLM_TIMEOUT (default 180 seconds per attempt)
+- DAILY_PAPER_LLM_HEDGE_PERCENTILE (default 95; 0 disables hedging)
+- DAILY_PAPER_LLM_RETRIES (default 2)
+- DAILY_PAPER_LLM_BACKOFF (default 2 seconds)
+- DAILY_PAPER_LLM_BREAKER_FAILURES (default 5; 0 disables the breaker)
+- DAILY_PAPER_LLM_BREAKER_COOLDOWN (default 300 seconds)
+- DAILY_PAPER_LLM_MAX_IN_FLIGHT (default 8; LLM calls running at once, counting hedges and
+  timed-out attempts that have not returned yet; keep it >= DAILY_PAPER_SCORE_CONCURRENCY)
+"""
+
+from __future__ import annotations
+
+import os
+import random
+import threading
+import time
+from concurrent.futures import Future, InvalidStateError
+from concurrent.futures import TimeoutError as FutureTimeout
+from dataclasses import dataclass
+from typing import Any, Callable, Optional, TypeVar
+
+from .concurrency import RateLimiter
+from .metrics import percentile
+
+R = TypeVar("R")
+
+
+class CircuitOpenError(RuntimeError):
+    pass
+
+
+class CallTimeout(TimeoutError):
+    pass
+
+
+@dataclass
+class CallPolicy:
+    timeout: float = 180.0
+    hedge_percentile: float = 95.0
+    hedge_min_samples: int = 5
+    retries: int = 2
+    backoff: float = 2.0
+    breaker_failures: int = 5
+    breaker_cooldown: float = 300.0
+    max_in_flight: int = 8
+
+    @staticmethod
+    def from_env() -> "CallPolicy":
+        return CallPolicy(
+            timeout=float(os.getenv("DAILY_PAPER_LLM_TIMEOUT", "180")),
+            hedge_percentile=float(os.getenv("DAILY_PAPER_LLM_HEDGE_PERCENTILE", "95")),
+            retries=int(os.getenv("DAILY_PAPER_LLM_RETRIES", "2")),
+            backoff=float(os.getenv("DAILY_PAPER_LLM_BACKOFF", "2")),
+            breaker_failures=int(os.getenv("DAILY_PAPER_LLM_BREAKER_FAILURES", "5")),
+            breaker_cooldown=float(os.getenv("DAILY_PAPER_LLM_BREAKER_COOLDOWN", "300")),
+            max_in_flight=int(os.getenv("DAILY_PAPER_LLM_MAX_IN_FLIGHT", "8")),
+        )
+
+
+class CircuitBreaker:
+    def __init__(self, failures: int, cooldown: float, *, clock: Callable[[], float] = time.monotonic):
+        self.threshold = failures
+        self.cooldown = cooldown
+        self.clock = clock
+        self.consecutive = 0
+        self.opened_at: Optional[float] = None
+        self.trips = 0
+        self._trial = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        return "half_open" if self.clock() - self.opened_at >= self.cooldown else "open"
+
+    def allow(self) -> bool:
+        with self._lock:
+            state = self.state
+            if state == "closed":
+                return True
+            if state == "half_open" and not self._trial:
+                self._trial = True
+                return True
+            return False
+
+    def success(self) -> None:
+        with self._lock:
+            self.consecutive = 0
+            self.opened_at = None
+            self._trial = False
+
+    def failure(self) -> None:
+        with self._lock:
+            self.consecutive += 1
+            if self.threshold > 0 and (self._trial or self.consecutive >= self.threshold):
+                if self.opened_at is None or self._trial:
+                    self.trips += 1
+                self.opened_at = self.clock()
+                self._trial = False
+
+
+class ResilientCaller:
+    def __init__(
+        self,
+        policy: Optional[CallPolicy] = None,
+        *,
+        sleep: Callable[[float], None] = time.sleep,
+        rng: Optional[random.Random] = None,
+        clock: Callable[[], float] = time.monotonic,
+        limiter: Optional[RateLimiter] = None,
+    ):
+        self.policy = policy or CallPolicy()
+        self.breaker = CircuitBreaker(self.policy.breaker_failures, self.policy.breaker_cooldown, clock=clock)
+        self.limiter = limiter
+        self._slots = threading.BoundedSemaphore(max(1, self.policy.max_in_flight))
+        self.sleep = sleep
+        self.rng = rng or random.Random()
+        self.latencies: dict[str, list[float]] = {}
+        self.hedges = 0
+        self.retries = 0
+        self.timeouts = 0
+        self._lock = threading.Lock()
+
+    def hedge_delay(self, kind: str) -> Optional[float]:
+        samples = self.latencies.get(kind) or []
+        if self.policy.hedge_percentile <= 0 or len(samples) < self.policy.hedge_min_samples:
+            return None
+        return percentile(samples, self.policy.hedge_percentile)
+
+    def call(self, kind: str, fn: Callable[..., R], *args: Any) -> R:
+        last: Optional[BaseException] = None
+        for attempt in range(self.policy.retries + 1):
+            if not self.breaker.allow():
+                raise CircuitOpenError(f"LLM circuit open after {self.breaker.consecutive} failures") from last
+            try:
+                result = self._attempt(kind, fn, args)
+            except Exception as e:
+                last = e
+                self.breaker.failure()
+                if attempt < self.policy.retries:
+                    with self._lock:
+                        self.retries += 1
+                    self.sleep(self.rng.uniform(0, self.policy.backoff * 2**attempt))
+                continue
+            self.breaker.success()
+            return result
+        assert last is not None
+        raise last
+
+    def _attempt(self, kind: str, fn: Callable[..., R], args: tuple[Any, ...]) -> R:
+        fut: Future[R] = Future()
+
+        def run(hedge: bool) -> None:
+            try:
+                if hedge and self.limiter is not None:
+                    self.limiter.acquire()
+                value = fn(*args)
+            except BaseException as e:
+                try:
+                    fut.set_exception(e)
+                except InvalidStateError:  # the other copy already answered
+                    pass
+                return
+            finally:
+                self._slots.release()
+            try:
+                fut.set_result(value)
+            except InvalidStateError:
+                pass
+
+        # The timeout clock starts once a slot and a rate-limit turn are held, so waiting
+        # behind other calls is not mistaken for a slow provider.
+        if not self._slots.acquire(timeout=self.policy.timeout):
+            with self._lock:
+                self.timeouts += 1
+            raise CallTimeout(f"{kind} call found no free slot within {self.policy.timeout:.0f}s")
+        try:
+            if self.limiter is not None:
+                self.limiter.acquire()
+        except BaseException:
+            self._slots.release()
+            raise
+        t0 = time.monotonic()
+        threading.Thread(target=run, args=(False,), name=f"llm-{kind}", daemon=True).start()
+        delay = self.hedge_delay(kind)
+        if delay is not None and delay < self.policy.timeout:
+            try:
+                return self._finish(kind, t0, fut.result(timeout=delay))
+            except FutureTimeout:
+                if self._slots.acquire(blocking=False):
+                    with self._lock:
+                        self.hedges += 1
+                    threading.Thread(target=run, args=(True,), name=f"llm-{kind}-hedge", daemon=True).start()
+        remaining = max(0.0, self.policy.timeout - (time.monotonic() - t0))
+        try:
+            return self._finish(kind, t0, fut.result(timeout=remaining))
+        except FutureTimeout:
+            with self._lock:
+                self.timeouts += 1
+            raise CallTimeout(f"{kind} call exceeded {self.policy.timeout:.0f}s") from None
+
+    def _finish(self, kind: str, t0: float, value: R) -> R:
+        with self._lock:
+            self.latencies.setdefault(kind, []).append(time.monotonic() - t0)
+        return value
+
+    def summary(self) -> dict[str, Any]:
+        return {
+            "breaker": self.breaker.state,
+            "breaker_trips": self.breaker.trips,
+            "hedges": self.hedges,
+            "retries": self.retries,
+            "timeouts": self.timeouts,
+        }
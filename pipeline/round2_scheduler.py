@@ -0,0 +1,92 @@
+"""Admission control for round-2 LLM calls under a deadline and a token budget.
+
+Candidates are dispatched best-first. Before each call, `admit()` projects
+
+- finish time: now + the p90 of observed round-2 latencies, or `est_seconds`
+  before any call has finished. A call is admitted only if it would finish by
+  the deadline;
+- cost: tokens spent + expected tokens of the calls in flight and of this one,
+  using the mean observed tokens per call (or `est_tokens`). It must stay within
+  `token_budget`.
+
+Once a call is refused, every remaining candidate is skipped (the caller
+gives them the first-score fallback). Token usage is taken from a result's
+`usage.total_tokens` when the processor reports it, else estimated from text
+length.
+"""
+
+from __future__ import annotations
+
+import math
+import threading
+import time
+from typing import Any, Callable, Optional
+
+from .metrics import percentile
+
+
+def estimate_tokens(*texts: str) -> int:
+    """Rough token count: ~4 UTF-8 bytes per token (CJK lands near 1 per char)."""
+    return sum(math.ceil(len(t.encode("utf-8")) / 4) for t in texts if t)
+
+
+class Round2Scheduler:
+    def __init__(
+        self,
+        *,
+        deadline: Optional[float] = None,
+        token_budget: int = 0,
+        est_seconds: float = 20.0,
+        est_tokens: int = 1500,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.deadline = deadline
+        self.token_budget = max(0, int(token_budget))
+        self.est_seconds = est_seconds
+        self.est_tokens = est_tokens
+        self.clock = clock
+        self.latencies: list[float] = []
+        self.tokens_used = 0
+        self.in_flight = 0
+        self.issued = 0
+        self.skipped = 0
+        self.stop_reason = ""
+        self._lock = threading.Lock()
+
+    def expected_seconds(self) -> float:
+        return percentile(self.latencies, 90) if self.latencies else self.est_seconds
+
+    def expected_tokens(self) -> float:
+        return self.tokens_used / len(self.latencies) if self.latencies else float(self.est_tokens)
+
+    def admit(self) -> bool:
+        with self._lock:
+            if not self.stop_reason:
+                if self.deadline is not None and self.clock() + self.expected_seconds() > self.deadline:
+                    self.stop_reason = "deadline"
+                elif self.token_budget and (
+                    self.tokens_used + (self.in_flight + 1) * self.expected_tokens() > self.token_budget
+                ):
+                    self.stop_reason = "token_budget"
+            if self.stop_reason:
+                self.skipped += 1
+                return False
+            self.in_flight += 1
+            self.issued += 1
+            return True
+
+    def record(self, seconds: float, tokens: int) -> None:
+        with self._lock:
+            self.in_flight -= 1
+            self.latencies.append(seconds)
+            self.tokens_used += tokens
+
+    def summary(self) -> dict[str, Any]:
+        return {
+            "issued": self.issued,
+            "skipped": self.skipped,
+            "stop_reason": self.stop_reason or None,
+            "tokens_used": self.tokens_used,
+            "token_budget": self.token_budget or None,
+            "deadline": self.deadline,
+        }
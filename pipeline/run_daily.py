@@ -1,32 +1,73 @@
 """daily-paper pipeline runner (collect -> score -> curate -> build-site).
 
-This runner is designed for cron execution.
+This runner is designed for cron execution. Stages come from the `stages`
+list in config/pipeline.yaml and checkpoint into .tmp/checkpoints/<date>/;
+`--resume` reuses still-valid checkpoints and `--from-stage NAME` re-runs from
+NAME on (e.g. only `build` after a failed site generation). `--from/--to`
+backfills a date range in parallel worker processes and builds the site once
+at the end. `--replay` re-curates and re-renders recorded days from
+.tmp/score-result-<date>.json (one date, a range, or every recorded day)
+without collection or LLM calls, e.g. to try a new DAILY_PAPER_SCORE_THRESHOLD
+or topic rules.
 
 Outputs (by date):
 - output/YYYY-MM-DD.json  (payload with {date, items})
+- output/archive/           (consolidated, indexed store of all days; see archive.py)
+- output/manifest.json     (content hashes of published artifacts; see manifest.py)
+- output/YYYY-MM-DD.metrics.json  (stage timings, LLM latency, SLA projection; see metrics.py)
 - output/site/*.html      (static site generated by web/generate.js)
+- output/site/feeds/       (Markdown, RSS, Atom and JSON Feed; see render.py)
+- <profile output_dir>/YYYY-MM-DD.json + site/  (per profile in config/profiles.yaml, from the same scores)
 
 Env knobs (optional):
 - DAILY_PAPER_MAX_ITEMS (default 30)
 - DAILY_PAPER_TOPK (default 10)
+- DAILY_PAPER_COLLECT_STREAM (default 0; 1 = collector emits JSON Lines that are scored as they arrive)
+- DAILY_PAPER_PREFILTER (default 0; 1 = rank collected papers locally and score only the top DAILY_PAPER_MAX_ITEMS)
+- DAILY_PAPER_COLLECT_MAX_ITEMS (default DAILY_PAPER_MAX_ITEMS; collector budget, widen it when pre-filtering)
+- DAILY_PAPER_SKIP_PUBLISHED (default 1; drop papers already published on an earlier day before scoring)
+- DAILY_PAPER_COLLECTOR (default node; native = in-process arXiv collector, see collector.py)
+- NEWS_COLLECTOR_ROOT (default /root/.openclaw/workspace/skills/news-collector)
+- DAILY_PAPER_PROM_TEXTFILE (optional path; also export run metrics as a Prometheus textfile)
+- DAILY_PAPER_BACKFILL_WORKERS (default 4; worker processes for --from/--to,
+  each with its own scoring pool and DAILY_PAPER_LLM_RPM budget)
 """
 
-from __future__ import annotations
-
+# NOTE: no `from __future__ import annotations` here: tests load this file
+# standalone (outside the package), and dataclasses cannot resolve string
+# annotations for a module that is not registered in sys.modules.
 import json
 import os
 import subprocess
 import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from contextlib import closing, nullcontext
 from dataclasses import dataclass
-from datetime import date
+from datetime import date, timedelta
 from pathlib import Path
-from typing import Any
+from types import GeneratorType
+from typing import Any, Iterable, Iterator
 
 import yaml
 
-from .curate import normalize_entry
-from .score import score_items
-from .topic_mapper import map_topic
+from pipeline import manifest
+from pipeline.adapters import iter_items
+from pipeline.archive import ArchiveStore
+from pipeline.atomic import atomic_write_json, atomic_write_text
+from pipeline.collector import ArxivCollector
+from pipeline.curate import CurateResult, Curator
+from pipeline.metrics import RunMetrics, load_previous, publish_deadline
+from pipeline.models import PaperItem, normalize_arxiv_id
+from pipeline.prefilter import InterestProfile, prefilter
+from pipeline.profiles import Profile, load_profiles
+from pipeline.published_index import PublishedIndex, file_signature
+from pipeline.render import render_feeds
+from pipeline.score import ScoreSettings, get_processor, score_items
+from pipeline.site_planner import SitePlanner
+from pipeline.stages import CheckpointStore, Stage, StageRunner
+from pipeline.topic_mapper import TopicClassifier
+
+ROOT = Path(__file__).resolve().parents[1]
 
 
 @dataclass
@@ -50,9 +91,15 @@ def default_run_date() -> str:
     return date.today().isoformat()
 
 
+def date_range(start: str, end: str) -> list[str]:
+    first, last = date.fromisoformat(start), date.fromisoformat(end)
+    if last < first:
+        raise ValueError(f"--to {end} is before --from {start}")
+    return [(first + timedelta(days=n)).isoformat() for n in range((last - first).days + 1)]
+
+
 def write_json(path: Path, payload: object) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(payload, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+    atomic_write_json(path, payload)
 
 
 def load_yaml(path: Path) -> dict[str, Any]:
@@ -67,107 +114,532 @@ def run_node_json(
     proc = subprocess.run(cmd, cwd=str(cwd), env=env, text=True, capture_output=True)
     if proc.returncode != 0 and proc.stdout.strip() == "":
         raise RuntimeError(f"command failed: {' '.join(cmd)}\nexit={proc.returncode}\nstderr:\n{proc.stderr}")
-    out_path.write_text(proc.stdout, encoding="utf-8")
+    atomic_write_text(out_path, proc.stdout)
     return json.loads(proc.stdout)
 
 
-def run_daily(run_date: str, *, mode: str = "paper") -> Path:
-    root = Path(__file__).resolve().parents[1]
-    paths = Paths.from_root(root)
+def run_node_jsonl(
+    cmd: list[str],
+    *,
+    cwd: Path,
+    out_path: Path,
+    env: dict[str, str] | None = None,
+    metrics: RunMetrics | None = None,
+) -> Iterator[dict[str, Any]]:
+    """Run a JSON Lines producer and yield one object per line as it arrives.
+
+    The raw stream is teed line by line to `out_path` for auditing. Closing
+    the iterator early (the consumer hit its item budget) terminates the
+    producer, and the tee then holds only the lines read so far. A producer
+    that exits non-zero without any item raises; after some items it only
+    warns, since the day may be truncated. Either way the outcome lands in
+    `metrics.extra["collect_stream"]`.
+    """
+    proc = subprocess.Popen(cmd, cwd=str(cwd), env=env, text=True, stdout=subprocess.PIPE, encoding="utf-8")
+    assert proc.stdout is not None
+    emitted = 0
+    status = "ok"
+    try:
+        with out_path.open("w", encoding="utf-8") as tee:
+            for line in proc.stdout:
+                tee.write(line)
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    obj = json.loads(line)
+                except json.JSONDecodeError:
+                    print(f"[daily-paper] skip malformed collector line: {line[:120]}", file=sys.stderr)
+                    continue
+                if isinstance(obj, dict):
+                    emitted += 1
+                    yield obj
+    except GeneratorExit:
+        status = "stopped"
+        proc.terminate()
+        raise
+    finally:
+        proc.stdout.close()
+        returncode = proc.wait()
+        if status == "ok" and returncode != 0:
+            status = "failed"
+        if metrics is not None:
+            metrics.extra["collect_stream"] = {"status": status, "returncode": returncode, "items": emitted}
+            metrics.count("collect", items_out=emitted)
+    if returncode != 0 and emitted == 0:
+        raise RuntimeError(f"command failed: {' '.join(cmd)}\nexit={returncode}")
+    if returncode != 0:
+        print(
+            f"[daily-paper] WARNING: collector exited {returncode} after {emitted} item(s); the day may be incomplete",
+            file=sys.stderr,
+        )
 
-    paths.output_dir.mkdir(parents=True, exist_ok=True)
-    paths.output_site.mkdir(parents=True, exist_ok=True)
-    paths.tmp_dir.mkdir(parents=True, exist_ok=True)
 
-    _ = load_yaml(root / "config" / "pipeline.yaml")
-    __ = load_yaml(root / "config" / "topics.yaml")
-    ___ = mode
+def build_site(root: Path, mode: str, *, output_dir: Path | None = None, site_dir: Path | None = None) -> None:
+    SitePlanner(root, mode, output_dir=output_dir, site_dir=site_dir).build()
+    render_feeds(root, mode, output_dir=output_dir, site_dir=site_dir)
 
-    # 1) collect (paper_v0)
-    collect_req = {
-        "mode": "paper_v0",
-        "config": {},
-        "run": {
-            "maxItems": int(os.getenv("DAILY_PAPER_MAX_ITEMS", "30")),
-            # Ensure papers match the requested run_date in local timezone.
-            "date": run_date,
-            "timeZone": os.getenv("DAILY_PAPER_TIMEZONE", "Asia/Shanghai"),
-        },
-    }
-    collect_req_path = paths.tmp_dir / f"collect-{run_date}.json"
-    collect_out_path = paths.tmp_dir / f"collect-result-{run_date}.json"
-    write_json(collect_req_path, collect_req)
-
-    # Collect papers using the news-collector skill.
-    # IMPORTANT: run with a stable module resolution so cron never fails with missing deps.
-    collector_root = Path("/root/.openclaw/workspace/skills/news-collector")
-    node_env = os.environ.copy()
-    collector_node_modules = str(collector_root / "node_modules")
-    node_env["NODE_PATH"] = (
-        collector_node_modules
-        + (":" + node_env["NODE_PATH"] if node_env.get("NODE_PATH") else "")
-    )
 
-    collect_result = run_node_json(
-        ["node", "scripts/arxiv_collect.js", "--input", str(collect_req_path)],
-        cwd=collector_root,
-        out_path=collect_out_path,
-        env=node_env,
-    )
+STAGES = ("collect", "score", "curate", "render", "build", "profiles")
+
+
+def build_plan(run_date: str, *, build: bool = True) -> list[str]:
+    """Stages to run for `run_date`, in order, as listed in `config/pipeline.yaml`."""
+    cfg = load_yaml(ROOT / "config" / "pipeline.yaml")
+    plan = [str(x) for x in cfg.get("stages") or STAGES]
+    unknown = [x for x in plan if x not in STAGES]
+    if unknown:
+        raise ValueError(f"unknown stage(s) in pipeline.yaml: {', '.join(unknown)}")
+    if not build:
+        plan = [x for x in plan if x != "build"]
+    if "profiles" not in plan and load_profiles(ROOT):
+        plan.append("profiles")
+    return plan
+
+
+def _read_items(path: Path) -> list[dict[str, Any]]:
+    try:
+        return [x for x in iter_items(path) if isinstance(x, dict)]
+    except ValueError as e:
+        raise RuntimeError(f"payload missing items list: {path}") from e
+
+
+def _read_papers(path: Path) -> list[PaperItem]:
+    return [PaperItem.from_dict(x) for x in _read_items(path)]
+
+
+def pick_items(payload: Any) -> list[Any]:
+    """Items list from a `{items: [...]}` payload (or a bare list)."""
+    if isinstance(payload, dict):
+        payload = payload.get("items")
+    if not isinstance(payload, list):
+        raise RuntimeError("payload missing items list")
+    return payload
+
+
+class DailyRun:
+    """One date's collect -> score -> curate -> render -> build, as checkpointable stages."""
+
+    def __init__(
+        self, run_date: str, *, mode: str = "paper", paths: Paths | None = None, metrics: RunMetrics | None = None
+    ):
+        self.run_date = run_date
+        self.mode = mode
+        self.paths = paths or Paths.from_root(ROOT)
+        self.metrics = metrics or RunMetrics(run_date)
+        self.pipeline_cfg = load_yaml(self.paths.root / "config" / "pipeline.yaml")
+        self.topics_cfg = load_yaml(self.paths.root / "config" / "topics.yaml")
+        self.classifier = TopicClassifier.from_config(self.topics_cfg)
+        self.curator = Curator.from_config(self.pipeline_cfg)
+        self.profiles = load_profiles(self.paths.root)
+        self.build_profile_sites = True
+
+        self.collector = os.getenv("DAILY_PAPER_COLLECTOR", "node")
+        self.stream = os.getenv("DAILY_PAPER_COLLECT_STREAM", "0") == "1"
+        self.max_items = int(os.getenv("DAILY_PAPER_MAX_ITEMS", "30"))
+        self.collect_req = {
+            "mode": "paper_v0",
+            "config": {},
+            "run": {
+                "output": "jsonl" if self.stream else "json",
+                "maxItems": int(os.getenv("DAILY_PAPER_COLLECT_MAX_ITEMS", str(self.max_items))),
+                # Ensure papers match the requested run_date in local timezone.
+                "date": run_date,
+                "timeZone": os.getenv("DAILY_PAPER_TIMEZONE", "Asia/Shanghai"),
+            },
+        }
+        tmp = self.paths.tmp_dir
+        self.collect_req_path = tmp / f"collect-{run_date}.json"
+        self.collect_out_path = tmp / f"collect-result-{run_date}.json"
+        if self.stream:
+            self.collect_out_path = self.collect_out_path.with_suffix(".jsonl")
+        self.score_out_path = tmp / f"score-result-{run_date}.json"
+        self.curate_out_path = tmp / f"curate-result-{run_date}.json"
+        self.out_json = self.paths.output_dir / f"{run_date}.json"
+        self.metrics_json = self.paths.output_dir / f"{run_date}.metrics.json"
+
+    def stages(self, plan: list[str]) -> list[Stage]:
+        score_settings = ScoreSettings.from_env()
+        self.build_profile_sites = "build" in plan
+        specs = {
+            "collect": Stage(
+                "collect",
+                self.collect,
+                save=lambda _: self.collect_out_path,
+                load=lambda path: _read_items(path),  # type: ignore[arg-type]
+                fingerprint={**self.collect_req, "collector": self.collector},
+            ),
+            "score": Stage(
+                "score",
+                self.score,
+                save=lambda items: self._save_items(self.score_out_path, [x.to_dict() for x in items]),
+                load=lambda path: _read_papers(path),  # type: ignore[arg-type]
+                fingerprint={
+                    "settings": score_settings.fingerprint(),
+                    "threshold": os.getenv("DAILY_PAPER_SCORE_THRESHOLD", "85"),
+                    "prefilter": os.getenv("DAILY_PAPER_PREFILTER", "0"),
+                    "skip_published": os.getenv("DAILY_PAPER_SKIP_PUBLISHED", "1"),
+                    "version": os.getenv("DAILY_PAPER_SCORE_VERSION", "v1"),
+                },
+            ),
+            "curate": Stage(
+                "curate",
+                self.curate,
+                save=lambda items: self._save_items(self.curate_out_path, items),
+                load=lambda path: _read_items(path),  # type: ignore[arg-type]
+                fingerprint={
+                    "threshold": os.getenv("DAILY_PAPER_SCORE_THRESHOLD", "85"),
+                    "topics": self.topics_cfg,
+                    "quality_gates": self.pipeline_cfg.get("quality_gates"),
+                },
+            ),
+            "render": Stage("render", self.render, save=lambda path: path, load=lambda path: path),
+            "build": Stage("build", self.build, fingerprint={"mode": self.mode}),
+            "profiles": Stage(
+                "profiles",
+                self.run_profiles,
+                fingerprint={
+                    "profiles": [vars(p) for p in self.profiles],
+                    "topics": {p.topics: load_yaml(self.paths.root / p.topics) for p in self.profiles},
+                    "threshold": os.getenv("DAILY_PAPER_SCORE_THRESHOLD", "85"),
+                    "build": self.build_profile_sites,
+                },
+            ),
+        }
+        return [specs[name] for name in plan]
+
+    def _save_items(self, path: Path, items: list[dict[str, Any]]) -> Path:
+        write_json(path, {"date": self.run_date, "items": items})
+        return path
 
-    collected_items = collect_result.get("items") or []
-    if not isinstance(collected_items, list):
-        raise RuntimeError("collector output missing items list")
+    # 1) collect (paper_v0)
+    def collect(self, _: Any) -> Iterable[dict[str, Any]]:
+        write_json(self.collect_req_path, self.collect_req)
+
+        if self.collector == "native":
+            collector = ArxivCollector.from_env(self.paths.tmp_dir)
+            collected_items = collector.collect(
+                self.run_date, time_zone=self.collect_req["run"]["timeZone"], max_items=self.collect_req["run"]["maxItems"]
+            )
+            self.metrics.extra["collect_shards"] = collector.shards
+            degraded = sorted(cat for cat, r in collector.shards.items() if r["status"] != "ok")
+            if degraded:
+                print(f"[daily-paper] WARNING: collect shard(s) degraded: {', '.join(degraded)}", file=sys.stderr)
+            if self.collect_out_path.suffix == ".jsonl":
+                atomic_write_text(
+                    self.collect_out_path, "".join(json.dumps(x, ensure_ascii=False) + "\n" for x in collected_items)
+                )
+            else:
+                write_json(self.collect_out_path, {"items": collected_items})
+            self.metrics.count("collect", items_out=len(collected_items))
+            return collected_items
+
+        # Collect papers using the news-collector skill.
+        # IMPORTANT: run with a stable module resolution so cron never fails with missing deps.
+        collector_root = Path(os.getenv("NEWS_COLLECTOR_ROOT", "/root/.openclaw/workspace/skills/news-collector"))
+        node_env = os.environ.copy()
+        collector_node_modules = str(collector_root / "node_modules")
+        node_env["NODE_PATH"] = (
+            collector_node_modules
+            + (":" + node_env["NODE_PATH"] if node_env.get("NODE_PATH") else "")
+        )
 
-    # 2) score (LLM top-k)
-    scored = score_items(collected_items)
+        collect_cmd = ["node", "scripts/arxiv_collect.js", "--input", str(self.collect_req_path)]
+        if self.stream:
+            # Items flow straight into scoring; the raw stream lands in collect-result-*.jsonl.
+            return run_node_jsonl(
+                collect_cmd, cwd=collector_root, out_path=self.collect_out_path, env=node_env, metrics=self.metrics
+            )
+
+        collect_result = run_node_json(collect_cmd, cwd=collector_root, out_path=self.collect_out_path, env=node_env)
+        collected_items = collect_result.get("items") or []
+        if not isinstance(collected_items, list):
+            raise RuntimeError("collector output missing items list")
+        self.metrics.count("collect", items_out=len(collected_items))
+        return collected_items
+
+    # 2) score (LLM top-k), skipping papers earlier days already shipped
+    def score(self, collected_items: Iterable[dict[str, Any]]) -> list[PaperItem]:
+        # A streaming collector may still be running when max_items is reached: stop it.
+        stream = closing(collected_items) if isinstance(collected_items, GeneratorType) else nullcontext()
+        with stream, PublishedIndex(self.paths.tmp_dir / "published.sqlite3") as published_index:
+            published_index.sync(self.paths.output_dir)
+            skip_published = os.getenv("DAILY_PAPER_SKIP_PUBLISHED", "1") == "1"
+            published = published_index.before(self.run_date) if skip_published else None
+
+            # Local pre-filter: rank every candidate, keep the LLM budget's worth. Already-published
+            # papers go first: the profile is built from them, so re-listings would take the top slots.
+            if os.getenv("DAILY_PAPER_PREFILTER", "0") == "1":
+                candidates = [PaperItem.from_dict(x) for x in collected_items]
+                fresh = [x for x in candidates if published is None or normalize_arxiv_id(x.arxiv_id) not in published]
+                profile = InterestProfile.from_archive(self.paths.output_dir)
+                collected_items = prefilter(fresh, profile, self.max_items)
+                self.metrics.count("prefilter", items_in=len(candidates), items_out=len(collected_items))
+                print(
+                    f"[daily-paper] prefilter: {len(candidates)} -> {len(collected_items)} candidates "
+                    f"({len(candidates) - len(fresh)} published on earlier days)"
+                )
+
+            scored = score_items(collected_items, published=published, metrics=self.metrics)
+        self.metrics.count("score", items_out=len(scored))
+        return scored
 
     # 3) map topic + normalize
-    normalized_items: list[dict[str, Any]] = []
-    for item in scored:
-        try:
-            item = dict(item)
-            item["topic"] = item.get("topic") or map_topic(item)
-            # add urls if missing
-            arxiv_id = (item.get("arxiv_id") or "").strip()
-            if arxiv_id:
-                item.setdefault("abs_url", f"https://arxiv.org/abs/{arxiv_id}")
-                item.setdefault("pdf_url", f"https://arxiv.org/pdf/{arxiv_id}.pdf")
-            normalized = normalize_entry(item)
-            if normalized:
-                normalized_items.append(normalized)
-        except Exception:
-            continue
+    def curate(self, scored: list[PaperItem]) -> list[dict[str, Any]]:
+        normalized_items, rejections = curate_items(scored, self.classifier, self.curator)
+        for reason, n in sorted(rejections.items()):
+            self.metrics.reject(reason, n)
+        self.metrics.count("curate", items_in=len(scored), items_out=len(normalized_items))
+        return normalized_items
+
+    # 4) write the day's JSON (the site generator's input)
+    def render(self, normalized_items: list[dict[str, Any]]) -> Path:
+        write_json(self.out_json, {"date": self.run_date, "items": normalized_items})
+        with PublishedIndex(self.paths.tmp_dir / "published.sqlite3") as published_index:
+            published_index.record_day(self.run_date, normalized_items, signature=file_signature(self.out_json))
+        with ArchiveStore(self.paths.output_dir / "archive") as archive:
+            archive.put_day(self.run_date, normalized_items, signature=file_signature(self.out_json))
+        return self.out_json
+
+    # 5) build site
+    def build(self, out_json: Path) -> Path:
+        build_site(self.paths.root, self.mode)
+        return out_json
+
+    # 6) extra profiles: re-curate the shared scored items per profile, in parallel
+    def run_profiles(self, _: Any) -> list[Path]:
+        scored = _read_papers(self.score_out_path)
+        with ThreadPoolExecutor(max_workers=max(1, len(self.profiles))) as pool:
+            return list(pool.map(lambda profile: self._run_profile(profile, scored), self.profiles))
+
+    def _run_profile(self, profile: Profile, scored: list[PaperItem]) -> Path:
+        classifier = TopicClassifier.from_file(self.paths.root / profile.topics)
+        curator = Curator.from_config(self.pipeline_cfg, threshold=profile.score_threshold)
+        items, rejected = curate_items(scored, classifier, curator)
+        out_json = profile.output_path(self.paths.root) / f"{self.run_date}.json"
+        write_json(out_json, {"date": self.run_date, "items": items})
+        self.metrics.count(f"profile.{profile.name}", items_in=len(scored), items_out=len(items))
+        self.metrics.extra.setdefault("profile_rejections", {})[profile.name] = dict(rejected)
+        if self.build_profile_sites:
+            build_site(
+                self.paths.root,
+                profile.mode,
+                output_dir=profile.output_path(self.paths.root),
+                site_dir=profile.site_path(self.paths.root),
+            )
+        print(f"[daily-paper] profile {profile.name}: {len(items)} item(s) -> {out_json}")
+        return out_json
+
+
+def curate_items(scored: list[PaperItem], classifier: TopicClassifier, curator: Curator) -> CurateResult:
+    """Map topics for the whole batch, then run it through the curator's gates."""
+    return curator.curate(scored, classifier.classify_many(scored))
+
+
+def run_daily(
+    run_date: str,
+    *,
+    mode: str = "paper",
+    build: bool = True,
+    resume: bool = False,
+    from_stage: str | None = None,
+) -> Path:
+    paths = Paths.from_root(ROOT)
 
-    payload = {"date": run_date, "items": normalized_items}
+    paths.output_dir.mkdir(parents=True, exist_ok=True)
+    paths.output_site.mkdir(parents=True, exist_ok=True)
+    paths.tmp_dir.mkdir(parents=True, exist_ok=True)
 
-    out_json = paths.output_dir / f"{run_date}.json"
-    write_json(out_json, payload)
+    plan = build_plan(run_date, build=build)
+    pipeline_cfg = load_yaml(paths.root / "config" / "pipeline.yaml")
+    metrics = RunMetrics(
+        run_date,
+        plan=plan,
+        deadline=publish_deadline(run_date, pipeline_cfg),
+        previous=load_previous(paths.output_dir, run_date),
+    )
+    run = DailyRun(run_date, mode=mode, paths=paths, metrics=metrics)
+    runner = StageRunner(
+        CheckpointStore(paths.tmp_dir / "checkpoints", run_date),
+        resume=resume,
+        from_stage=from_stage,
+        timer=metrics.stage,
+    )
+    try:
+        runner.run(run.stages(plan))
+    except Exception as e:
+        metrics.write(run.metrics_json, status="failed", error=str(e))
+        raise
+    report = metrics.write(run.metrics_json)
+    manifest.update(paths.root)
+    if report["sla"]["at_risk"] or report["sla"]["missed"]:
+        print(f"[daily-paper] WARNING: publish SLA at risk (deadline {report['sla']['deadline']})", file=sys.stderr)
+    return run.out_json
 
-    # 4) build site
-    subprocess.run(["node", "web/generate.js", "--mode", mode], cwd=str(root), check=True)
 
-    return out_json
+def _warm_worker() -> None:
+    try:
+        get_processor()
+    except Exception as e:  # the run itself will surface a real failure
+        print(f"[daily-paper] worker warm-up failed: {e}", file=sys.stderr)
+
+
+def backfill(start: str, end: str, *, mode: str = "paper", workers: int | None = None) -> list[Path]:
+    """Run collect/score/curate for every date in [start, end], then build the site once.
+
+    Each worker process builds one `ContentProcessor` at startup and reuses it
+    for every date it is handed. Failed dates are reported and skipped.
+    """
+    dates = date_range(start, end)
+    if workers is None:
+        workers = int(os.getenv("DAILY_PAPER_BACKFILL_WORKERS", "4"))
+    workers = max(1, min(workers, len(dates)))
+
+    written: list[Path] = []
+    failed: list[str] = []
+    with ProcessPoolExecutor(max_workers=workers, initializer=_warm_worker) as pool:
+        futures = {pool.submit(run_daily, d, mode=mode, build=False): d for d in dates}
+        for done, fut in enumerate(as_completed(futures), start=1):
+            run_date = futures[fut]
+            try:
+                written.append(fut.result())
+                print(f"[daily-paper] backfill {done}/{len(dates)} {run_date}: OK")
+            except Exception as e:
+                failed.append(run_date)
+                print(f"[daily-paper] backfill {done}/{len(dates)} {run_date}: FAILED: {e}", file=sys.stderr)
+
+    if written:
+        build_site(ROOT, mode)
+        for profile in load_profiles(ROOT):
+            build_site(ROOT, profile.mode, output_dir=profile.output_path(ROOT), site_dir=profile.site_path(ROOT))
+        manifest.update(ROOT)
+    if failed:
+        raise RuntimeError(f"backfill failed for {len(failed)} date(s): {', '.join(sorted(failed))}")
+    return sorted(written)
+
+
+def recorded_dates(paths: Paths) -> list[str]:
+    """Dates with a recorded scorer output in .tmp/."""
+    prefix = "score-result-"
+    return sorted(p.stem[len(prefix):] for p in paths.tmp_dir.glob(f"{prefix}????-??-??.json"))
+
+
+def replay(
+    dates: list[str] | None = None, *, mode: str = "paper", build: bool = True, paths: Paths | None = None
+) -> list[Path]:
+    """Re-run topic mapping, curation and rendering from recorded outputs.
+
+    Reads each date's recorded scores (streamed, never loaded whole) and
+    rewrites its day JSON and profile outputs; nothing is collected or scored.
+    `dates=None` replays every recorded day. Dates without recorded scores are
+    reported and skipped. The site is built once at the end.
+    """
+    paths = paths or Paths.from_root(ROOT)
+    recorded = recorded_dates(paths)
+    written: list[Path] = []
+    for run_date in recorded if dates is None else dates:
+        run = DailyRun(run_date, mode=mode, paths=paths)
+        if not run.score_out_path.exists():
+            print(f"[daily-paper] replay {run_date}: no recorded scores, skipped", file=sys.stderr)
+            continue
+        run.build_profile_sites = False
+        recorded_collect = [p for p in (run.collect_out_path, run.collect_out_path.with_suffix(".jsonl")) if p.exists()]
+        n_collected = sum(1 for _ in iter_items(recorded_collect[0])) if recorded_collect else "?"
+        scored = _read_papers(run.score_out_path)
+        kept = run.curate(scored)
+        written.append(run.render(kept))
+        if run.profiles:
+            run.run_profiles(None)
+        print(f"[daily-paper] replay {run_date}: collected {n_collected}, scored {len(scored)}, kept {len(kept)}")
+
+    if written and build:
+        build_site(paths.root, mode)
+        for profile in load_profiles(paths.root):
+            build_site(
+                paths.root,
+                profile.mode,
+                output_dir=profile.output_path(paths.root),
+                site_dir=profile.site_path(paths.root),
+            )
+    if written:
+        manifest.update(paths.root)
+    return written
 
 
 def main(argv: list[str]) -> int:
     run_date = default_run_date()
     mode = "paper"
+    date_from: str | None = None
+    date_to: str | None = None
+    workers: int | None = None
+    resume = False
+    from_stage: str | None = None
+    replay_mode = False
+    build = True
+    explicit_date = False
 
     i = 0
     while i < len(argv):
         token = argv[i]
         if token == "--date":
             run_date = argv[i + 1]
+            explicit_date = True
             i += 2
             continue
         if token == "--mode":
             mode = argv[i + 1]
             i += 2
             continue
+        if token == "--from":
+            date_from = argv[i + 1]
+            i += 2
+            continue
+        if token == "--to":
+            date_to = argv[i + 1]
+            i += 2
+            continue
+        if token == "--workers":
+            workers = int(argv[i + 1])
+            i += 2
+            continue
+        if token == "--resume":
+            resume = True
+            i += 1
+            continue
+        if token == "--from-stage":
+            from_stage = argv[i + 1]
+            i += 2
+            continue
+        if token == "--replay":
+            replay_mode = True
+            i += 1
+            continue
+        if token == "--no-build":
+            build = False
+            i += 1
+            continue
+        if token == "--no-cache":
+            # Skip score-cache lookups (fresh LLM calls) but keep refreshing entries.
+            os.environ["DAILY_PAPER_SCORE_CACHE_BYPASS"] = "1"
+            i += 1
+            continue
         i += 1
 
-    out_json = run_daily(run_date, mode=mode)
+    if replay_mode:
+        if date_from or date_to:
+            dates: list[str] | None = date_range(date_from or run_date, date_to or run_date)
+        else:
+            dates = [run_date] if explicit_date else None
+        written = replay(dates, mode=mode, build=build)
+        print(f"[daily-paper] OK: replayed {len(written)} date(s)")
+        return 0
+
+    if date_from or date_to:
+        written = backfill(date_from or run_date, date_to or run_date, mode=mode, workers=workers)
+        print(f"[daily-paper] OK: backfilled {len(written)} date(s)")
+        return 0
+
+    out_json = run_daily(run_date, mode=mode, build=build, resume=resume, from_stage=from_stage)
     print(f"[daily-paper] OK: {out_json}")
     return 0
 
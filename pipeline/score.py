@@ -11,115 +11,435 @@ To keep runtime/cost bounded for daily cron:
 Env knobs:
 - DAILY_PAPER_MAX_ITEMS (default 30)
 - DAILY_PAPER_TOPK (default 10)
+- DAILY_PAPER_SCORE_CONCURRENCY (default 4; 1 = serial)
+- DAILY_PAPER_LLM_RPM (default 0 = no requests-per-minute limit)
+- DAILY_REPORT_ROOT (default /root/.openclaw/workspace/projects/daily-report)
+- DAILY_PAPER_ROUND1_BATCH_SIZE (default 1 = one request per paper; >1 packs papers per round-1 request)
+- DAILY_PAPER_ROUND1_BATCH_METHOD (default unset; processor method taking one prompt string and returning
+  the reply text; batching stays off until it is set)
+- DAILY_PAPER_ROUND2_TOKEN_BUDGET (default 0 = unlimited; tokens round 2 may spend per run)
+- DAILY_PAPER_ROUND2_MAX_SECONDS (default 0 = unlimited; wall-time budget for round 2)
+- DAILY_PAPER_ROUND2_RESERVE_SECONDS (default 300; kept free before the SLA deadline for curate/render/build)
+- DAILY_PAPER_ROUND2_EST_SECONDS (default 20; assumed round-2 latency until calls have been observed)
+- DAILY_PAPER_ROUND1_ABSTRACT_TOKENS (default 250; abstract budget per round-1 prompt, 0 = first 3000 chars)
+- DAILY_PAPER_ROUND2_ABSTRACT_TOKENS (default 400; abstract budget per round-2 prompt, 0 = first 2000 chars)
+
+Abstracts over budget are compressed to their most informative sentences
+before each call (see `compress`).
+
+Round-2 candidates are dispatched best first and stop once the projected
+finish or token spend would exceed those limits (see `round2_scheduler`);
+skipped candidates keep their first_score and get no zh summary. A run that
+starts too late to meet the SLA deadline ignores it rather than skip them all.
+
+Scores are memoized in `.tmp/score-cache.sqlite3` (see `score_cache` for knobs).
 """
 
 from __future__ import annotations
 
 import os
-import re
 import sys
-from typing import Any
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from itertools import islice
+from typing import Any, Callable, Container, Iterable, Iterator, Optional
+
+from .batch_score import ROUND1_BATCH, build_batch_prompt, parse_batch_scores, resolve_completion
+from .compress import Compressor, default_compressor
+from .concurrency import RateLimiter, ScoringEngine
+from .metrics import RunMetrics
+from .models import PaperItem, extract_arxiv_id, normalize_arxiv_id  # noqa: F401 (re-exported)
+from .resilience import CallPolicy, CircuitOpenError, ResilientCaller
+from .round2_scheduler import Round2Scheduler, estimate_tokens
+from .score_cache import MISS, ScoreCache
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+DAILY_REPORT_ROOT = os.getenv("DAILY_REPORT_ROOT", "/root/.openclaw/workspace/projects/daily-report")
 
 
 def _ensure_daily_report_import() -> None:
-    sys.path.insert(0, "/root/.openclaw/workspace/projects/daily-report/pipeline")
-
-
-_ARXIV_ID_RE = re.compile(r"(\d{4}\.\d{4,5}(?:v\d+)?)")
-
-
-def extract_arxiv_id(item: dict[str, Any]) -> str:
-    for key in ("arxiv_id", "id", "url", "abs_url", "pdf_url"):
-        val = item.get(key)
-        if not val:
-            continue
-        s = str(val)
-        m = _ARXIV_ID_RE.search(s)
-        if m:
-            return m.group(1)
-    return ""
-
-
-def score_items(collected_items: list[dict[str, Any]]) -> list[dict[str, Any]]:
-    _ensure_daily_report_import()
-
-    from core.processors import ContentProcessor  # type: ignore
-    from core.utils import smooth_score  # type: ignore
-
-    # daily-report internals expect cwd at project root.
-    os.chdir("/root/.openclaw/workspace/projects/daily-report")
-
-    # daily-paper wants a stricter default threshold than daily-report.
-    # NOTE: ContentProcessor reads SCORE_THRESHOLD at init time.
-    paper_threshold = int(os.getenv("DAILY_PAPER_SCORE_THRESHOLD", "85"))
-    os.environ["SCORE_THRESHOLD"] = str(paper_threshold)
-
-    processor = ContentProcessor()
-
-    max_items = int(os.getenv("DAILY_PAPER_MAX_ITEMS", "30"))
-    topk = int(os.getenv("DAILY_PAPER_TOPK", "10"))
-
-    items = collected_items[: max(0, max_items)]
-
-    scored_stage1: list[dict[str, Any]] = []
-    for item in items:
-        title = str(item.get("title") or "").strip()
-        abstract = str(item.get("abstract") or "").strip()
-        source = str(item.get("source") or "arxiv")
-        if not title:
-            continue
-        r1 = processor.score_article_first_round(title, abstract[:3000], source)
-        enriched = dict(item)
-        enriched["arxiv_id"] = extract_arxiv_id(enriched)
-        enriched["first_score"] = int(r1)
-        scored_stage1.append(enriched)
-
-    # pick candidates for round-2
-    # NOTE: round-2 is used to generate structured zh summary; do NOT couple it to the final display threshold.
-    round2_min_first = int(os.getenv("DAILY_PAPER_ROUND2_MIN_FIRST_SCORE", "50"))
-    candidates = [x for x in scored_stage1 if int(x.get("first_score") or 0) >= round2_min_first]
-    candidates.sort(key=lambda x: int(x.get("first_score") or 0), reverse=True)
-    candidates = candidates[: max(0, topk)]
-
-    # Fallback: if nothing passes the min, still score top-k to avoid empty outputs.
-    if not candidates:
-        candidates = sorted(scored_stage1, key=lambda x: int(x.get("first_score") or 0), reverse=True)[: max(0, topk)]
-
-    # build lookup for which items get round2
-    round2_ids = set()
-    for x in candidates:
-        # Prefer arxiv_id, fallback to id/url
-        round2_ids.add(x.get("arxiv_id") or x.get("id") or x.get("url"))
-
-    out: list[dict[str, Any]] = []
-    for item in scored_stage1:
-        key = item.get("arxiv_id") or item.get("id") or item.get("url")
-        if key in round2_ids:
-            title = str(item.get("title") or "").strip()
-            abstract = str(item.get("abstract") or "").strip()
-            source = str(item.get("source") or "arxiv")
-
-            r2 = processor.score_article(title, abstract[:2000] or title, source)
-            if not isinstance(r2, dict):
-                # fallback
-                item["score"] = int(item.get("first_score") or 0)
-                item["translated_zh"] = ""
-                out.append(item)
+    sys.path.insert(0, os.path.join(DAILY_REPORT_ROOT, "pipeline"))
+
+
+_PROCESSOR: Optional[tuple[Any, Callable[[int, int], Any]]] = None
+
+
+def get_processor() -> tuple[Any, Callable[[int, int], Any]]:
+    """Return daily-report's (ContentProcessor, smooth_score), built once per process.
+
+    Long-lived callers (backfill workers) call this up front so every run reuses
+    the same warm processor.
+    """
+    global _PROCESSOR
+    if _PROCESSOR is None:
+        _ensure_daily_report_import()
+
+        from core.processors import ContentProcessor  # type: ignore
+        from core.utils import smooth_score  # type: ignore
+
+        # daily-report internals expect cwd at project root.
+        os.chdir(DAILY_REPORT_ROOT)
+
+        # daily-paper wants a stricter default threshold than daily-report.
+        # NOTE: ContentProcessor reads SCORE_THRESHOLD at init time.
+        paper_threshold = int(os.getenv("DAILY_PAPER_SCORE_THRESHOLD", "85"))
+        os.environ["SCORE_THRESHOLD"] = str(paper_threshold)
+
+        _PROCESSOR = (ContentProcessor(), smooth_score)
+    return _PROCESSOR
+
+
+@dataclass
+class ScoreSettings:
+    max_items: int = 30
+    topk: int = 10
+    round2_min_first: int = 50
+    concurrency: int = 4
+    rpm: float = 0.0
+    round1_batch_size: int = 1
+    round1_batch_method: str = ""
+    round2_token_budget: int = 0
+    round2_max_seconds: float = 0.0
+    round2_reserve_seconds: float = 300.0
+    round2_est_seconds: float = 20.0
+    round1_abstract_tokens: int = 250
+    round2_abstract_tokens: int = 400
+
+    @staticmethod
+    def from_env() -> "ScoreSettings":
+        return ScoreSettings(
+            max_items=int(os.getenv("DAILY_PAPER_MAX_ITEMS", "30")),
+            topk=int(os.getenv("DAILY_PAPER_TOPK", "10")),
+            round2_min_first=int(os.getenv("DAILY_PAPER_ROUND2_MIN_FIRST_SCORE", "50")),
+            concurrency=int(os.getenv("DAILY_PAPER_SCORE_CONCURRENCY", "4")),
+            rpm=float(os.getenv("DAILY_PAPER_LLM_RPM", "0")),
+            round1_batch_size=int(os.getenv("DAILY_PAPER_ROUND1_BATCH_SIZE", "1")),
+            round1_batch_method=os.getenv("DAILY_PAPER_ROUND1_BATCH_METHOD", "").strip(),
+            round2_token_budget=int(os.getenv("DAILY_PAPER_ROUND2_TOKEN_BUDGET", "0")),
+            round2_max_seconds=float(os.getenv("DAILY_PAPER_ROUND2_MAX_SECONDS", "0")),
+            round2_reserve_seconds=float(os.getenv("DAILY_PAPER_ROUND2_RESERVE_SECONDS", "300")),
+            round2_est_seconds=float(os.getenv("DAILY_PAPER_ROUND2_EST_SECONDS", "20")),
+            round1_abstract_tokens=int(os.getenv("DAILY_PAPER_ROUND1_ABSTRACT_TOKENS", "250")),
+            round2_abstract_tokens=int(os.getenv("DAILY_PAPER_ROUND2_ABSTRACT_TOKENS", "400")),
+        )
+
+    def fingerprint(self) -> dict[str, Any]:
+        """Settings that change which papers are scored or what the prompts say.
+
+        Throughput and wall-clock knobs (concurrency, RPM, round-2 time budgets)
+        are left out, so retuning them keeps score checkpoints valid.
+        """
+        return {
+            "max_items": self.max_items,
+            "topk": self.topk,
+            "round2_min_first": self.round2_min_first,
+            "round1_batch_size": self.round1_batch_size,
+            "round1_batch_method": self.round1_batch_method,
+            "round2_token_budget": self.round2_token_budget,
+            "round1_abstract_tokens": self.round1_abstract_tokens,
+            "round2_abstract_tokens": self.round2_abstract_tokens,
+        }
+
+    def round2_deadline(self, sla_deadline: Optional[float], now: float) -> Optional[float]:
+        """Epoch seconds by which round-2 calls must finish, or None for no limit.
+
+        An SLA limit that leaves no time for even one call (a run started late,
+        e.g. a re-run or a catch-up slot) is dropped: the SLA is lost either way,
+        and skipping every candidate would publish an empty day.
+        """
+        limits = []
+        if sla_deadline is not None and not self.sla_passed(sla_deadline, now):
+            limits.append(sla_deadline - self.round2_reserve_seconds)
+        if self.round2_max_seconds > 0:
+            limits.append(now + self.round2_max_seconds)
+        return min(limits) if limits else None
+
+    def sla_passed(self, sla_deadline: float, now: float) -> bool:
+        return now + self.round2_est_seconds > sla_deadline - self.round2_reserve_seconds
+
+
+def score_items(
+    collected_items: Iterable[PaperItem | dict[str, Any]],
+    *,
+    cache: Optional[ScoreCache] = None,
+    published: Optional[Container[str]] = None,
+    metrics: Optional[RunMetrics] = None,
+    backend: Optional[tuple[Any, Callable[[int, int], Any]]] = None,
+    settings: Optional[ScoreSettings] = None,
+    caller: Optional[ResilientCaller] = None,
+    compressor: Optional[Compressor] = None,
+    complete: Optional[Callable[[str], Any]] = None,
+) -> list[PaperItem]:
+    """Score collected papers (round 1 for all, round 2 for the top-K).
+
+    Collector dicts are converted to `PaperItem`s once; `PaperItem`s (e.g.
+    from a checkpoint) are scored in place.
+
+    `published` holds arXiv IDs already shipped on earlier days (see
+    `published_index`); those papers are dropped before any LLM call.
+    `metrics` (optional) receives per-round LLM latencies and item counts.
+    `backend` is a (processor, smooth_score) pair and defaults to
+    `get_processor()`; `settings` defaults to `ScoreSettings.from_env()`.
+    `caller` wraps every LLM call with timeouts, hedging, retries and a circuit
+    breaker (see `resilience`); when round 2 fails or the breaker is open, the
+    paper keeps its first-round score, and a paper whose round-1 call fails is
+    dropped (counted as a `round1_failed` rejection). `compressor` (default: keyword hints
+    from config/topics.yaml) fits each abstract to the round's token budget.
+    `complete` (prompt -> reply text) enables batched round 1 when
+    `settings.round1_batch_size > 1`; it defaults to the processor method named
+    by `settings.round1_batch_method`.
+    """
+    processor, smooth_score = backend or get_processor()
+
+    settings = settings or ScoreSettings.from_env()
+    metrics = metrics or RunMetrics()
+    caller = caller or ResilientCaller(CallPolicy.from_env())
+    if caller.limiter is None:
+        # The RPM limit is applied per attempt (retries and hedges included), not per task.
+        caller.limiter = RateLimiter(settings.rpm)
+    compressor = compressor or default_compressor()
+    compression_before = compressor.summary()
+    owns_cache = cache is None
+    if cache is None:
+        cache = ScoreCache.from_env(ROOT / ".tmp")
+
+    def round1_text(item: PaperItem) -> tuple[str, str, str]:
+        if settings.round1_abstract_tokens <= 0:
+            return item.title, item.abstract[:3000], item.source
+        text = compressor.compress(item.arxiv_id, item.title, item.abstract, settings.round1_abstract_tokens)
+        return item.title, text, item.source
+
+    def round2_text(item: PaperItem) -> tuple[str, str, str]:
+        if settings.round2_abstract_tokens <= 0:
+            return item.title, item.abstract[:2000] or item.title, item.source
+        text = compressor.compress(item.arxiv_id, item.title, item.abstract, settings.round2_abstract_tokens)
+        return item.title, text or item.title, item.source
+
+    round1_failed: list[PaperItem] = []
+
+    def first_round(item: PaperItem) -> None:
+        title, text, source = round1_text(item)
+        try:
+            with metrics.llm_call("round1"):
+                r1 = int(caller.call("round1", processor.score_article_first_round, title, text, source))
+        except CircuitOpenError:
+            round1_failed.append(item)
+            return
+        except Exception as e:
+            print(f"[daily-paper] round 1 failed for {item.arxiv_id}: {e}", file=sys.stderr)
+            round1_failed.append(item)
+            return
+        # In batch mode this is a fallback: cache it where batch-mode lookups read.
+        cache.put(round1_kind, item.arxiv_id, title, text, r1)
+        item.first_score = r1
+
+    def first_round_batch(batch: list[PaperItem]) -> list[PaperItem]:
+        """Score a batch in one request; return the items that still need a single call."""
+        papers = [round1_text(item)[:2] for item in batch]
+        try:
+            with metrics.llm_call("round1_batch"):
+                reply = caller.call("round1_batch", complete, build_batch_prompt(papers))
+        except Exception as e:
+            print(f"[daily-paper] round-1 batch failed, falling back to single calls: {e}", file=sys.stderr)
+            return batch
+        missed = []
+        for item, (title, text), r1 in zip(batch, papers, parse_batch_scores(reply, len(batch))):
+            if r1 is None:
+                missed.append(item)
                 continue
+            cache.put(ROUND1_BATCH, item.arxiv_id, title, text, r1)
+            item.first_score = r1
+        return missed
+
+    def cached_second_round(item: PaperItem) -> Any:
+        title, text, _ = round2_text(item)
+        return cache.get("round2", item.arxiv_id, title, text)
+
+    def second_round(item: PaperItem, scheduler: Round2Scheduler) -> Any:
+        title, text, source = round2_text(item)
+        t0 = time.perf_counter()
+        r2: Any = None
+        try:
+            with metrics.llm_call("round2"):
+                r2 = caller.call("round2", processor.score_article, title, text, source)
+        except CircuitOpenError:
+            return None
+        except Exception as e:
+            print(f"[daily-paper] round 2 failed for {item.arxiv_id}: {e}", file=sys.stderr)
+            return None
+        finally:
+            scheduler.record(time.perf_counter() - t0, _round2_tokens(title, text, r2))
+        if isinstance(r2, dict):
+            cache.put("round2", item.arxiv_id, title, text, r2)
+        return r2
+
+    if settings.round1_batch_size <= 1:
+        complete = None
+    elif complete is None:
+        complete = resolve_completion(processor, settings.round1_batch_method)
+        if complete is None:
+            print(
+                "[daily-paper] DAILY_PAPER_ROUND1_BATCH_SIZE>1 but no DAILY_PAPER_ROUND1_BATCH_METHOD; "
+                "round 1 stays single-item",
+                file=sys.stderr,
+            )
+    # Batch and single prompts differ, so their scores are cached apart.
+    round1_kind = "round1" if complete is None else ROUND1_BATCH
+
+    skipped_published = 0
+
+    def unpublished(stream: Iterable[PaperItem | dict[str, Any]]) -> Iterator[PaperItem]:
+        # Drop already-shipped papers before the max_items budget is applied.
+        nonlocal skipped_published
+        for raw in stream:
+            item = PaperItem.coerce(raw)
+            if published is not None and normalize_arxiv_id(item.arxiv_id) in published:
+                skipped_published += 1
+                continue
+            yield item
+
+    scored_stage1: list[PaperItem] = []
+    with ScoringEngine(settings.concurrency) as engine:
+        # Submit round-1 work as items arrive so a streaming collector overlaps with scoring.
+        single_futures = []
+        batch_futures = []
+        batch: list[PaperItem] = []
+        for item in islice(unpublished(collected_items), max(0, settings.max_items)):
+            if not item.title:
+                continue
+            scored_stage1.append(item)
+            title, text, _ = round1_text(item)
+            r1 = cache.get(round1_kind, item.arxiv_id, title, text)
+            if r1 is not MISS:
+                item.first_score = int(r1)
+            elif complete is None:
+                single_futures.append(engine.submit(first_round, item))
+            else:
+                batch.append(item)
+                if len(batch) >= settings.round1_batch_size:
+                    batch_futures.append(engine.submit(first_round_batch, batch))
+                    batch = []
+        if batch:
+            batch_futures.append(engine.submit(first_round_batch, batch))
+
+        missed = [item for f in batch_futures for item in f.result()]
+        single_futures.extend(engine.submit(first_round, item) for item in missed)
+        for f in single_futures:
+            f.result()
+        if round1_failed:
+            # Unscored papers are dropped: the rest of the day still ships.
+            failed = {id(x) for x in round1_failed}
+            scored_stage1 = [x for x in scored_stage1 if id(x) not in failed]
+            print(f"[daily-paper] round 1 failed for {len(failed)} paper(s); dropped from today's run", file=sys.stderr)
+
+        # pick candidates for round-2
+        # NOTE: round-2 is used to generate structured zh summary; do NOT couple it to the final display threshold.
+        candidates = [x for x in scored_stage1 if (x.first_score or 0) >= settings.round2_min_first]
+        candidates.sort(key=lambda x: x.first_score or 0, reverse=True)
+        candidates = candidates[: max(0, settings.topk)]
+
+        # Fallback: if nothing passes the min, still score top-k to avoid empty outputs.
+        if not candidates:
+            candidates = sorted(scored_stage1, key=lambda x: x.first_score or 0, reverse=True)[: max(0, settings.topk)]
+
+        # build lookup for which items get round2
+        # Prefer arxiv_id, fallback to url
+        round2_ids = {x.arxiv_id or x.url for x in candidates}
+        round2_items = [x for x in scored_stage1 if (x.arxiv_id or x.url) in round2_ids]
+
+        # Best first, while the deadline and token budget allow; cache hits are free.
+        sla_deadline = metrics.deadline.timestamp() if metrics.deadline else None
+        now = time.time()
+        if sla_deadline is not None and settings.sla_passed(sla_deadline, now):
+            print("[daily-paper] round 2: too late to meet the SLA deadline; scoring every candidate anyway")
+        scheduler = Round2Scheduler(
+            deadline=settings.round2_deadline(sla_deadline, now),
+            token_budget=settings.round2_token_budget,
+            est_seconds=settings.round2_est_seconds,
+        )
+        round2_results: dict[int, Any] = {}
+        pending: dict[Future[Any], dict[str, Any]] = {}
+
+        def collect_done(block_until: int) -> None:
+            while len(pending) > block_until:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for f in done:
+                    round2_results[id(pending.pop(f))] = f.result()
+
+        for item in sorted(round2_items, key=lambda x: x.first_score or 0, reverse=True):
+            cached = cached_second_round(item)
+            if cached is not MISS:
+                round2_results[id(item)] = cached
+                continue
+            collect_done(max(1, settings.concurrency) - 1)
+            if scheduler.admit():
+                pending[engine.submit(second_round, item, scheduler)] = item
+        collect_done(0)
+
+    for item in round2_items:
+        # Skipped by the scheduler -> None -> first_score fallback.
+        apply_second_round(item, round2_results.get(id(item)), smooth_score)
+    if scheduler.skipped:
+        print(
+            f"[daily-paper] round 2: skipped {scheduler.skipped} candidate(s) ({scheduler.stop_reason}); "
+            "they keep their first-round score"
+        )
+
+    if skipped_published:
+        print(f"[daily-paper] skipped {skipped_published} paper(s) published on earlier days")
+    metrics.count(
+        "score.round1",
+        items_in=len(scored_stage1) + len(round1_failed) + skipped_published,
+        items_out=len(scored_stage1),
+    )
+    if round1_failed:
+        metrics.reject("round1_failed", len(round1_failed))
+    metrics.count("score.round2", items_in=len(scored_stage1), items_out=len(round2_items))
+    metrics.extra["round2_scheduler"] = scheduler.summary()
+    metrics.extra["llm_resilience"] = caller.summary()
+    metrics.extra["abstract_compression"] = {k: v - compression_before[k] for k, v in compressor.summary().items()}
+    if caller.breaker.trips:
+        print(
+            f"[daily-paper] LLM circuit breaker tripped {caller.breaker.trips} time(s); "
+            "unscored papers were dropped (round 1) or kept their first-round score (round 2)"
+        )
+    stats = cache.stats()
+    metrics.extra["score_cache"] = stats
+    print(f"[daily-paper] score cache: hits={stats['hits']} misses={stats['misses']}")
+    if owns_cache:
+        cache.close()
+
+    return scored_stage1
+
 
-            second_score = int(r2.get("score", item.get("first_score") or 0))
-            final_score = int(smooth_score(int(item.get("first_score") or 0), second_score))
+def _round2_tokens(title: str, text: str, r2: Any) -> int:
+    usage = r2.get("usage") if isinstance(r2, dict) else None
+    if isinstance(usage, dict) and usage.get("total_tokens"):
+        return int(usage["total_tokens"])
+    out = str(r2.get("summary_zh") or r2.get("reasoning") or "") if isinstance(r2, dict) else ""
+    return estimate_tokens(title, text, out)
 
-            item["second_score"] = second_score
-            item["score"] = final_score
 
-            # Prefer structured Chinese summary (Markdown, multi-line). Fallback to reasoning.
-            zh = str(r2.get("summary_zh") or r2.get("reasoning") or "").strip()
-            # Keep formatting; cap length to avoid breaking the page layout.
-            if len(zh) > 900:
-                zh = zh[:897] + "..."
-            item["translated_zh"] = zh
+def apply_second_round(item: PaperItem, r2: Any, smooth_score: Any) -> None:
+    """Merge a round-2 result into `item` in place (score, second_score, translated_zh)."""
+    first_score = item.first_score or 0
+    if not isinstance(r2, dict):
+        # fallback
+        item.score = first_score
+        item.translated_zh = ""
+        return
 
-        out.append(item)
+    second_score = int(r2.get("score", first_score))
+    item.second_score = second_score
+    item.score = int(smooth_score(first_score, second_score))
 
-    return out
+    # Prefer structured Chinese summary (Markdown, multi-line). Fallback to reasoning.
+    zh = str(r2.get("summary_zh") or r2.get("reasoning") or "").strip()
+    # Keep formatting; cap length to avoid breaking the page layout.
+    if len(zh) > 900:
+        zh = zh[:897] + "..."
+    item.translated_zh = zh
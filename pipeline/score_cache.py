@@ -0,0 +1,143 @@
+"""Persistent LLM score cache (SQLite under `.tmp/`).
+
+Entries are keyed by (arxiv_id, content hash of the exact prompt text, round,
+version tag), so a re-run for the same date costs no LLM calls while any change
+to the title/abstract, the round, or the prompt/model version misses.
+
+Env knobs:
+- DAILY_PAPER_SCORE_CACHE (default 1; 0 disables the cache entirely)
+- DAILY_PAPER_SCORE_CACHE_BYPASS (default 0; 1 skips lookups but still refreshes entries)
+- DAILY_PAPER_SCORE_VERSION (default v1; bump when the prompt or model changes)
+- DAILY_PAPER_SCORE_CACHE_TTL_DAYS (default 30)
+- DAILY_PAPER_SCORE_CACHE_MAX_ENTRIES (default 50000)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+MISS = object()
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS scores (
+    arxiv_id TEXT NOT NULL,
+    content_hash TEXT NOT NULL,
+    round TEXT NOT NULL,
+    version TEXT NOT NULL,
+    value TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    PRIMARY KEY (arxiv_id, content_hash, round, version)
+)
+"""
+
+
+def content_hash(title: str, abstract: str) -> str:
+    h = hashlib.sha256()
+    h.update(title.encode("utf-8"))
+    h.update(b"\n")
+    h.update(abstract.encode("utf-8"))
+    return h.hexdigest()[:20]
+
+
+class ScoreCache:
+    def __init__(
+        self,
+        path: Optional[Path],
+        *,
+        version: str = "v1",
+        ttl_seconds: float = 30 * 86400,
+        max_entries: int = 50000,
+        bypass: bool = False,
+    ):
+        self.path = path
+        self.version = version
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.bypass = bypass
+        self.hits: dict[str, int] = {}
+        self.misses: dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        if path is not None:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(path), timeout=30, check_same_thread=False)
+            self._conn.execute(_SCHEMA)
+            self.evict()
+
+    @staticmethod
+    def from_env(tmp_dir: Path) -> "ScoreCache":
+        enabled = os.getenv("DAILY_PAPER_SCORE_CACHE", "1") != "0"
+        return ScoreCache(
+            tmp_dir / "score-cache.sqlite3" if enabled else None,
+            version=os.getenv("DAILY_PAPER_SCORE_VERSION", "v1"),
+            ttl_seconds=float(os.getenv("DAILY_PAPER_SCORE_CACHE_TTL_DAYS", "30")) * 86400,
+            max_entries=int(os.getenv("DAILY_PAPER_SCORE_CACHE_MAX_ENTRIES", "50000")),
+            bypass=os.getenv("DAILY_PAPER_SCORE_CACHE_BYPASS", "0") == "1",
+        )
+
+    @property
+    def enabled(self) -> bool:
+        return self._conn is not None
+
+    def get(self, round_name: str, arxiv_id: str, title: str, abstract: str) -> Any:
+        """Return the cached value or `MISS`."""
+        if not self.enabled or not arxiv_id or self.bypass:
+            self._count(self.misses, round_name)
+            return MISS
+        key = (arxiv_id, content_hash(title, abstract), round_name, self.version)
+        with self._lock:
+            row = self._conn.execute(  # type: ignore[union-attr]
+                "SELECT value, created_at FROM scores"
+                " WHERE arxiv_id = ? AND content_hash = ? AND round = ? AND version = ?",
+                key,
+            ).fetchone()
+        if row is None or time.time() - row[1] > self.ttl_seconds:
+            self._count(self.misses, round_name)
+            return MISS
+        self._count(self.hits, round_name)
+        return json.loads(row[0])
+
+    def put(self, round_name: str, arxiv_id: str, title: str, abstract: str, value: Any) -> None:
+        if not self.enabled or not arxiv_id:
+            return
+        key = (arxiv_id, content_hash(title, abstract), round_name, self.version)
+        with self._lock:
+            self._conn.execute(  # type: ignore[union-attr]
+                "INSERT OR REPLACE INTO scores VALUES (?, ?, ?, ?, ?, ?)",
+                (*key, json.dumps(value, ensure_ascii=False), time.time()),
+            )
+            self._conn.commit()  # type: ignore[union-attr]
+
+    def evict(self) -> None:
+        """Drop expired entries, then the oldest ones beyond `max_entries`."""
+        if not self.enabled:
+            return
+        with self._lock:
+            conn = self._conn
+            assert conn is not None
+            conn.execute("DELETE FROM scores WHERE created_at < ?", (time.time() - self.ttl_seconds,))
+            conn.execute(
+                "DELETE FROM scores WHERE rowid IN ("
+                " SELECT rowid FROM scores ORDER BY created_at DESC, rowid DESC LIMIT -1 OFFSET ?)",
+                (max(0, self.max_entries),),
+            )
+            conn.commit()
+
+    def stats(self) -> dict[str, Any]:
+        return {"hits": dict(self.hits), "misses": dict(self.misses)}
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def _count(self, counter: dict[str, int], round_name: str) -> None:
+        with self._lock:
+            counter[round_name] = counter.get(round_name, 0) + 1
@@ -0,0 +1,153 @@
+"""Incremental site builds: work out which pages web/generate.js must rewrite.
+
+Each page's inputs are hashed into a signature:
+
+- YYYY-MM-DD.html: that day's JSON, the dates in its sidebar window (the
+  `sidebar_window` reports on either side), and the build digest;
+- index.html: the same, for the newest day;
+- archive.html: every (date, JSON hash) pair, and the build digest.
+
+The build digest covers web/templates/*.html, web/generate.js, the mode and
+the sidebar window. Day JSON is hashed by content. A day whose size and mtime
+are unchanged since the last build is not re-read. Signatures are kept in
+`.tmp/site-plan/<output dir>.json`. A page is rebuilt when its signature
+changed or its file is missing, so adding a day rewrites that day, its
+neighbours, the index and the archive, and an unchanged archive builds nothing.
+
+    python -m pipeline.site_planner [--mode paper|news] [--full]
+
+Env knobs:
+- DAILY_PAPER_SIDEBAR_WINDOW (default 5; sidebar dates on either side of a page, -1 = all;
+  also read by web/generate.js)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import subprocess
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Optional
+
+from .atomic import atomic_write_json
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def _sha256(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def _digest(*parts: Any) -> str:
+    return _sha256(json.dumps(parts, sort_keys=True, separators=(",", ":")).encode("utf-8"))
+
+
+@dataclass
+class SitePlan:
+    pages: list[str]
+    total: int
+    signatures: dict[str, str] = field(default_factory=dict)
+    days: dict[str, dict[str, str]] = field(default_factory=dict)
+
+
+class SitePlanner:
+    def __init__(
+        self,
+        root: Path,
+        mode: str,
+        *,
+        output_dir: Optional[Path] = None,
+        site_dir: Optional[Path] = None,
+        sidebar_window: Optional[int] = None,
+    ):
+        self.root = root
+        self.mode = mode
+        self.output_dir = output_dir or root / "output"
+        self.site_dir = site_dir or self.output_dir / "site"
+        if sidebar_window is None:
+            sidebar_window = int(os.getenv("DAILY_PAPER_SIDEBAR_WINDOW", "5"))
+        self.sidebar_window = sidebar_window
+        try:
+            slug = self.output_dir.resolve().relative_to(root.resolve()).as_posix().replace("/", "_")
+        except ValueError:
+            slug = _sha256(str(self.output_dir.resolve()).encode("utf-8"))[:16]
+        self.state_path = root / ".tmp" / "site-plan" / f"{slug}.json"
+
+    def _load_state(self) -> dict[str, Any]:
+        try:
+            state = json.loads(self.state_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        return state if isinstance(state, dict) else {}
+
+    def build_digest(self) -> str:
+        web = self.root / "web"
+        sources = sorted((web / "templates").glob("*.html")) + [web / "generate.js"]
+        files = [(p.name, _sha256(p.read_bytes())) for p in sources if p.exists()]
+        return _digest(files, self.mode, self.sidebar_window)
+
+    def _day_hashes(self, known: dict[str, dict[str, str]]) -> dict[str, dict[str, str]]:
+        days = {}
+        for path in sorted(self.output_dir.glob("????-??-??.json"), reverse=True):
+            st = path.stat()
+            signature = f"{st.st_mtime_ns}:{st.st_size}"
+            old = known.get(path.stem) or {}
+            sha = old["sha256"] if old.get("signature") == signature else _sha256(path.read_bytes())
+            days[path.stem] = {"signature": signature, "sha256": sha}
+        return days
+
+    def _sidebar(self, dates: list[str], i: int) -> list[str]:
+        if self.sidebar_window < 0:
+            return dates
+        return dates[max(0, i - self.sidebar_window) : i + self.sidebar_window + 1]
+
+    def plan(self, *, full: bool = False) -> SitePlan:
+        state = self._load_state()
+        days = self._day_hashes(state.get("days") or {})
+        dates = list(days)  # newest first, like generate.js
+        build = self.build_digest()
+
+        signatures: dict[str, str] = {}
+        for i, d in enumerate(dates):
+            signatures[f"{d}.html"] = _digest(build, days[d]["sha256"], self._sidebar(dates, i))
+        signatures["index.html"] = signatures[f"{dates[0]}.html"] if dates else _digest(build, "empty")
+        signatures["archive.html"] = _digest(build, [(d, days[d]["sha256"]) for d in dates])
+
+        previous = state.get("pages") or {}
+        pages = [
+            page
+            for page, sig in signatures.items()
+            if full or previous.get(page) != sig or not (self.site_dir / page).exists()
+        ]
+        return SitePlan(pages=pages, total=len(signatures), signatures=signatures, days=days)
+
+    def save(self, plan: SitePlan) -> None:
+        atomic_write_json(self.state_path, {"pages": plan.signatures, "days": plan.days})
+
+    def build(self, *, full: bool = False) -> SitePlan:
+        """Run web/generate.js for the planned pages only (nothing when the site is current)."""
+        plan = self.plan(full=full)
+        if not plan.pages:
+            print(f"[daily-paper] site is current ({plan.total} page(s)), skip generate", file=sys.stderr)
+            return plan
+        cmd = ["node", "web/generate.js", "--mode", self.mode, "--sidebar-window", str(self.sidebar_window)]
+        cmd += ["--output-dir", str(self.output_dir), "--site-dir", str(self.site_dir)]
+        if len(plan.pages) < plan.total:
+            cmd += ["--pages", ",".join(plan.pages)]
+        subprocess.run(cmd, cwd=str(self.root), check=True)
+        self.save(plan)
+        print(f"[daily-paper] site: rebuilt {len(plan.pages)}/{plan.total} page(s)", file=sys.stderr)
+        return plan
+
+
+def main(argv: list[str]) -> int:
+    mode = argv[argv.index("--mode") + 1] if "--mode" in argv else "paper"
+    SitePlanner(ROOT, mode).build(full="--full" in argv)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
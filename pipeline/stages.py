@@ -0,0 +1,167 @@
+"""Checkpointed stage runner for the daily pipeline.
+
+Each stage persists an artifact and a checkpoint under
+`.tmp/checkpoints/<run_date>/<stage>.json`:
+
+    {"stage", "run_date", "input_hash", "output_hash", "artifact", "finished_at"}
+
+`input_hash` covers the previous stage's `output_hash` plus the stage's own
+fingerprint (settings that change its result), so a checkpoint stays valid
+exactly as long as its inputs are unchanged. With `resume=True` valid stages
+are loaded from their artifacts instead of re-run; `from_stage` forces that
+stage and everything after it to run. `timer(stage_name)` wraps each stage
+(run or reload) for instrumentation.
+
+A stage may return a lazy iterator (streaming collect). Its checkpoint is then
+written only once the iterator is exhausted, so a partially consumed stream
+never looks resumable.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import time
+from contextlib import nullcontext
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, ContextManager, Iterator, Optional
+
+from .atomic import atomic_write_json
+
+
+def digest(*parts: Any) -> str:
+    h = hashlib.sha256()
+    for part in parts:
+        h.update(json.dumps(part, sort_keys=True, ensure_ascii=False, default=str).encode("utf-8"))
+        h.update(b"\0")
+    return h.hexdigest()[:24]
+
+
+def file_digest(path: Path) -> str:
+    h = hashlib.sha256()
+    with path.open("rb") as fh:
+        for chunk in iter(lambda: fh.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()[:24]
+
+
+@dataclass
+class Stage:
+    name: str
+    # value of the previous stage -> this stage's value
+    run: Callable[[Any], Any]
+    # persist the value; return the artifact path (None: stage has no artifact)
+    save: Callable[[Any], Optional[Path]] = lambda value: None
+    # artifact path (or None) -> value, used when the checkpoint is reused
+    load: Callable[[Optional[Path]], Any] = lambda path: None
+    fingerprint: Any = field(default=None)
+
+
+class CheckpointStore:
+    def __init__(self, root: Path, run_date: str):
+        self.dir = root / run_date
+        self.run_date = run_date
+
+    def path(self, stage: str) -> Path:
+        return self.dir / f"{stage}.json"
+
+    def load(self, stage: str) -> Optional[dict[str, Any]]:
+        try:
+            return json.loads(self.path(stage).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+
+    def save(self, stage: str, meta: dict[str, Any]) -> None:
+        atomic_write_json(self.path(stage), meta)
+
+    def clear(self, stage: str) -> None:
+        self.path(stage).unlink(missing_ok=True)
+
+
+class StageRunner:
+    def __init__(
+        self,
+        store: CheckpointStore,
+        *,
+        resume: bool = False,
+        from_stage: Optional[str] = None,
+        log: Callable[[str], None] = print,
+        timer: Callable[[str], ContextManager[Any]] = lambda name: nullcontext(),
+    ):
+        self.store = store
+        self.timer = timer
+        self.resume = resume or from_stage is not None
+        self.from_stage = from_stage
+        self.log = log
+
+    def run(self, stages: list[Stage]) -> Any:
+        names = [s.name for s in stages]
+        if self.from_stage is not None and self.from_stage not in names:
+            raise ValueError(f"unknown stage {self.from_stage!r}; plan is {names}")
+
+        value: Any = None
+        forced = False
+        prev: Optional[str] = None
+        for stage in stages:
+            forced = forced or stage.name == self.from_stage
+            input_hash = self._input_hash(prev, stage)
+            meta = self.store.load(stage.name)
+            if self.resume and not forced and input_hash is not None and self._valid(meta, input_hash):
+                assert meta is not None
+                artifact = Path(meta["artifact"]) if meta.get("artifact") else None
+                with self.timer(stage.name):
+                    value = stage.load(artifact)
+                self.log(f"[daily-paper] stage {stage.name}: reused checkpoint")
+                prev = stage.name
+                continue
+
+            self.store.clear(stage.name)
+            with self.timer(stage.name):
+                value = stage.run(value)
+                if isinstance(value, Iterator):
+                    value = self._save_when_exhausted(value, stage, prev)
+                else:
+                    self._save(stage, value, prev)
+            prev = stage.name
+        return value
+
+    def _input_hash(self, prev: Optional[str], stage: Stage) -> Optional[str]:
+        """Hash of (upstream output, own fingerprint); None if upstream left no checkpoint."""
+        upstream = ""
+        if prev is not None:
+            meta = self.store.load(prev)
+            if not meta:
+                return None
+            upstream = meta["output_hash"]
+        return digest(self.store.run_date, stage.name, upstream, stage.fingerprint)
+
+    def _valid(self, meta: Optional[dict[str, Any]], input_hash: str) -> bool:
+        if not meta or meta.get("input_hash") != input_hash:
+            return False
+        artifact = meta.get("artifact")
+        if not artifact:
+            return True
+        path = Path(artifact)
+        return path.exists() and file_digest(path) == meta.get("output_hash")
+
+    def _save(self, stage: Stage, value: Any, prev: Optional[str]) -> None:
+        # An unverifiable upstream (e.g. a stream that was not fully read) leaves
+        # this checkpoint with an input hash that can never match again.
+        input_hash = self._input_hash(prev, stage) or "<unverified>"
+        artifact = stage.save(value)
+        self.store.save(
+            stage.name,
+            {
+                "stage": stage.name,
+                "run_date": self.store.run_date,
+                "input_hash": input_hash,
+                "output_hash": file_digest(artifact) if artifact else input_hash,
+                "artifact": str(artifact) if artifact else None,
+                "finished_at": time.time(),
+            },
+        )
+
+    def _save_when_exhausted(self, items: Iterator[Any], stage: Stage, prev: Optional[str]) -> Iterator[Any]:
+        yield from items
+        self._save(stage, None, prev)
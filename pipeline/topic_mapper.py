@@ -1,15 +1,156 @@
-HARDWARE_HINTS = ("asic", "fpga", "chip", "chiplet", "accelerator", "hbm")
+"""Topic classification compiled from `config/topics.yaml`.
+
+`TopicClassifier.from_config(cfg)` compiles the topics once into
+
+- a category table: lower-cased arXiv category -> [(topic index, weight)], and
+- one keyword regex for all `keyword_hints` (built from a prefix trie, so the
+  engine walks shared prefixes once instead of trying each keyword in turn).
+  Hints match at a word start, so "chip" matches "chiplet" but "asic" does not
+  match "basic".
+
+`strategy` (top level of topics.yaml) picks how a topic is chosen:
+
+- `first_match` (default): topics are tried in descending `priority` (default
+  0), then in listed order. The first one that lists any of the item's
+  categories, or has a keyword hint in the title, wins. This is the original
+  if-chain, in config form.
+- `weighted`: a topic scores 1.0 for the item's primary (first) category and
+  0.5 for a cross-list, each divided by the number of topics listing that
+  category, plus `keyword_weight` (default 1.0) per distinct hint in the
+  title. The highest score wins, with ties broken as in `first_match`. It
+  assigns some cross-listed items differently, e.g. [cs.LG, cs.CR] goes to the
+  cs.LG topic rather than the cs.CR one.
+
+Items that match nothing get `default_topic`, or the last topic when it is
+unset.
+"""
+
+from __future__ import annotations
+
+import re
+from pathlib import Path
+from typing import Any, Iterable, Optional
+
+import yaml
+
+TOPICS_PATH = Path(__file__).resolve().parents[1] / "config" / "topics.yaml"
+
+PRIMARY_CATEGORY_WEIGHT = 1.0
+CROSS_LIST_WEIGHT = 0.5
+
+
+def _trie_pattern(words: Iterable[str]) -> str:
+    """Regex alternation factored by common prefix: chip, chiplet -> chip(?:let)?"""
+    trie: dict[str, Any] = {}
+    for word in words:
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[""] = {}
+
+    def build(node: dict[str, Any]) -> str:
+        terminal = "" in node
+        branches = [re.escape(ch) + build(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        if terminal:
+            return f"(?:{body})?" if len(branches) > 1 or len(body) > 1 else body + "?"
+        return body
+
+    return build(trie)
+
+
+STRATEGIES = ("first_match", "weighted")
+
+
+class TopicClassifier:
+    def __init__(
+        self,
+        topics: list[dict[str, Any]],
+        *,
+        default_topic: Optional[str] = None,
+        strategy: str = "first_match",
+    ):
+        if not topics:
+            raise ValueError("topics.yaml defines no topics")
+        if strategy not in STRATEGIES:
+            raise ValueError(f"unknown topic strategy {strategy!r} (expected one of {', '.join(STRATEGIES)})")
+        self.strategy = strategy
+        self.names = [str(t["name"]) for t in topics]
+        self.default_topic = default_topic or self.names[-1]
+        order = {i: (-float(t.get("priority") or 0), i) for i, t in enumerate(topics)}
+        # Pre-sorted by tie-break rank so the first best score wins.
+        self._rank = sorted(range(len(topics)), key=order.__getitem__)
+
+        listed: dict[str, list[int]] = {}
+        self._topic_categories: list[frozenset[str]] = []
+        for i, topic in enumerate(topics):
+            cats = [str(cat).lower() for cat in topic.get("primary_categories") or []]
+            self._topic_categories.append(frozenset(cats))
+            for cat in cats:
+                listed.setdefault(cat, []).append(i)
+        self._categories = {cat: [(i, 1.0 / len(idx)) for i in idx] for cat, idx in listed.items()}
+
+        self._keywords: dict[str, list[tuple[int, float]]] = {}
+        self._topic_hints: list[frozenset[str]] = []
+        for i, topic in enumerate(topics):
+            weight = float(topic.get("keyword_weight") or 1.0)
+            hints = [str(hint).lower() for hint in topic.get("keyword_hints") or []]
+            self._topic_hints.append(frozenset(hints))
+            for hint in hints:
+                self._keywords.setdefault(hint, []).append((i, weight))
+        self._matcher = re.compile(r"\b" + _trie_pattern(self._keywords)) if self._keywords else None
+
+    @classmethod
+    def from_config(cls, cfg: dict[str, Any]) -> "TopicClassifier":
+        return cls(
+            list(cfg.get("topics") or []),
+            default_topic=cfg.get("default_topic"),
+            strategy=str(cfg.get("strategy") or "first_match"),
+        )
+
+    @classmethod
+    def from_file(cls, path: Path = TOPICS_PATH) -> "TopicClassifier":
+        return cls.from_config(yaml.safe_load(path.read_text(encoding="utf-8")) or {})
+
+    def classify(self, item: dict[str, Any]) -> str:
+        categories = [str(cat).lower() for cat in item.get("categories") or []]
+        words = set(self._matcher.findall(str(item.get("title") or "").lower())) if self._matcher else set()
+        if self.strategy == "first_match":
+            cats = set(categories)
+            for i in self._rank:
+                if cats & self._topic_categories[i] or words & self._topic_hints[i]:
+                    return self.names[i]
+            return self.default_topic
+
+        scores = [0.0] * len(self.names)
+        for pos, cat in enumerate(categories):
+            hits = self._categories.get(cat)
+            if hits:
+                weight = PRIMARY_CATEGORY_WEIGHT if pos == 0 else CROSS_LIST_WEIGHT
+                for i, share in hits:
+                    scores[i] += weight * share
+        for word in words:
+            for i, weight in self._keywords[word]:
+                scores[i] += weight
+
+        best = max(self._rank, key=lambda i: scores[i])
+        return self.names[best] if scores[best] > 0 else self.default_topic
+
+    def classify_many(self, items: Iterable[dict[str, Any]]) -> list[str]:
+        return [self.classify(item) for item in items]
+
+
+_default: Optional[TopicClassifier] = None
+
+
+def default_classifier() -> TopicClassifier:
+    global _default
+    if _default is None:
+        _default = TopicClassifier.from_file()
+    return _default
 
 
 def map_topic(item: dict) -> str:
-    categories = [x.lower() for x in item.get("categories", [])]
-    title = item.get("title", "").lower()
-    if "cs.ar" in categories or any(k in title for k in HARDWARE_HINTS):
-        return "芯片与硬件架构"
-    if any(x in categories for x in ["cs.cv", "cs.cl", "eess.iv", "eess.as"]):
-        return "多模态与感知"
-    if "cs.cr" in categories:
-        return "评测、安全与对齐"
-    if "cs.ma" in categories:
-        return "Agent与推理范式"
-    return "模型与学习算法"
+    return default_classifier().classify(item)
@@ -15,4 +15,7 @@ while [[ $# -gt 0 ]]; do
   esac
 done
 
-node "$(dirname "$0")/../web/generate.js" --mode "$MODE"
+# Only the pages whose inputs changed are regenerated (pipeline/site_planner.py).
+(cd "$(dirname "$0")/.." && python3 -m pipeline.site_planner --mode "$MODE")
+# Markdown / RSS / Atom / JSON Feed under output/site/feeds (changed days only).
+(cd "$(dirname "$0")/.." && python3 -m pipeline.render --mode "$MODE")
@@ -34,9 +34,16 @@ if [[ ! -f "$PAPER_JSON_SRC" ]]; then
   die "missing paper json: ${PAPER_JSON_SRC} (run daily-paper pipeline first)"
 fi
 
+# Nothing to do (no pull, rebuild or commit) when the day is already synced.
+if [[ -f "$REPORT_JSON_DST" ]] && cmp -s "$PAPER_JSON_SRC" "$REPORT_JSON_DST"; then
+  log "unchanged: ${REPORT_JSON_DST}"
+  exit 0
+fi
+
 log "sync ${PAPER_JSON_SRC} -> ${REPORT_JSON_DST}"
 mkdir -p "$REPORT_PAPERS_DIR"
-cp -f "$PAPER_JSON_SRC" "$REPORT_JSON_DST"
+cp -f "$PAPER_JSON_SRC" "${REPORT_JSON_DST}.tmp"
+mv -f "${REPORT_JSON_DST}.tmp" "$REPORT_JSON_DST"
 
 log "git commit+push daily-report"
 cd "$REPORT_REPO"
@@ -28,8 +28,10 @@ done
 
 cd "$PROJECT_ROOT"
 
+# Incremental: only pages whose day JSON, templates or generator changed are rewritten.
 echo "[daily-paper] build site (mode=${MODE})"
 bash scripts/build-site.sh --mode "$MODE"
+python3 -m pipeline.manifest update
 
 if [[ "$DRY_RUN" == "true" ]]; then
   echo "[dry-run] skip git push"
@@ -41,7 +43,15 @@ if ! git rev-parse --is-inside-work-tree >/dev/null 2>&1; then
   exit 1
 fi
 
-git add output/*.json output/site
+# Stage only artifacts whose content hash differs from the last published manifest.
+BASE_MANIFEST="$(mktemp)"
+trap 'rm -f "$BASE_MANIFEST"' EXIT
+git show HEAD:output/manifest.json >"$BASE_MANIFEST" 2>/dev/null || echo '{}' >"$BASE_MANIFEST"
+mapfile -t CHANGED < <(python3 -m pipeline.manifest changed --base "$BASE_MANIFEST")
+if [[ ${#CHANGED[@]} -gt 0 ]]; then
+  echo "[daily-paper] ${#CHANGED[@]} changed artifact(s)"
+  git add -- "${CHANGED[@]}" output/manifest.json
+fi
 
 if git diff --cached --quiet; then
   echo "[daily-paper] no site changes to publish"
@@ -3,6 +3,7 @@ set -euo pipefail
 
 RUN_DATE="$(TZ=Asia/Shanghai date +%F)"
 MODE="paper"
+RANGE_ARGS=()
 
 while [[ $# -gt 0 ]]; do
   case "$1" in
@@ -14,6 +15,14 @@ while [[ $# -gt 0 ]]; do
       MODE="${2:-paper}"
       shift 2
       ;;
+    --from|--to|--workers)
+      RANGE_ARGS+=("$1" "${2:-}")
+      shift 2
+      ;;
+    --replay|--no-build)
+      RANGE_ARGS+=("$1")
+      shift
+      ;;
     *)
       shift
       ;;
@@ -28,4 +37,4 @@ mkdir -p output .tmp output/site logs references
 echo "[daily-paper] run pipeline for ${RUN_DATE}"
 echo "[daily-paper] mode: ${MODE}"
 
-time python3 -m pipeline.run_daily --date "$RUN_DATE" --mode "$MODE"
+time python3 -m pipeline.run_daily --date "$RUN_DATE" --mode "$MODE" ${RANGE_ARGS[@]+"${RANGE_ARGS[@]}"}
@@ -0,0 +1,41 @@
+import json
+
+from pipeline.archive import ArchiveStore
+
+
+def _day(ids, topic="t"):
+    return [{"arxiv_id": x, "title": f"paper {x}", "topic": topic} for x in ids]
+
+
+def test_range_point_and_month_rollup(tmp_path):
+    store = ArchiveStore(tmp_path / "archive")
+    store.put_day("2026-01-31", _day(["2601.00001v1"]))
+    store.put_day("2026-02-01", _day(["2602.00001v1", "2602.00002v2"], topic="hw"))
+    store.put_day("2026-02-02", _day(["2602.00003v1"]))
+
+    reopened = ArchiveStore(tmp_path / "archive")
+    assert [d for d, _ in reopened.range("2026-02-01", "2026-02-28")] == ["2026-02-01", "2026-02-02"]
+    assert reopened.get("2602.00002")["date"] == "2026-02-01"
+    assert reopened.get("2699.99999") is None
+    assert reopened.months()["2026-02"] == {"days": 2, "items": 3, "topics": {"hw": 2, "t": 1}}
+
+
+def test_republish_replaces_day_and_compact_reclaims(tmp_path):
+    store = ArchiveStore(tmp_path / "archive")
+    store.put_day("2026-02-01", _day(["2602.00001v1", "2602.00002v1"]))
+    store.put_day("2026-02-01", _day(["2602.00002v2"]))
+
+    assert [x["arxiv_id"] for x in store.day("2026-02-01")] == ["2602.00002v2"]
+    assert store.get("2602.00001") is None
+    assert store.compact() > 0
+    assert [x["arxiv_id"] for x in store.day("2026-02-01")] == ["2602.00002v2"]
+
+
+def test_sync_imports_changed_days_only(tmp_path):
+    out = tmp_path / "output"
+    out.mkdir()
+    (out / "2026-02-01.json").write_text(json.dumps({"date": "2026-02-01", "items": _day(["2602.00001"])}))
+    store = ArchiveStore(out / "archive")
+    assert store.sync(out) == 1
+    assert store.sync(out) == 0
+    assert store.dates() == ["2026-02-01"]
@@ -0,0 +1,66 @@
+import pytest
+
+from pipeline.run_daily import date_range
+
+
+def test_date_range_is_inclusive_and_crosses_months():
+    assert date_range("2026-02-27", "2026-03-02") == ["2026-02-27", "2026-02-28", "2026-03-01", "2026-03-02"]
+
+
+def test_date_range_rejects_reversed_bounds():
+    with pytest.raises(ValueError):
+        date_range("2026-02-17", "2026-02-02")
+
+
+@pytest.fixture
+def stubbed(monkeypatch):
+    from concurrent.futures import ThreadPoolExecutor
+    from pathlib import Path
+    from types import SimpleNamespace
+
+    from pipeline import run_daily
+
+    calls = SimpleNamespace(runs=[], builds=[], warm=0, manifest=0, fail=set())
+
+    def fake_run_daily(run_date, **kw):
+        calls.runs.append((run_date, kw))
+        if run_date in calls.fail:
+            raise RuntimeError("collector down")
+        return Path(f"{run_date}.json")
+
+    def warm():
+        calls.warm += 1
+
+    def update(root):
+        calls.manifest += 1
+
+    monkeypatch.setattr(run_daily, "ProcessPoolExecutor", ThreadPoolExecutor)
+    monkeypatch.setattr(run_daily, "_warm_worker", warm)
+    monkeypatch.setattr(run_daily, "run_daily", fake_run_daily)
+    monkeypatch.setattr(run_daily, "build_site", lambda root, mode, **kw: calls.builds.append(mode))
+    monkeypatch.setattr(run_daily, "load_profiles", lambda root: [])
+    monkeypatch.setattr(run_daily, "manifest", SimpleNamespace(update=update))
+    return calls
+
+
+def test_backfill_runs_each_date_once_without_building_then_builds_once(stubbed):
+    from pipeline.run_daily import backfill
+
+    written = backfill("2026-02-27", "2026-03-02", workers=2)
+
+    assert sorted(d for d, _ in stubbed.runs) == ["2026-02-27", "2026-02-28", "2026-03-01", "2026-03-02"]
+    assert all(kw == {"mode": "paper", "build": False} for _, kw in stubbed.runs)
+    assert 1 <= stubbed.warm <= 2  # one warm-up per worker, not per date
+    assert stubbed.builds == ["paper"] and stubbed.manifest == 1
+    assert [p.name for p in written] == [f"{d}.json" for d in ("2026-02-27", "2026-02-28", "2026-03-01", "2026-03-02")]
+
+
+def test_backfill_still_builds_once_when_a_date_fails(stubbed):
+    from pipeline.run_daily import backfill
+
+    stubbed.fail.add("2026-02-28")
+    with pytest.raises(RuntimeError, match="2026-02-28"):
+        backfill("2026-02-27", "2026-03-01", workers=2)
+
+    assert len(stubbed.runs) == 3
+    assert stubbed.builds == ["paper"] and stubbed.manifest == 1
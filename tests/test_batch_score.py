@@ -0,0 +1,91 @@
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+
+def _load_module():
+    mod_path = Path("pipeline/batch_score.py")
+    spec = importlib.util.spec_from_file_location("batch_score", mod_path)
+    assert spec and spec.loader
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_parses_indexed_lines_and_marks_dropped_or_garbled_papers():
+    module = _load_module()
+    reply = "1: 78\n[3] - 101\nnoise\n4) 55\n"
+    assert module.parse_batch_scores(reply, 4) == [78, None, None, 55]
+
+
+def test_parses_json_list_and_mapping_replies():
+    module = _load_module()
+    assert module.parse_batch_scores('{"scores": [10, "x", 90]}', 3) == [10, None, 90]
+    assert module.parse_batch_scores('{"2": 64}', 2) == [None, 64]
+
+
+def test_prompt_numbers_papers():
+    module = _load_module()
+    prompt = module.build_batch_prompt([("A", "alpha"), ("B", "beta")])
+    assert "[1] Title: A" in prompt and "[2] Title: B" in prompt
+
+
+def test_batch_scores_need_an_explicit_method_and_are_cached_apart(tmp_path):
+    from pipeline.bench import StubProcessor, stub_smooth_score, synthetic_items
+    from pipeline.score import ScoreSettings, score_items
+    from pipeline.score_cache import ScoreCache
+
+    module = _load_module()
+    processor = StubProcessor()
+    assert module.resolve_completion(processor, "") is None
+    with pytest.raises(ValueError):
+        module.resolve_completion(processor, "chat")
+
+    cache = ScoreCache(tmp_path / "cache.sqlite3")
+    backend = (processor, stub_smooth_score)
+    batched = ScoreSettings(max_items=4, topk=0, concurrency=1, round1_batch_size=4, round1_batch_method="complete")
+    score_items(synthetic_items(4), cache=cache, backend=backend, settings=batched)
+    assert cache.stats()["misses"] == {module.ROUND1_BATCH: 4}
+
+    # The single-item prompt does not reuse scores produced by the batch prompt.
+    single = ScoreSettings(max_items=4, topk=0, concurrency=1)
+    score_items(synthetic_items(4), cache=cache, backend=backend, settings=single)
+    assert cache.stats()["misses"]["round1"] == 4
+    # ...and each prompt's scores still hit for that prompt.
+    score_items(synthetic_items(4), cache=cache, backend=backend, settings=batched)
+    assert cache.stats()["hits"] == {module.ROUND1_BATCH: 4}
+
+
+def test_single_call_fallbacks_in_batch_mode_hit_the_cache_on_rerun(tmp_path):
+    from pipeline.bench import StubProcessor, stub_smooth_score, synthetic_items
+    from pipeline.score import ScoreSettings, score_items
+    from pipeline.score_cache import ScoreCache
+
+    module = _load_module()
+    processor = StubProcessor()
+    calls = []
+
+    def complete(prompt):
+        calls.append("batch")
+        return processor.complete(prompt).split("\n", 1)[1]  # drops paper 1: it falls back to a single call
+
+    def first_round(*args):
+        calls.append("single")
+        return StubProcessor.score_article_first_round(processor, *args)
+
+    processor.score_article_first_round = first_round
+    cache = ScoreCache(tmp_path / "cache.sqlite3")
+    settings = ScoreSettings(max_items=4, topk=0, concurrency=1, round1_batch_size=4)
+
+    def run():
+        backend = (processor, stub_smooth_score)
+        score_items(synthetic_items(4), cache=cache, backend=backend, settings=settings, complete=complete)
+
+    run()
+    assert calls == ["batch", "single"]
+
+    calls.clear()
+    run()
+    assert calls == []
+    assert cache.stats()["hits"] == {module.ROUND1_BATCH: 4}
@@ -0,0 +1,61 @@
+from pipeline.bench import StubProcessor, run_benchmark, stub_smooth_score, synthetic_items
+from pipeline.score import ScoreSettings, score_items
+from pipeline.score_cache import ScoreCache
+
+
+class CountingStub(StubProcessor):
+    def __init__(self):
+        super().__init__()
+        self.calls = 0
+
+    def score_article_first_round(self, title, abstract, source):
+        self.calls += 1
+        return super().score_article_first_round(title, abstract, source)
+
+    def score_article(self, title, abstract, source):
+        self.calls += 1
+        return super().score_article(title, abstract, source)
+
+
+def test_synthetic_items_match_collector_shape():
+    items = synthetic_items(3)
+    assert items[0]["id"].startswith("arxiv:") and items[0]["url"].startswith("https://arxiv.org/abs/")
+    assert {"title", "abstract", "categories", "publishedAt", "raw"} <= set(items[0])
+
+
+def test_score_items_with_stub_keeps_order_and_round2_semantics():
+    items = synthetic_items(40)
+    settings = ScoreSettings(max_items=40, topk=5, concurrency=4)
+    scored = score_items(items, cache=ScoreCache(None), backend=(StubProcessor(), stub_smooth_score), settings=settings)
+
+    assert [x["title"] for x in scored] == [x["title"] for x in items]
+    round2 = [x for x in scored if "second_score" in x]
+    assert len(round2) == 5
+    top5 = sorted((x["first_score"] for x in scored), reverse=True)[:5]
+    assert sorted((x["first_score"] for x in round2), reverse=True) == top5
+    for x in round2:
+        assert x["score"] == stub_smooth_score(x["first_score"], x["second_score"])
+
+
+def test_cached_rerun_and_published_filter_cost_no_llm_calls(tmp_path):
+    items = synthetic_items(10)
+    settings = ScoreSettings(max_items=10, topk=3, concurrency=2)
+    cache = ScoreCache(tmp_path / "cache.sqlite3")
+    stub = CountingStub()
+    first = score_items(items, cache=cache, backend=(stub, stub_smooth_score), settings=settings)
+    assert stub.calls == 13
+
+    stub.calls = 0
+    again = score_items(items, cache=cache, backend=(stub, stub_smooth_score), settings=settings)
+    assert stub.calls == 0
+    assert [x["score"] for x in again if "score" in x] == [x["score"] for x in first if "score" in x]
+
+    published = {items[0]["url"].rsplit("/", 1)[-1].split("v")[0]}
+    kept = score_items(items, cache=cache, backend=(stub, stub_smooth_score), settings=settings, published=published)
+    assert len(kept) == 9
+
+
+def test_run_benchmark_reports_every_stage():
+    report = run_benchmark(20, concurrency=2)
+    assert set(report["stages"]) == {"score", "topic", "curate", "write"}
+    assert report["llm"]["round1"]["calls"] == 20
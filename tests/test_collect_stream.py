@@ -0,0 +1,48 @@
+import sys
+from contextlib import closing
+from itertools import islice
+
+import pytest
+
+from pipeline.metrics import RunMetrics
+from pipeline.run_daily import run_node_jsonl
+
+
+def test_streams_json_lines_and_tees_raw_output(tmp_path):
+    script = "import json\nfor i in range(3):\n    print(json.dumps({'title': f'T{i}'}), flush=True)\nprint('not json')\n"
+    out_path = tmp_path / "collect-result.jsonl"
+
+    items = run_node_jsonl([sys.executable, "-c", script], cwd=tmp_path, out_path=out_path)
+    first = next(items)
+    assert first == {"title": "T0"}
+    assert [x["title"] for x in items] == ["T1", "T2"]
+
+    raw = out_path.read_text(encoding="utf-8").splitlines()
+    assert len(raw) == 4 and raw[-1] == "not json"
+
+
+def test_raises_when_stream_fails_without_items(tmp_path):
+    items = run_node_jsonl(
+        [sys.executable, "-c", "import sys; sys.exit(3)"], cwd=tmp_path, out_path=tmp_path / "out.jsonl"
+    )
+    with pytest.raises(RuntimeError, match="exit=3"):
+        list(items)
+
+
+def test_warns_and_records_when_stream_fails_after_items(tmp_path, capsys):
+    script = "import json, sys\nprint(json.dumps({'title': 'T0'}), flush=True)\nsys.exit(2)\n"
+    metrics = RunMetrics()
+    items = run_node_jsonl([sys.executable, "-c", script], cwd=tmp_path, out_path=tmp_path / "out.jsonl", metrics=metrics)
+    assert [x["title"] for x in items] == ["T0"]
+    assert metrics.extra["collect_stream"] == {"status": "failed", "returncode": 2, "items": 1}
+    assert "exited 2 after 1 item(s)" in capsys.readouterr().err
+
+
+def test_closing_early_terminates_the_producer(tmp_path):
+    script = "import json, time\nfor i in range(1000):\n    print(json.dumps({'title': f'T{i}'}), flush=True)\n    time.sleep(0.01)\n"
+    metrics = RunMetrics()
+    items = run_node_jsonl([sys.executable, "-c", script], cwd=tmp_path, out_path=tmp_path / "out.jsonl", metrics=metrics)
+    with closing(items):
+        assert [x["title"] for x in islice(items, 2)] == ["T0", "T1"]
+    assert metrics.extra["collect_stream"]["status"] == "stopped"
+    assert metrics.extra["collect_stream"]["returncode"] != 0
@@ -0,0 +1,135 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+from pipeline.collector import ArxivCollector, CollectorSettings, merge_shards
+
+FIXTURE = (Path(__file__).parent / "fixtures" / "arxiv_page.xml").read_bytes()
+EMPTY = b'<?xml version="1.0"?><feed xmlns="http://www.w3.org/2005/Atom"></feed>'
+
+
+@pytest.fixture()
+def arxiv_stub():
+    log = []
+    behaviour = {}  # search_query -> "fail" | seconds to stall
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            query = parse_qs(urlsplit(self.path).query)
+            action = behaviour.get(query["search_query"][0])
+            if action == "fail":
+                self.send_response(500)
+                self.send_header("Content-Length", "4")
+                self.end_headers()
+                self.wfile.write(b"boom")
+                return
+            if action:
+                time.sleep(action)
+            if self.headers.get("If-None-Match") == '"v1"':
+                log.append(("304", query["search_query"][0]))
+                self.send_response(304)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            body = FIXTURE if query["start"] == ["0"] else EMPTY
+            log.append(("200", query["search_query"][0]))
+            self.send_response(200)
+            self.send_header("ETag", '"v1"')
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/api/query", log, behaviour
+    server.shutdown()
+    server.server_close()
+
+
+def _collector(endpoint, cache_dir, **settings):
+    spec = json.loads(Path("references/paper_v0.json").read_text(encoding="utf-8"))
+    spec["arxiv"]["search"]["categories"] = ["cs.AI", "cs.AR"]
+    settings = CollectorSettings(endpoint=endpoint, concurrency=2, prefetch=1, rpm=0, **settings)
+    return ArxivCollector(spec, settings=settings, cache_dir=cache_dir)
+
+
+def test_collects_run_date_dedupes_and_normalizes(arxiv_stub, tmp_path):
+    endpoint, _, _ = arxiv_stub
+    items = _collector(endpoint, tmp_path / "cache").collect("2026-03-14", time_zone="Asia/Shanghai")
+
+    assert [x["id"] for x in items] == ["arxiv:2603.01234v2", "arxiv:2603.01111v1"]
+    first = items[0]
+    assert first["title"] == "Chiplet-Aware Scheduling for LLM Inference"
+    assert first["abstract"] == "We schedule LLM inference across chiplets."
+    assert first["categories"] == ["cs.AR", "cs.AI"]
+    assert first["authors"] == ["Ada Lovelace", "Alan Turing"]
+    assert first["url"] == "https://arxiv.org/abs/2603.01234v2"
+    assert first["raw"]["links"]["pdf"] == "http://arxiv.org/pdf/2603.01234v2"
+
+
+def test_revalidates_with_etag_and_parses_cached_body(arxiv_stub, tmp_path):
+    endpoint, log, _ = arxiv_stub
+    first = _collector(endpoint, tmp_path / "cache").collect("2026-03-14", max_items=1)
+    log.clear()
+    again = _collector(endpoint, tmp_path / "cache").collect("2026-03-14", max_items=1)
+
+    assert again == first
+    assert sorted(log) == [("304", "cat:cs.AI"), ("304", "cat:cs.AR")]
+
+
+def test_failed_or_slow_shard_degrades_the_run(arxiv_stub, tmp_path):
+    endpoint, _, behaviour = arxiv_stub
+    behaviour["cat:cs.AR"] = "fail"
+    collector = _collector(endpoint, None)
+    items = collector.collect("2026-03-14")
+
+    assert len(items) == 2
+    assert collector.shards["cs.AI"]["status"] == "ok"
+    assert collector.shards["cs.AR"]["status"] == "failed"
+    assert "500" in collector.shards["cs.AR"]["error"]
+
+    behaviour["cat:cs.AR"] = 1.0
+    collector = _collector(endpoint, None, shard_timeout=0.3)
+    t0 = time.monotonic()
+    assert len(collector.collect("2026-03-14")) == 2
+    assert time.monotonic() - t0 < 0.9
+    assert collector.shards["cs.AR"]["status"] == "timeout"
+
+    behaviour["cat:cs.AI"] = "fail"
+    behaviour["cat:cs.AR"] = "fail"
+    with pytest.raises(RuntimeError, match="every collect shard failed"):
+        _collector(endpoint, None).collect("2026-03-14")
+
+
+def test_shard_quota_and_round_robin_merge(arxiv_stub, tmp_path):
+    endpoint, _, _ = arxiv_stub
+    collector = _collector(endpoint, None, shard_quota=1)
+    assert [x["id"] for x in collector.collect("2026-03-14")] == ["arxiv:2603.01234v2"]
+    assert collector.shards["cs.AI"]["items"] == 1
+
+    busy = [(f"a{i}", {"id": f"a{i}"}) for i in range(5)]
+    quiet = [("a0", {"id": "a0-cross"}), ("b0", {"id": "b0"})]
+    assert [x["id"] for x in merge_shards([busy, quiet], 3)] == ["a0", "a1", "b0"]
+
+
+def test_waiting_on_the_rate_limiter_does_not_time_out_a_shard(arxiv_stub, tmp_path):
+    endpoint, log, _ = arxiv_stub
+    spec = json.loads(Path("references/paper_v0.json").read_text(encoding="utf-8"))
+    spec["arxiv"]["search"]["categories"] = ["cs.AI", "cs.AR"]
+    # 6 requests at 300 RPM queue for ~1s on the shared limiter, well past the 0.3s timeout.
+    settings = CollectorSettings(endpoint=endpoint, concurrency=2, prefetch=3, rpm=300, shard_timeout=0.3)
+    collector = ArxivCollector(spec, settings=settings, cache_dir=None)
+
+    assert len(collector.collect("2026-03-14")) == 2
+    assert {r["status"] for r in collector.shards.values()} == {"ok"}
+    assert len(log) == 6
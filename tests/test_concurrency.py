@@ -0,0 +1,56 @@
+import importlib.util
+import threading
+import time
+from pathlib import Path
+
+
+def _load_module():
+    mod_path = Path("pipeline/concurrency.py")
+    spec = importlib.util.spec_from_file_location("concurrency", mod_path)
+    assert spec and spec.loader
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_engine_map_keeps_input_order_under_concurrency():
+    module = _load_module()
+
+    def slow_square(x):
+        time.sleep(0.02 * (5 - x))
+        return x * x
+
+    with module.ScoringEngine(concurrency=5) as engine:
+        assert engine.map(slow_square, range(5)) == [0, 1, 4, 9, 16]
+
+
+def test_engine_caps_in_flight_calls():
+    module = _load_module()
+    lock = threading.Lock()
+    state = {"active": 0, "peak": 0}
+
+    def track(_):
+        with lock:
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+        time.sleep(0.01)
+        with lock:
+            state["active"] -= 1
+
+    with module.ScoringEngine(concurrency=3) as engine:
+        engine.map(track, range(12))
+    assert state["peak"] <= 3
+
+
+def test_rate_limiter_spaces_requests_per_minute():
+    module = _load_module()
+    clock = {"now": 0.0}
+    sleeps = []
+
+    def sleep(seconds):
+        sleeps.append(seconds)
+
+    limiter = module.RateLimiter(120, clock=lambda: clock["now"], sleep=sleep)
+    for _ in range(3):
+        limiter.acquire()
+    assert sleeps == [0.5, 1.0]
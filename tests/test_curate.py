@@ -13,7 +13,7 @@ def _load_normalize_entry():
 
 def test_adds_pdf_url_from_arxiv_id():
     normalize_entry = _load_normalize_entry()
-    out = normalize_entry({"arxiv_id": "2502.01234", "translated_zh": "a" * 30})
+    out = normalize_entry({"title": "T", "arxiv_id": "2502.01234", "translated_zh": "a" * 30, "score": 90})
     assert out["pdf_url"] == "https://arxiv.org/pdf/2502.01234.pdf"
 
 
@@ -21,3 +21,44 @@ def test_rejects_over_300_chars_translation():
     normalize_entry = _load_normalize_entry()
     out = normalize_entry({"arxiv_id": "2502.01234", "translated_zh": "中" * 301})
     assert out is None
+
+
+def test_curator_compiles_gates_and_counts_rejections():
+    spec = importlib.util.spec_from_file_location("curate", Path("pipeline/curate.py"))
+    assert spec and spec.loader
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    curator = module.Curator.from_config({"quality_gates": {"max_translated_chars": 10}}, threshold=80)
+    items = [
+        {"arxiv_id": "2502.00001", "translated_zh": "ok", "score": 90},
+        {"arxiv_id": "2502.00002", "translated_zh": "ok", "score": 70},
+        {"arxiv_id": "2502.00003", "translated_zh": "x" * 11, "score": 95},
+        {"arxiv_id": "", "translated_zh": "ok", "score": 95},
+        {"arxiv_id": "2502.00005", "translated_zh": "ok", "score": "n/a"},
+        {"arxiv_id": "2502.00006", "translated_zh": "ok"},
+    ]
+    kept, rejections = curator.curate(items, ["hw"] * len(items))
+
+    assert [(x["arxiv_id"], x["topic"]) for x in kept] == [("2502.00001", "hw")]
+    assert rejections == {
+        "below_threshold": 1,
+        "translation_too_long": 1,
+        "missing_arxiv_id": 1,
+        "invalid_score": 1,
+        "missing_score": 1,
+    }
+
+
+def test_pdf_url_gate_rejects_ids_it_cannot_derive_a_link_from():
+    spec = importlib.util.spec_from_file_location("curate", Path("pipeline/curate.py"))
+    assert spec and spec.loader
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    item = {"arxiv_id": "openreview:abc123", "translated_zh": "ok", "score": 90}
+    assert module.Curator(threshold=80).check(item) == (None, "missing_pdf_url")
+    assert module.Curator(threshold=80).check({**item, "pdf_url": "https://example.org/a.pdf"})[0] is not None
+    assert module.Curator(threshold=80, require_pdf_url=False).check(item)[0]["pdf_url"] == ""
+    old_style = module.Curator(threshold=80).check({**item, "arxiv_id": "hep-th/9901001v2"})[0]
+    assert old_style["pdf_url"] == "https://arxiv.org/pdf/hep-th/9901001v2.pdf"
@@ -0,0 +1,70 @@
+import threading
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+from pipeline.daemon import Daemon, next_scheduled_run, send_trigger
+
+CFG = {"timezone": "Asia/Shanghai", "publish_time": "08:30"}
+TZ = ZoneInfo("Asia/Shanghai")
+
+
+def test_next_run_is_publish_time_minus_lead():
+    now = datetime(2026, 3, 14, 6, 0, tzinfo=TZ)
+    assert next_scheduled_run(now, CFG, 60) == datetime(2026, 3, 14, 7, 30, tzinfo=TZ)
+
+
+def test_next_run_rolls_over_after_start_time():
+    now = datetime(2026, 3, 13, 23, 45, tzinfo=ZoneInfo("UTC"))  # 07:45 on the 14th in Shanghai
+    assert next_scheduled_run(now, CFG, 60) == datetime(2026, 3, 15, 7, 30, tzinfo=TZ)
+
+
+def test_socket_trigger_runs_in_process(tmp_path):
+    calls = []
+    daemon = Daemon(
+        socket_path=tmp_path / "d.sock",
+        pipeline_cfg=CFG,
+        lead_minutes=60,
+        runner=lambda run_date, **kw: calls.append((run_date, kw)) or daemon.stop(),
+    )
+    daemon.warm_up = lambda: None
+    worker = threading.Thread(target=daemon.serve_forever)
+    worker.start()
+    for _ in range(200):
+        if daemon.socket_path.exists():
+            break
+        threading.Event().wait(0.01)
+
+    reply = send_trigger({"date": "2026-03-14", "from_stage": "build"}, daemon.socket_path)
+    worker.join(timeout=5)
+
+    assert reply["ok"] is True
+    assert calls == [("2026-03-14", {"mode": "paper", "resume": False, "from_stage": "build"})]
+    assert not daemon.socket_path.exists()
+
+
+def test_slot_passed_during_a_manual_run_still_runs(tmp_path):
+    clock = {"now": datetime(2026, 3, 14, 7, 29, tzinfo=TZ)}
+    calls = []
+
+    def runner(run_date, **kw):
+        calls.append((run_date, kw["resume"]))
+        if len(calls) == 1:
+            clock["now"] = datetime(2026, 3, 14, 7, 45, tzinfo=TZ)  # the manual run overruns the 07:30 slot
+        else:
+            daemon.stop()
+
+    daemon = Daemon(
+        socket_path=tmp_path / "d.sock",
+        pipeline_cfg=CFG,
+        lead_minutes=60,
+        runner=runner,
+        clock=lambda: clock["now"],
+    )
+    daemon.warm_up = lambda: None
+    daemon.requests.put({"date": "2026-03-13"})
+    worker = threading.Thread(target=daemon.serve_forever)
+    worker.start()
+    worker.join(timeout=5)
+
+    assert calls == [("2026-03-13", False), ("2026-03-14", True)]
+    assert daemon.last_scheduled == "2026-03-14"
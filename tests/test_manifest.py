@@ -0,0 +1,30 @@
+import json
+
+from pipeline import manifest
+from pipeline.atomic import atomic_write_json
+
+
+def _day(root, run_date, items):
+    atomic_write_json(root / "output" / f"{run_date}.json", {"date": run_date, "items": items})
+
+
+def test_changed_lists_only_modified_artifacts(tmp_path):
+    _day(tmp_path, "2026-03-13", [{"arxiv_id": "1"}])
+    _day(tmp_path, "2026-03-14", [{"arxiv_id": "2"}])
+    (tmp_path / "output" / "site").mkdir()
+    (tmp_path / "output" / "site" / "index.html").write_text("<html/>")
+    published = manifest.update(tmp_path)
+
+    _day(tmp_path, "2026-03-14", [{"arxiv_id": "2"}, {"arxiv_id": "3"}])
+    current = manifest.update(tmp_path)
+
+    assert manifest.changed(published, current) == ["output/2026-03-14.json"]
+    assert json.loads((tmp_path / "output" / "manifest.json").read_text())["artifacts"] == current["artifacts"]
+
+
+def test_atomic_write_leaves_no_temp_files(tmp_path):
+    target = tmp_path / "out" / "a.json"
+    atomic_write_json(target, {"x": 1})
+    atomic_write_json(target, {"x": 2})
+    assert json.loads(target.read_text()) == {"x": 2}
+    assert [p.name for p in target.parent.iterdir()] == ["a.json"]
@@ -0,0 +1,62 @@
+import importlib.util
+import json
+from datetime import datetime, timedelta
+from pathlib import Path
+from zoneinfo import ZoneInfo
+
+
+def _load_module():
+    mod_path = Path("pipeline/metrics.py")
+    spec = importlib.util.spec_from_file_location("metrics", mod_path)
+    assert spec and spec.loader
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_records_stages_llm_percentiles_and_rejections(tmp_path):
+    module = _load_module()
+    metrics = module.RunMetrics("2026-02-20", plan=["collect", "score"])
+    with metrics.stage("collect"):
+        metrics.count("collect", items_out=30)
+    for _ in range(3):
+        with metrics.llm_call("round1"):
+            pass
+    metrics.reject("below_threshold", 2)
+
+    data = metrics.write(tmp_path / "2026-02-20.metrics.json")
+    assert data["stages"]["collect"]["items_out"] == 30
+    assert "seconds" in data["stages"]["collect"]
+    assert data["llm"]["round1"]["calls"] == 3
+    assert data["curate_rejections"] == {"below_threshold": 2}
+    assert data["sla"]["deadline"] is None
+    assert json.loads((tmp_path / "2026-02-20.metrics.json").read_text())["status"] == "ok"
+
+
+def test_flags_run_projected_past_deadline():
+    module = _load_module()
+    tz = ZoneInfo("Asia/Shanghai")
+    deadline = datetime.now(tz) + timedelta(minutes=5)
+    previous = {"stages": {"score": {"seconds": 3600}, "build": {"seconds": 30}}}
+    metrics = module.RunMetrics("x", plan=["collect", "score", "build"], deadline=deadline, previous=previous)
+    with metrics.stage("collect"):
+        pass
+    assert metrics.at_risk
+
+
+def test_deadline_only_applies_to_today_and_prometheus_export(tmp_path):
+    module = _load_module()
+    tz = ZoneInfo("Asia/Shanghai")
+    now = datetime(2026, 2, 20, 7, 0, tzinfo=tz)
+    cfg = {"timezone": "Asia/Shanghai", "publish_time": "08:30"}
+    assert module.publish_deadline("2026-02-20", cfg, now=now) == now.replace(hour=8, minute=30)
+    assert module.publish_deadline("2026-02-19", cfg, now=now) is None
+
+    metrics = module.RunMetrics("2026-02-20")
+    with metrics.llm_call("round2"):
+        pass
+    prom = tmp_path / "daily_paper.prom"
+    module.write_prometheus(prom, metrics.to_dict())
+    text = prom.read_text()
+    assert 'daily_paper_llm_calls{round="round2"} 1' in text
+    assert "daily_paper_sla_at_risk 0" in text
@@ -0,0 +1,43 @@
+import json
+
+import pytest
+
+from pipeline.models import PaperItem
+
+COLLECTED = {
+    "id": "arxiv:2603.01234v2",
+    "url": "https://arxiv.org/abs/2603.01234v2",
+    "title": " Chiplet-Aware Scheduling ",
+    "abstract": "We schedule.",
+    "categories": ["cs.AR", "cs.AI"],
+    "authors": ["Ada Lovelace"],
+    "source": "arxiv",
+    "publishedAt": "2026-03-14T02:00:00+00:00",
+    "publishedDate": "2026-03-14",
+    "raw": {"summary": "We schedule.", "links": {}},
+}
+
+
+def test_from_dict_keeps_only_pipeline_fields_and_round_trips():
+    item = PaperItem.from_dict(COLLECTED)
+
+    assert item.arxiv_id == "2603.01234v2"
+    assert item.title == "Chiplet-Aware Scheduling"
+    assert item.published_date == "2026-03-14"
+    assert not hasattr(item, "__dict__")
+    data = item.to_dict()
+    assert "raw" not in data and "authors" not in data
+    assert data["publishedAt"] == COLLECTED["publishedAt"]
+    assert PaperItem.from_dict(json.loads(json.dumps(data))) == item
+
+
+def test_dict_style_access_treats_none_as_absent():
+    item = PaperItem.from_dict(COLLECTED)
+    assert "second_score" not in item and item.get("first_score", 0) == 0
+    item["first_score"] = 88
+    item["topic"] = "芯片与硬件架构"
+    assert item["first_score"] == 88 and "topic" in item and item.get("publishedDate") == "2026-03-14"
+    with pytest.raises(KeyError):
+        item["score"]
+    with pytest.raises(KeyError):
+        item["raw"] = {}
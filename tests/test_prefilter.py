@@ -0,0 +1,39 @@
+import importlib.util
+import json
+from pathlib import Path
+
+
+def _load_module():
+    mod_path = Path("pipeline/prefilter.py")
+    spec = importlib.util.spec_from_file_location("prefilter", mod_path)
+    assert spec and spec.loader
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_keeps_most_relevant_items_in_collection_order():
+    module = _load_module()
+    profile = module.InterestProfile.from_texts(["Chiplet-aware NPU scheduling", "HBM bandwidth for LLM inference"])
+    items = [
+        {"title": "Protein folding with diffusion", "abstract": "biology"},
+        {"title": "LLM inference on chiplet accelerators", "abstract": "HBM bandwidth bound"},
+        {"title": "Robot grasping", "abstract": "manipulation"},
+        {"title": "NPU scheduling", "abstract": "chiplet interconnect"},
+    ]
+    kept = module.prefilter(items, profile, 2)
+    assert [x["title"] for x in kept] == ["LLM inference on chiplet accelerators", "NPU scheduling"]
+
+
+def test_empty_profile_falls_back_to_truncation():
+    module = _load_module()
+    items = [{"title": f"T{i}"} for i in range(5)]
+    assert module.prefilter(items, module.InterestProfile({}), 3) == items[:3]
+
+
+def test_profile_reads_published_titles(tmp_path):
+    module = _load_module()
+    payload = {"date": "2026-02-20", "items": [{"title": "Chiplet-aware NPU"}]}
+    (tmp_path / "2026-02-20.json").write_text(json.dumps(payload), encoding="utf-8")
+    profile = module.InterestProfile.from_archive(tmp_path)
+    assert set(profile.weights) == {"chiplet", "aware", "npu"}
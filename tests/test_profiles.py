@@ -0,0 +1,39 @@
+import json
+import shutil
+
+from pipeline.run_daily import DailyRun, Paths
+
+PROFILES = """
+profiles:
+  - name: strict
+    score_threshold: 90
+  - name: broad
+    mode: news
+    score_threshold: 60
+    output_dir: output/broad
+"""
+
+
+def test_profiles_recurate_shared_scores_without_rescoring(tmp_path):
+    (tmp_path / "config").mkdir()
+    shutil.copy("config/topics.yaml", tmp_path / "config" / "topics.yaml")
+    (tmp_path / "config" / "profiles.yaml").write_text(PROFILES, encoding="utf-8")
+    run = DailyRun("2026-03-14", paths=Paths.from_root(tmp_path))
+    run.build_profile_sites = False
+
+    scored = [
+        {"title": f"Paper {s}", "arxiv_id": f"2603.0000{i}", "score": s, "translated_zh": "摘要", "categories": ["cs.AR"]}
+        for i, s in enumerate([95, 70, 50])
+    ]
+    run.score_out_path.parent.mkdir(parents=True)
+    run.score_out_path.write_text(json.dumps({"items": scored}), encoding="utf-8")
+
+    strict, broad = run.run_profiles(None)
+
+    assert strict == tmp_path / "output" / "profiles" / "strict" / "2026-03-14.json"
+    assert broad == tmp_path / "output" / "broad" / "2026-03-14.json"
+    assert [x["score"] for x in json.loads(strict.read_text())["items"]] == [95]
+    broad_items = json.loads(broad.read_text())["items"]
+    assert [x["score"] for x in broad_items] == [95, 70]
+    assert {x["topic"] for x in broad_items} == {"芯片与硬件架构"}
+    assert run.metrics.extra["profile_rejections"]["broad"] == {"below_threshold": 1}
@@ -0,0 +1,33 @@
+import json
+
+from pipeline.published_index import PublishedIndex
+
+
+def _write_day(output_dir, run_date, items):
+    payload = {"date": run_date, "items": items}
+    (output_dir / f"{run_date}.json").write_text(json.dumps(payload), encoding="utf-8")
+
+
+def test_sync_indexes_archive_and_ignores_version_suffix(tmp_path):
+    output_dir = tmp_path / "output"
+    output_dir.mkdir()
+    _write_day(output_dir, "2026-02-24", [{"arxiv_id": "2502.01234v1"}, {"url": "https://arxiv.org/abs/2502.54321"}])
+
+    with PublishedIndex(tmp_path / "published.sqlite3") as index:
+        assert index.sync(output_dir) == 1
+        assert index.sync(output_dir) == 0
+        later = index.before("2026-02-25")
+        assert "2502.01234v2" in later
+        assert "2502.54321" in later
+        assert "2502.99999" not in later
+        # A re-run of the same day must not filter its own papers.
+        assert "2502.01234v1" not in index.before("2026-02-24")
+
+
+def test_record_day_replaces_previous_ids_for_that_day(tmp_path):
+    with PublishedIndex(tmp_path / "published.sqlite3") as index:
+        index.record_day("2026-02-24", [{"arxiv_id": "2502.00001"}])
+        index.record_day("2026-02-24", [{"arxiv_id": "2502.00002"}])
+        view = index.before("2026-03-01")
+        assert "2502.00001" not in view
+        assert "2502.00002" in view
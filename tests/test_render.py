@@ -1,4 +1,6 @@
 import importlib.util
+import json
+import xml.etree.ElementTree as ET
 from pathlib import Path
 
 
@@ -28,3 +30,99 @@ def test_render_includes_pdf_link():
     )
     assert "https://arxiv.org/pdf/1.pdf" in md
     assert "芯片与硬件架构" in md
+
+
+def _day(output_dir, run_date, items):
+    (output_dir / f"{run_date}.json").write_text(json.dumps({"date": run_date, "items": items}), encoding="utf-8")
+
+
+def _item(arxiv_id, title, score=90):
+    return {
+        "title": title,
+        "topic": "芯片与硬件架构",
+        "score": score,
+        "translated_zh": "摘要 <b>&</b>",
+        "arxiv_id": arxiv_id,
+        "abs_url": f"https://arxiv.org/abs/{arxiv_id}",
+        "pdf_url": f"https://arxiv.org/pdf/{arxiv_id}.pdf",
+        "published_at": "2026-03-13T20:00:00+00:00",
+    }
+
+
+def test_render_archive_streams_feeds_and_rerenders_only_changed_days(tmp_path):
+    from pipeline.render import FeedSettings, render_archive
+
+    output_dir, site_dir, cache_dir = tmp_path / "output", tmp_path / "output" / "site", tmp_path / "cache"
+    output_dir.mkdir()
+    _day(output_dir, "2026-03-13", [_item("2603.00001", "Old")])
+    _day(output_dir, "2026-03-14", [_item("2603.00002", "New A"), _item("2603.00003", "New B")])
+    settings = FeedSettings(site_url="https://papers.example", workers=2)
+
+    assert render_archive(output_dir, site_dir, cache_dir, settings) == {"days": 2, "rendered": 2, "removed": 0}
+    feeds = site_dir / "feeds"
+    rss = ET.parse(feeds / "rss.xml").getroot()
+    assert [x.findtext("title") for x in rss.iter("item")] == ["New A", "New B", "Old"]
+    assert rss.find("channel/item/description").text == "摘要 <b>&</b>"
+    atom = ET.parse(feeds / "atom.xml").getroot()
+    assert len(atom.findall("{http://www.w3.org/2005/Atom}entry")) == 3
+    feed = json.loads((feeds / "feed.json").read_text(encoding="utf-8"))
+    assert feed["feed_url"] == "https://papers.example/feeds/feed.json"
+    assert [x["id"] for x in feed["items"]] == [f"https://arxiv.org/abs/2603.0000{i}" for i in (2, 3, 1)]
+    assert (feeds / "2026-03-14.md").read_text(encoding="utf-8").startswith("# Daily Paper 2026-03-14\n")
+    archive = (feeds / "archive.md").read_text(encoding="utf-8")
+    assert archive.index("2026-03-14") < archive.index("2026-03-13")
+
+    assert render_archive(output_dir, site_dir, cache_dir, settings)["rendered"] == 0
+
+    _day(output_dir, "2026-03-14", [_item("2603.00002", "New A (v2)")])
+    (output_dir / "2026-03-13.json").unlink()
+    assert render_archive(output_dir, site_dir, cache_dir, settings) == {"days": 1, "rendered": 1, "removed": 1}
+    feed = json.loads((feeds / "feed.json").read_text(encoding="utf-8"))
+    assert [x["title"] for x in feed["items"]] == ["New A (v2)"]
+    assert not (feeds / "2026-03-13.md").exists()
+
+
+def test_render_archive_skips_channel_feeds_without_site_url(tmp_path, capsys):
+    from pipeline.render import FeedSettings, render_archive
+
+    output_dir, site_dir, cache_dir = tmp_path / "output", tmp_path / "output" / "site", tmp_path / "cache"
+    output_dir.mkdir()
+    _day(output_dir, "2026-03-14", [_item("2603.00002", "New A")])
+    feeds = site_dir / "feeds"
+    feeds.mkdir(parents=True)
+    (feeds / "rss.xml").write_text("<rss/>", encoding="utf-8")  # left over from a run with a site URL
+
+    assert render_archive(output_dir, site_dir, cache_dir, FeedSettings(workers=1))["rendered"] == 1
+    assert "set site_url in config/pipeline.yaml" in capsys.readouterr().err
+    assert not any((feeds / name).exists() for name in ("rss.xml", "atom.xml", "feed.json"))
+    assert (feeds / "archive.md").read_text(encoding="utf-8").startswith("# Daily Paper 2026-03-14\n")
+
+    assert render_archive(output_dir, site_dir, cache_dir, FeedSettings(workers=1))["rendered"] == 0
+    assert capsys.readouterr().err == ""
+
+
+def test_feed_settings_read_site_url_from_pipeline_yaml(monkeypatch):
+    from pipeline.render import FeedSettings
+
+    monkeypatch.delenv("DAILY_PAPER_SITE_URL", raising=False)
+    assert FeedSettings.from_env("paper", {"site_url": "https://papers.example/"}).link("index.html") == (
+        "https://papers.example/index.html"
+    )
+    monkeypatch.setenv("DAILY_PAPER_SITE_URL", "https://mirror.example")
+    assert FeedSettings.from_env("paper", {"site_url": "https://papers.example"}).site_url == "https://mirror.example"
+
+
+def test_render_archive_handles_the_committed_output_directory(tmp_path):
+    from pipeline.render import FeedSettings, render_archive
+
+    settings = FeedSettings(site_url="https://papers.example", workers=1)
+    summary = render_archive(Path("output"), tmp_path / "site", tmp_path / "cache", settings)
+    assert summary["rendered"] == summary["days"] > 0
+
+    feeds = tmp_path / "site" / "feeds"
+    links = [x.findtext("link") for x in ET.parse(feeds / "rss.xml").getroot().iter("item")]
+    assert links and all(link.startswith("https://arxiv.org/abs/") for link in links)
+    day = (feeds / "2026-02-18.md").read_text(encoding="utf-8")
+    assert "- abs: https://arxiv.org/abs/2502.12345\n" in day  # from `id`
+    assert "- pdf: https://arxiv.org/pdf/2502.54321.pdf\n" in day  # from `url`
+    assert "## 1." not in (feeds / "2026-01-31.md").read_text(encoding="utf-8")  # no usable link
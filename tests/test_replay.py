@@ -0,0 +1,46 @@
+import json
+import shutil
+
+from pipeline.adapters import iter_items
+from pipeline.run_daily import Paths, recorded_dates, replay
+
+
+def test_iter_items_streams_across_chunk_boundaries(tmp_path):
+    items = [{"arxiv_id": f"2603.{i:05d}", "title": "x" * i, "nested": {"a": [1, "]"]}} for i in range(50)]
+    payload = tmp_path / "score.json"
+    payload.write_text(json.dumps({"date": "2026-03-14", "items": items}, indent=2), encoding="utf-8")
+    bare = tmp_path / "bare.json"
+    bare.write_text(json.dumps(items), encoding="utf-8")
+    lines = tmp_path / "collect.jsonl"
+    lines.write_text("".join(json.dumps(x) + "\n" for x in items), encoding="utf-8")
+
+    assert list(iter_items(payload, chunk_size=7)) == items
+    assert list(iter_items(bare, chunk_size=3)) == items
+    assert list(iter_items(lines)) == items
+
+
+def test_replay_recurates_recorded_scores_offline(tmp_path, monkeypatch):
+    (tmp_path / "config").mkdir()
+    shutil.copy("config/topics.yaml", tmp_path / "config" / "topics.yaml")
+    tmp = tmp_path / ".tmp"
+    tmp.mkdir()
+    scored = [
+        {"title": f"Paper {s}", "arxiv_id": f"2603.0000{i}", "score": s, "translated_zh": "摘要", "categories": ["cs.AR"]}
+        for i, s in enumerate([95, 82, 60])
+    ]
+    (tmp / "score-result-2026-03-14.json").write_text(json.dumps({"items": scored}), encoding="utf-8")
+    (tmp / "collect-result-2026-03-14.json").write_text(json.dumps({"items": scored * 2}), encoding="utf-8")
+    paths = Paths.from_root(tmp_path)
+    assert recorded_dates(paths) == ["2026-03-14"]
+
+    monkeypatch.setenv("DAILY_PAPER_SCORE_THRESHOLD", "80")
+    assert replay(None, build=False, paths=paths) == [tmp_path / "output" / "2026-03-14.json"]
+    day = json.loads((tmp_path / "output" / "2026-03-14.json").read_text())
+    assert [x["score"] for x in day["items"]] == [95, 82]
+    assert {x["topic"] for x in day["items"]} == {"芯片与硬件架构"}
+
+    monkeypatch.setenv("DAILY_PAPER_SCORE_THRESHOLD", "90")
+    assert replay(["2026-03-14", "2026-03-15"], build=False, paths=paths) == [tmp_path / "output" / "2026-03-14.json"]
+    day = json.loads((tmp_path / "output" / "2026-03-14.json").read_text())
+    assert [x["score"] for x in day["items"]] == [95]
+    assert (tmp_path / "output" / "manifest.json").exists()
@@ -0,0 +1,139 @@
+import threading
+import time
+
+import pytest
+
+from pipeline.bench import StubProcessor, stub_smooth_score, synthetic_items
+from pipeline.resilience import CallPolicy, CallTimeout, CircuitBreaker, CircuitOpenError, ResilientCaller
+from pipeline.score import ScoreSettings, score_items
+from pipeline.score_cache import ScoreCache
+
+
+def _caller(**policy):
+    return ResilientCaller(CallPolicy(**policy), sleep=lambda s: None)
+
+
+def test_hung_call_times_out():
+    hang = threading.Event()
+    caller = _caller(timeout=0.05, retries=0)
+    with pytest.raises(CallTimeout):
+        caller.call("round2", hang.wait)
+    hang.set()
+
+
+def test_retries_transient_failures_with_jittered_backoff():
+    sleeps = []
+    caller = ResilientCaller(CallPolicy(retries=2, backoff=1.0), sleep=sleeps.append)
+    attempts = iter([ValueError("boom"), ValueError("boom"), "ok"])
+
+    def flaky():
+        value = next(attempts)
+        if isinstance(value, Exception):
+            raise value
+        return value
+
+    assert caller.call("round1", flaky) == "ok"
+    assert len(sleeps) == 2 and 0 <= sleeps[0] <= 1.0 and 0 <= sleeps[1] <= 2.0
+
+
+def test_slow_call_is_hedged():
+    caller = _caller(timeout=5, hedge_min_samples=3, hedge_percentile=90)
+    caller.latencies["round2"] = [0.01, 0.01, 0.01]
+    calls = []
+
+    def first_hangs():
+        calls.append(1)
+        if len(calls) == 1:
+            time.sleep(2)
+            return "slow"
+        return "fast"
+
+    t0 = time.monotonic()
+    assert caller.call("round2", first_hangs) == "fast"
+    assert time.monotonic() - t0 < 1 and caller.hedges == 1
+
+
+def test_breaker_opens_then_half_opens_after_cooldown():
+    clock = {"now": 0.0}
+    breaker = CircuitBreaker(2, 10.0, clock=lambda: clock["now"])
+    breaker.failure()
+    breaker.failure()
+    assert breaker.state == "open" and not breaker.allow()
+    clock["now"] = 11.0
+    assert breaker.allow() and not breaker.allow()  # one trial call
+    breaker.success()
+    assert breaker.state == "closed"
+
+
+def test_round2_falls_back_to_first_score_when_provider_fails():
+    class Failing(StubProcessor):
+        def score_article(self, title, abstract, source):
+            raise ConnectionError("provider down")
+
+    settings = ScoreSettings(max_items=8, topk=8, round2_min_first=0, concurrency=1)
+    caller = _caller(retries=0, breaker_failures=2)
+    scored = score_items(
+        synthetic_items(8),
+        cache=ScoreCache(None),
+        backend=(Failing(), stub_smooth_score),
+        settings=settings,
+        caller=caller,
+    )
+
+    assert all(x["score"] == x["first_score"] and x["translated_zh"] == "" for x in scored)
+    assert caller.breaker.state == "open"
+    with pytest.raises(CircuitOpenError):
+        caller.call("round2", lambda: None)
+
+
+def test_round1_failures_drop_papers_instead_of_failing_the_run():
+    class Flaky(StubProcessor):
+        def score_article_first_round(self, title, abstract, source):
+            if title.startswith(tuple("ABCDEFGHIJKLM")):
+                raise ConnectionError("provider down")
+            return super().score_article_first_round(title, abstract, source)
+
+    items = synthetic_items(12)
+    settings = ScoreSettings(max_items=12, topk=2, round2_min_first=0, concurrency=1)
+    caller = _caller(retries=0, breaker_failures=2)
+    scored = score_items(
+        items, cache=ScoreCache(None), backend=(Flaky(), stub_smooth_score), settings=settings, caller=caller
+    )
+
+    assert 0 < len(scored) < 12
+    assert all(x.first_score is not None for x in scored)
+
+
+def test_every_attempt_and_hedge_takes_a_rate_limit_turn():
+    turns = []
+
+    class Limiter:
+        def acquire(self):
+            turns.append(1)
+
+    caller = ResilientCaller(CallPolicy(retries=2, backoff=0), sleep=lambda s: None, limiter=Limiter())
+    attempts = iter([ValueError("boom"), "ok"])
+
+    def flaky():
+        value = next(attempts)
+        if isinstance(value, Exception):
+            raise value
+        return value
+
+    assert caller.call("round1", flaky) == "ok"
+    assert len(turns) == 2
+
+
+def test_in_flight_cap_bounds_abandoned_calls():
+    release = threading.Event()
+    running = []
+
+    def hang():
+        running.append(1)
+        release.wait()
+
+    caller = _caller(timeout=0.05, retries=3, max_in_flight=2, breaker_failures=0)
+    with pytest.raises(CallTimeout):
+        caller.call("round2", hang)
+    assert len(running) == 2  # the later attempts found no free slot
+    release.set()
@@ -0,0 +1,56 @@
+from datetime import datetime, timedelta, timezone
+
+from pipeline.bench import StubProcessor, stub_smooth_score, synthetic_items
+from pipeline.metrics import RunMetrics
+from pipeline.round2_scheduler import Round2Scheduler
+from pipeline.score import ScoreSettings, score_items
+from pipeline.score_cache import ScoreCache
+
+
+def test_stops_admitting_when_projected_finish_passes_deadline():
+    clock = {"now": 0.0}
+    scheduler = Round2Scheduler(deadline=100.0, est_seconds=30.0, clock=lambda: clock["now"])
+    assert scheduler.admit()
+    scheduler.record(50.0, 100)  # observed p90 is now 50s
+    clock["now"] = 40.0
+    assert scheduler.admit()
+    clock["now"] = 60.0
+    assert not scheduler.admit()
+    assert scheduler.summary()["stop_reason"] == "deadline"
+
+
+def test_token_budget_counts_calls_in_flight():
+    scheduler = Round2Scheduler(token_budget=3000, est_tokens=1000)
+    assert scheduler.admit() and scheduler.admit() and scheduler.admit()
+    assert not scheduler.admit()
+    assert not scheduler.admit()  # refusals are sticky
+    assert scheduler.summary()["skipped"] == 2
+
+
+def test_skipped_candidates_fall_back_to_first_score():
+    items = synthetic_items(12)
+    settings = ScoreSettings(max_items=12, topk=12, round2_min_first=0, concurrency=1, round2_token_budget=1)
+    scored = score_items(items, cache=ScoreCache(None), backend=(StubProcessor(), stub_smooth_score), settings=settings)
+
+    assert all("second_score" not in x for x in scored)
+    assert all(x["score"] == x["first_score"] and x["translated_zh"] == "" for x in scored)
+
+
+def test_run_started_after_the_deadline_still_scores_round_two(capsys):
+    items = synthetic_items(5)
+    settings = ScoreSettings(max_items=5, topk=5, round2_min_first=0, concurrency=1)
+    metrics = RunMetrics("2026-03-14", deadline=datetime.now(timezone.utc) - timedelta(minutes=10))
+    scored = score_items(
+        items, cache=ScoreCache(None), backend=(StubProcessor(), stub_smooth_score), settings=settings, metrics=metrics
+    )
+
+    assert len(scored) == 5 and all(x["translated_zh"] for x in scored)
+    assert metrics.extra["round2_scheduler"]["skipped"] == 0
+    assert metrics.extra["round2_scheduler"]["deadline"] is None
+    assert "too late to meet the SLA deadline" in capsys.readouterr().out
+
+
+def test_sla_deadline_still_applies_when_it_can_be_met():
+    settings = ScoreSettings(round2_reserve_seconds=300, round2_est_seconds=20)
+    assert settings.round2_deadline(1000.0, 0.0) == 700.0
+    assert settings.round2_deadline(1000.0, 690.0) is None
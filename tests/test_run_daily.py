@@ -15,3 +15,48 @@ def test_plan_contains_five_stages():
     build_plan = _load_build_plan()
     stages = build_plan("2026-02-20")
     assert stages == ["collect", "score", "curate", "render", "build"]
+
+
+def test_score_fingerprint_ignores_throughput_settings(monkeypatch):
+    from pipeline.run_daily import DailyRun
+
+    def score_fingerprint():
+        stage = next(s for s in DailyRun("2026-02-20").stages(["score"]) if s.name == "score")
+        return stage.fingerprint
+
+    base = score_fingerprint()
+    monkeypatch.setenv("DAILY_PAPER_SCORE_CONCURRENCY", "16")
+    monkeypatch.setenv("DAILY_PAPER_LLM_RPM", "30")
+    assert score_fingerprint() == base
+    monkeypatch.setenv("DAILY_PAPER_TOPK", "3")
+    assert score_fingerprint() != base
+
+
+def test_prefilter_ranks_only_papers_not_yet_published(tmp_path, monkeypatch):
+    import json
+    import shutil
+
+    from pipeline import run_daily
+    from pipeline.run_daily import DailyRun, Paths
+
+    shutil.copytree("config", tmp_path / "config")
+    paths = Paths.from_root(tmp_path)
+    paths.output_dir.mkdir(parents=True)
+    shipped = [
+        {"arxiv_id": "2603.00001", "title": "Sparse attention accelerator for transformer inference"},
+        {"arxiv_id": "2603.00002", "title": "Transformer inference accelerator with sparse attention"},
+    ]
+    (paths.output_dir / "2026-03-13.json").write_text(json.dumps({"date": "2026-03-13", "items": shipped}))
+    fresh = [
+        {"arxiv_id": "2603.00003", "title": "Attention accelerator for edge inference"},
+        {"arxiv_id": "2603.00004", "title": "Sparse transformer kernels"},
+        {"arxiv_id": "2603.00005", "title": "Protein folding benchmarks"},
+    ]
+    seen = []
+    monkeypatch.setattr(run_daily, "score_items", lambda items, **kw: seen.extend(items) or [])
+    monkeypatch.setenv("DAILY_PAPER_PREFILTER", "1")
+    monkeypatch.setenv("DAILY_PAPER_MAX_ITEMS", "2")
+
+    DailyRun("2026-03-14", paths=paths).score(shipped + fresh)
+
+    assert [x.arxiv_id for x in seen] == ["2603.00003", "2603.00004"]
@@ -0,0 +1,47 @@
+import importlib.util
+from pathlib import Path
+
+
+def _load_module():
+    mod_path = Path("pipeline/score_cache.py")
+    spec = importlib.util.spec_from_file_location("score_cache", mod_path)
+    assert spec and spec.loader
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_cache_round_trips_and_counts_hits(tmp_path):
+    module = _load_module()
+    cache = module.ScoreCache(tmp_path / "cache.sqlite3")
+    assert cache.get("round1", "2502.01234v1", "T", "abs") is module.MISS
+    cache.put("round1", "2502.01234v1", "T", "abs", 88)
+    assert cache.get("round1", "2502.01234v1", "T", "abs") == 88
+    assert cache.stats() == {"hits": {"round1": 1}, "misses": {"round1": 1}}
+
+
+def test_cache_misses_on_changed_content_round_or_version(tmp_path):
+    module = _load_module()
+    path = tmp_path / "cache.sqlite3"
+    cache = module.ScoreCache(path)
+    cache.put("round2", "2502.01234v1", "T", "abs", {"score": 90})
+    assert cache.get("round2", "2502.01234v1", "T", "abs v2") is module.MISS
+    assert cache.get("round1", "2502.01234v1", "T", "abs") is module.MISS
+    cache.close()
+
+    bumped = module.ScoreCache(path, version="v2")
+    assert bumped.get("round2", "2502.01234v1", "T", "abs") is module.MISS
+
+
+def test_bypass_skips_lookups_and_size_limit_evicts(tmp_path):
+    module = _load_module()
+    path = tmp_path / "cache.sqlite3"
+    cache = module.ScoreCache(path, bypass=True)
+    cache.put("round1", "a", "T", "x", 1)
+    assert cache.get("round1", "a", "T", "x") is module.MISS
+    cache.put("round1", "b", "T", "x", 2)
+    cache.close()
+
+    small = module.ScoreCache(path, max_entries=1)
+    assert small.get("round1", "a", "T", "x") is module.MISS
+    assert small.get("round1", "b", "T", "x") == 2
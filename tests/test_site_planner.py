@@ -0,0 +1,86 @@
+import json
+import shutil
+from pathlib import Path
+
+import pytest
+
+from pipeline.site_planner import SitePlanner
+
+WEB = Path("web")
+
+
+def _root(tmp_path):
+    shutil.copytree(WEB / "templates", tmp_path / "web" / "templates")
+    shutil.copy(WEB / "generate.js", tmp_path / "web" / "generate.js")
+    (tmp_path / "output").mkdir()
+    return tmp_path
+
+
+def _day(root, run_date, title="T"):
+    payload = {"date": run_date, "items": [{"title": title, "abs_url": "https://arxiv.org/abs/1", "score": 90}]}
+    (root / "output" / f"{run_date}.json").write_text(json.dumps(payload), encoding="utf-8")
+
+
+def _built(planner):
+    plan = planner.plan()
+    for page in plan.pages:
+        path = planner.site_dir / page
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("<html></html>", encoding="utf-8")
+    planner.save(plan)
+    return plan
+
+
+def test_plan_rebuilds_only_affected_pages(tmp_path):
+    root = _root(tmp_path)
+    for d in range(1, 9):
+        _day(root, f"2026-03-0{d}")
+    planner = SitePlanner(root, "paper", sidebar_window=2)
+
+    first = _built(planner)
+    assert first.total == 10 and len(first.pages) == 10
+    assert planner.plan().pages == []
+
+    # Sidebars list dates only, so an edited day rewrites just its page and the archive.
+    _day(root, "2026-03-04", title="changed")
+    assert _built(planner).pages == ["2026-03-04.html", "archive.html"]
+
+    # A new day shifts the sidebar of the newest days.
+    _day(root, "2026-03-09")
+    pages = set(_built(planner).pages)
+    assert pages == {"index.html", "archive.html", "2026-03-09.html", "2026-03-08.html", "2026-03-07.html"}
+
+    # A deleted page is rebuilt even though its inputs are unchanged.
+    (planner.site_dir / "2026-03-02.html").unlink()
+    assert planner.plan().pages == ["2026-03-02.html"]
+
+
+def test_template_change_rebuilds_everything(tmp_path):
+    root = _root(tmp_path)
+    for d in range(1, 4):
+        _day(root, f"2026-03-0{d}")
+    planner = SitePlanner(root, "paper", sidebar_window=5)
+    _built(planner)
+
+    base = root / "web" / "templates" / "base.html"
+    base.write_text(base.read_text(encoding="utf-8") + "\n<!-- v2 -->", encoding="utf-8")
+    assert len(planner.plan().pages) == 5
+
+
+@pytest.mark.skipif(shutil.which("node") is None, reason="node not installed")
+def test_build_runs_generate_for_planned_pages(tmp_path):
+    root = _root(tmp_path)
+    _day(root, "2026-03-01")
+    _day(root, "2026-03-02")
+    planner = SitePlanner(root, "paper", sidebar_window=1)
+
+    planner.build()
+    site = planner.site_dir
+    assert {p.name for p in site.glob("*.html")} == {"index.html", "archive.html", "2026-03-01.html", "2026-03-02.html"}
+
+    before = (site / "2026-03-01.html").stat().st_mtime_ns
+    _day(root, "2026-03-02", title="changed")
+    assert planner.build().pages == ["2026-03-02.html", "index.html", "archive.html"]
+    assert (site / "2026-03-01.html").stat().st_mtime_ns == before
+    assert "changed" in (site / "index.html").read_text(encoding="utf-8")
+    assert planner.build().pages == []
@@ -0,0 +1,82 @@
+import json
+
+import pytest
+
+from pipeline.stages import CheckpointStore, Stage, StageRunner
+
+
+def _pipeline(tmp_path, calls, *, factor=2):
+    def writer(name):
+        def save(value):
+            path = tmp_path / f"{name}.json"
+            path.write_text(json.dumps(value), encoding="utf-8")
+            return path
+
+        return save
+
+    def load(path):
+        return json.loads(path.read_text(encoding="utf-8"))
+
+    def step(name, fn):
+        def run(value):
+            calls.append(name)
+            return fn(value)
+
+        return run
+
+    return [
+        Stage("collect", step("collect", lambda _: [1, 2, 3]), save=writer("collect"), load=load),
+        Stage(
+            "score",
+            step("score", lambda xs: [x * factor for x in xs]),
+            save=writer("score"),
+            load=load,
+            fingerprint={"factor": factor},
+        ),
+        Stage("build", step("build", lambda xs: sum(xs))),
+    ]
+
+
+def test_resume_reuses_valid_checkpoints(tmp_path):
+    store = CheckpointStore(tmp_path / "checkpoints", "2026-02-20")
+    calls = []
+    assert StageRunner(store, log=lambda _: None).run(_pipeline(tmp_path, calls)) == 12
+
+    calls.clear()
+    StageRunner(store, resume=True, log=lambda _: None).run(_pipeline(tmp_path, calls))
+    assert calls == []
+
+
+def test_changed_fingerprint_reruns_stage_and_dependents(tmp_path):
+    store = CheckpointStore(tmp_path / "checkpoints", "2026-02-20")
+    StageRunner(store, log=lambda _: None).run(_pipeline(tmp_path, []))
+
+    calls = []
+    out = StageRunner(store, resume=True, log=lambda _: None).run(_pipeline(tmp_path, calls, factor=3))
+    assert calls == ["score", "build"]
+    assert out == 18
+
+
+def test_from_stage_forces_late_stages_only(tmp_path):
+    store = CheckpointStore(tmp_path / "checkpoints", "2026-02-20")
+    StageRunner(store, log=lambda _: None).run(_pipeline(tmp_path, []))
+
+    calls = []
+    StageRunner(store, from_stage="build", log=lambda _: None).run(_pipeline(tmp_path, calls))
+    assert calls == ["build"]
+
+    with pytest.raises(ValueError):
+        StageRunner(store, from_stage="publish").run(_pipeline(tmp_path, []))
+
+
+def test_streamed_stage_checkpoints_only_when_exhausted(tmp_path):
+    store = CheckpointStore(tmp_path / "checkpoints", "2026-02-20")
+    artifact = tmp_path / "collect.jsonl"
+    artifact.write_text("", encoding="utf-8")
+    stages = [Stage("collect", lambda _: iter([1, 2, 3]), save=lambda _: artifact)]
+
+    stream = StageRunner(store, log=lambda _: None).run(stages)
+    next(stream)
+    assert store.load("collect") is None
+    list(stream)
+    assert store.load("collect")["artifact"] == str(artifact)
@@ -1,23 +1,91 @@
 import importlib.util
+import itertools
 from pathlib import Path
 
 
-def _load_map_topic():
-    mod_path = Path("pipeline/topic_mapper.py")
-    spec = importlib.util.spec_from_file_location("topic_mapper", mod_path)
+def _load_module():
+    spec = importlib.util.spec_from_file_location("topic_mapper", Path("pipeline/topic_mapper.py"))
     assert spec and spec.loader
     module = importlib.util.module_from_spec(spec)
     spec.loader.exec_module(module)
-    return module.map_topic
+    return module
+
+
+def _legacy_map_topic(item):
+    """The if-chain topic_mapper used before topics.yaml was compiled (word-start hints aside)."""
+    categories = [x.lower() for x in item.get("categories", [])]
+    title = item.get("title", "").lower()
+    if "cs.ar" in categories or any(k in title.split() for k in ("asic", "fpga", "chip", "chiplet", "accelerator", "hbm")):
+        return "芯片与硬件架构"
+    if any(x in categories for x in ["cs.cv", "cs.cl", "eess.iv", "eess.as"]):
+        return "多模态与感知"
+    if "cs.cr" in categories:
+        return "评测、安全与对齐"
+    if "cs.ma" in categories:
+        return "Agent与推理范式"
+    return "模型与学习算法"
 
 
 def test_maps_cs_ar_to_hardware():
-    map_topic = _load_map_topic()
+    mod = _load_module()
     item = {"categories": ["cs.AR"], "title": "Chiplet-aware NPU"}
-    assert map_topic(item) == "芯片与硬件架构"
+    assert mod.map_topic(item) == "芯片与硬件架构"
 
 
 def test_prefers_hardware_when_title_mentions_asic():
-    map_topic = _load_map_topic()
+    mod = _load_module()
     item = {"categories": ["cs.AI"], "title": "ASIC co-design for LLM inference"}
-    assert map_topic(item) == "芯片与硬件架构"
+    assert mod.map_topic(item) == "芯片与硬件架构"
+
+
+def test_classifier_uses_config_and_default_topic():
+    mod = _load_module()
+    clf = mod.TopicClassifier.from_file(Path("config/topics.yaml"))
+    items = [
+        {"categories": ["cs.CR", "cs.AI"], "title": "Jailbreak evaluation"},
+        {"categories": ["cs.MA"], "title": "Multi-agent planning"},
+        {"categories": ["cs.AI"], "title": "Basic reasoning"},  # "asic" only matches at a word start
+        {"categories": ["q-bio.NC"], "title": "Unrelated"},
+    ]
+    assert clf.classify_many(items) == ["评测、安全与对齐", "Agent与推理范式", "模型与学习算法", "模型与学习算法"]
+
+
+def test_default_config_keeps_the_legacy_assignments():
+    mod = _load_module()
+    clf = mod.TopicClassifier.from_file(Path("config/topics.yaml"))
+    cats = ["cs.AI", "cs.LG", "cs.NE", "cs.AR", "cs.CV", "cs.CL", "eess.IV", "cs.MA", "cs.CR", "stat.ML"]
+    combos = [list(c) for n in (1, 2, 3) for c in itertools.permutations(cats, n)]
+    for categories in combos:
+        for title in ("Scaling laws", "An FPGA accelerator"):
+            item = {"categories": categories, "title": title}
+            assert clf.classify(item) == _legacy_map_topic(item), item
+    # Cross-lists the weighted strategy would reassign stay where they were.
+    assert clf.classify({"categories": ["cs.LG", "cs.CR"], "title": ""}) == "评测、安全与对齐"
+    assert clf.classify({"categories": ["cs.AI", "cs.MA"], "title": ""}) == "Agent与推理范式"
+
+
+def test_weighted_strategy_scores_primary_category_over_cross_list():
+    mod = _load_module()
+    topics = [
+        {"name": "ml", "primary_categories": ["cs.LG"]},
+        {"name": "security", "primary_categories": ["cs.CR"], "priority": 5},
+    ]
+    first = mod.TopicClassifier(topics)
+    weighted = mod.TopicClassifier(topics, strategy="weighted")
+    item = {"categories": ["cs.LG", "cs.CR"], "title": ""}
+    assert first.classify(item) == "security"
+    assert weighted.classify(item) == "ml"
+
+
+def test_ties_break_on_priority_then_order():
+    mod = _load_module()
+    topics = [
+        {"name": "a", "primary_categories": ["cs.X"]},
+        {"name": "b", "primary_categories": ["cs.X"], "priority": 5},
+        {"name": "c", "primary_categories": ["cs.X"], "priority": 5},
+        {"name": "d", "keyword_hints": ["gpu", "gpus"], "keyword_weight": 2},
+    ]
+    clf = mod.TopicClassifier(topics, default_topic="none", strategy="weighted")
+    assert clf.classify({"categories": ["cs.X"], "title": ""}) == "b"
+    assert clf.classify({"categories": ["cs.X"], "title": "Many GPUs"}) == "d"
+    assert clf.classify({"categories": [], "title": ""}) == "none"
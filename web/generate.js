@@ -18,10 +18,45 @@ function parseMode(argv) {
   return mode === "news" ? "news" : "paper";
 }
 
+function parseDirOption(argv, flag) {
+  const idx = argv.indexOf(flag);
+  if (idx === -1 || !argv[idx + 1]) {
+    return null;
+  }
+  return path.resolve(argv[idx + 1]);
+}
+
+function parseIntOption(argv, flag, fallback) {
+  const idx = argv.indexOf(flag);
+  const raw = idx === -1 ? fallback : argv[idx + 1];
+  const value = Number.parseInt(raw, 10);
+  return Number.isNaN(value) ? null : value;
+}
+
+// `--pages a.html,b.html` limits the build to those pages (see pipeline/site_planner.py).
+function parsePages(argv) {
+  const idx = argv.indexOf("--pages");
+  if (idx === -1) {
+    return null;
+  }
+  return new Set(String(argv[idx + 1] || "").split(",").filter(Boolean));
+}
+
 function ensureDir(dirPath) {
   fs.mkdirSync(dirPath, { recursive: true });
 }
 
+// Write via temp file + rename, and leave unchanged pages untouched so their
+// mtime (and the publish manifest's cached hash) stays valid.
+function writeFileAtomic(filePath, content) {
+  if (fs.existsSync(filePath) && fs.readFileSync(filePath, "utf-8") === content) {
+    return;
+  }
+  const tmpPath = path.join(path.dirname(filePath), `.${path.basename(filePath)}.${process.pid}.tmp`);
+  fs.writeFileSync(tmpPath, content);
+  fs.renameSync(tmpPath, filePath);
+}
+
 function escapeHtml(input) {
   return String(input)
     .replace(/&/g, "&amp;")
@@ -177,8 +212,19 @@ function loadReports() {
   });
 }
 
+// The sidebar lists the `window` reports on either side of the current one
+// (the newest ones on the index and archive), so adding a day only changes
+// the sidebars of its neighbours. A negative window lists every report.
+function sidebarReports(reports, currentDate, window) {
+  if (window === null || window < 0) {
+    return reports;
+  }
+  const idx = Math.max(0, reports.findIndex((report) => report.date === currentDate));
+  return reports.slice(Math.max(0, idx - window), idx + window + 1);
+}
+
 function renderRecentReports(reports, currentDate) {
-  return reports
+  return sidebarReports(reports, currentDate, CONFIG.sidebarWindow)
     .map((report) => {
       const active = report.date === currentDate;
       if (active) {
@@ -239,7 +285,7 @@ function buildPage({ report, reports, brandInfo, isIndex = false }) {
   });
 
   const outputName = isIndex ? "index.html" : `${report.date}.html`;
-  fs.writeFileSync(path.join(CONFIG.siteDir, outputName), html);
+  writeFileAtomic(path.join(CONFIG.siteDir, outputName), html);
 }
 
 function buildArchive(reports, brandInfo) {
@@ -290,7 +336,7 @@ function buildArchive(reports, brandInfo) {
     toc_content: '<p class="text-xs text-gray-400">Archive</p>',
   });
 
-  fs.writeFileSync(path.join(CONFIG.siteDir, "archive.html"), html);
+  writeFileAtomic(path.join(CONFIG.siteDir, "archive.html"), html);
 }
 
 function buildEmptyIndex(brandInfo) {
@@ -316,26 +362,42 @@ function buildEmptyIndex(brandInfo) {
     toc_content: '<p class="text-xs text-gray-400">N/A</p>',
   });
 
-  fs.writeFileSync(path.join(CONFIG.siteDir, "index.html"), html);
+  writeFileAtomic(path.join(CONFIG.siteDir, "index.html"), html);
 }
 
 function main() {
-  const mode = parseMode(process.argv.slice(2));
+  const argv = process.argv.slice(2);
+  const mode = parseMode(argv);
+  // Profiles render their own reports into their own site directory.
+  CONFIG.outputDir = parseDirOption(argv, "--output-dir") || CONFIG.outputDir;
+  CONFIG.siteDir = parseDirOption(argv, "--site-dir") || CONFIG.siteDir;
+  CONFIG.sidebarWindow = parseIntOption(argv, "--sidebar-window", process.env.DAILY_PAPER_SIDEBAR_WINDOW || "5");
+  const pages = parsePages(argv);
+  const wanted = (name) => pages === null || pages.has(name);
   const brandInfo = brandForMode(mode);
 
   ensureDir(CONFIG.siteDir);
   const reports = loadReports();
 
   if (reports.length === 0) {
-    buildEmptyIndex(brandInfo);
+    if (wanted("index.html")) {
+      buildEmptyIndex(brandInfo);
+    }
     console.log(`Generated site at ${CONFIG.siteDir}`);
     return;
   }
 
-  buildPage({ report: reports[0], reports, brandInfo, isIndex: true });
-  reports.forEach((report) => buildPage({ report, reports, brandInfo, isIndex: false }));
-  buildArchive(reports, brandInfo);
-  console.log(`Generated site at ${CONFIG.siteDir}`);
+  if (wanted("index.html")) {
+    buildPage({ report: reports[0], reports, brandInfo, isIndex: true });
+  }
+  reports
+    .filter((report) => wanted(report.filename))
+    .forEach((report) => buildPage({ report, reports, brandInfo, isIndex: false }));
+  if (wanted("archive.html")) {
+    buildArchive(reports, brandInfo);
+  }
+  const built = pages === null ? "all pages" : `${pages.size} page(s)`;
+  console.log(`Generated site at ${CONFIG.siteDir} (${built})`);
 }
 
 main();